@@ -0,0 +1,225 @@
+"""Admission control: per-client rate limits and a per-process concurrency cap.
+
+Both checks run before routing, so a rejected request costs a bucket update rather than
+a pbkdf2 hash or a page query, and is answered at once with Retry-After: 429 when the
+caller's token bucket for the route class is empty, 503 when the process is already
+running its maximum number of requests and the wait queue is full or the wait times out.
+Exports have a smaller cap of their own, so long downloads cannot starve page requests.
+"""
+import asyncio
+import importlib
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from .config import (
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    MAX_CONCURRENT_EXPORTS,
+    MAX_CONCURRENT_REQUESTS,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_MAX_CLIENTS,
+    RATE_LIMITS,
+)
+from .security import InvalidTokenError, decode_access_token
+
+# Never limited: probes and metric scrapes must keep working while the app sheds load.
+EXEMPT_PATHS = frozenset({"/api/health", "/api/metrics"})
+# Long-lived streams are rate limited on connect but do not hold a concurrency slot.
+STREAMING_PATHS = frozenset({"/api/orders/events"})
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class Rate:
+    requests: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.requests / self.seconds
+
+
+def parse_rates(spec: str) -> dict[str, Rate]:
+    """Parse "auth=20/60,read=600/60" into a Rate per route class."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        route_class, _, limit = item.partition("=")
+        requests, _, seconds = limit.partition("/")
+        try:
+            rate = Rate(int(requests), float(seconds))
+        except ValueError:
+            rate = None
+        if rate is None or rate.requests < 1 or rate.seconds <= 0:
+            raise RuntimeError(f"AUSSIEEAT_RATE_LIMITS entries look like 'read=600/60', got {item!r}")
+        rates[route_class.strip()] = rate
+    return rates
+
+
+def route_class(method: str, path: str) -> str | None:
+    """The limit class a request counts against, or None for requests that are never limited."""
+    if path in EXEMPT_PATHS or not path.startswith("/api/"):
+        return None
+    if path.startswith("/api/auth/"):
+        return "auth"
+    if path.endswith("/export"):
+        return "export"
+    return "read" if method in READ_METHODS else "write"
+
+
+def client_key(scope) -> str:
+    """Signed-in callers are limited per user (so a shared NAT is not one client), others per IP."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                try:
+                    return f"user:{decode_access_token(token.strip()).user_id}"
+                except InvalidTokenError:
+                    pass
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitBackend(ABC):
+    """Token buckets keyed by route class and client."""
+
+    @abstractmethod
+    def take(self, key: str, rate: Rate) -> float:
+        """Take a token from key's bucket: 0 when allowed, else seconds until one is available."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_CLIENTS, timer: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.timer = timer
+        # key -> (tokens left, time of last refill)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: Rate) -> float:
+        now = self.timer()
+        with self._lock:
+            tokens, refilled_at = self._buckets.get(key, (rate.requests, now))
+            tokens = min(rate.requests, tokens + (now - refilled_at) * rate.per_second)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate.per_second
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            # Evicting the least recently seen client only hands it a fresh bucket.
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+def load_rate_limit_backend(path: str) -> RateLimitBackend:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+class ConcurrencyLimiter:
+    """Caps in-flight requests, with a bounded queue whose waits are time-limited."""
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.waiting = 0
+        self._slots = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return True
+        if self.waiting >= self.queue_size:
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        self._slots.release()
+
+
+async def reject(send, status_code: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying the rate limits, then the concurrency cap, to every API request."""
+
+    def __init__(
+        self,
+        app,
+        backend: RateLimitBackend | None = None,
+        rates: dict[str, Rate] | None = None,
+        limiter: ConcurrencyLimiter | None = None,
+        export_limiter: ConcurrencyLimiter | None = None,
+    ):
+        self.app = app
+        if backend is None and RATE_LIMIT_ENABLED:
+            backend = load_rate_limit_backend(RATE_LIMIT_BACKEND)
+        self.backend = backend
+        self.rates = parse_rates(RATE_LIMITS) if rates is None else rates
+        if limiter is None and MAX_CONCURRENT_REQUESTS > 0:
+            limiter = ConcurrencyLimiter(MAX_CONCURRENT_REQUESTS, ADMISSION_QUEUE_SIZE, ADMISSION_QUEUE_TIMEOUT_SECONDS)
+        self.limiter = limiter
+        if export_limiter is None and MAX_CONCURRENT_EXPORTS > 0:
+            export_limiter = ConcurrencyLimiter(MAX_CONCURRENT_EXPORTS, 0, ADMISSION_QUEUE_TIMEOUT_SECONDS)
+        self.export_limiter = export_limiter
+
+    def limiter_for(self, limit_class: str, path: str) -> ConcurrencyLimiter | None:
+        if path in STREAMING_PATHS:
+            return None
+        return self.export_limiter if limit_class == "export" else self.limiter
+
+    async def __call__(self, scope, receive, send):
+        limit_class = route_class(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if limit_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        rate = self.rates.get(limit_class)
+        if rate is not None and self.backend is not None:
+            wait = self.backend.take(f"{limit_class}:{client_key(scope)}", rate)
+            if wait > 0:
+                await reject(send, 429, "Too many requests", wait)
+                return
+
+        limiter = self.limiter_for(limit_class, scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        if not await limiter.acquire():
+            await reject(send, 503, "Server is busy, retry shortly", limiter.timeout)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -0,0 +1,163 @@
+"""Per-maker sales rollups.
+
+Every order counts once in an hour, a day, a week (starting Monday) and the all-time
+"total" bucket for its status, all in UTC. Order writes fold their changes into those rows
+with upserts in the same transaction, so the analytics endpoint reads a bounded number of
+rows however long a maker's order history is.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Literal
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Connection
+
+from .models import MakerOrder, MakerOrderArchive, MakerSalesRollup
+from .stats import upsert_insert
+
+AnalyticsPeriod = Literal["hour", "day", "week"]
+PERIOD_STEPS: dict[str, timedelta] = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+TOTAL_PERIOD = "total"
+TOTAL_BUCKET = datetime(1970, 1, 1)
+ROLLUP_PERIODS = (*PERIOD_STEPS, TOTAL_PERIOD)
+
+DEFAULT_BUCKETS: dict[str, int] = {"hour": 48, "day": 30, "week": 26}
+MAX_BUCKETS = 366
+
+# Rows per multi-row upsert; six parameters each keeps a statement well under SQLite's limit.
+UPSERT_CHUNK_SIZE = 1000
+
+RollupKey = tuple[int, str, datetime, str]
+
+
+def bucket_start(value: datetime, period: str) -> datetime:
+    """Start of the UTC bucket holding value. Naive values are stored UTC and taken as such."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    if period == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return TOTAL_BUCKET
+
+
+def window_buckets(end: datetime, period: str, count: int) -> list[datetime]:
+    """Starts of the count buckets ending with the one holding end, oldest first.
+
+    Raises ValueError when the window does not fit in the datetime range.
+    """
+    step = PERIOD_STEPS[period]
+    try:
+        first = bucket_start(end, period) - step * (count - 1)
+    except OverflowError as exc:
+        raise ValueError(f"end leaves no room for {count} {period} buckets") from exc
+    return [first + step * index for index in range(count)]
+
+
+def to_cents(price: float) -> int:
+    return round(price * 100)
+
+
+class SalesDeltas:
+    """Changes to apply to the rollups, accumulated per (maker, period, bucket, status)."""
+
+    def __init__(self):
+        self.changes: dict[RollupKey, list[int]] = defaultdict(lambda: [0, 0])
+
+    def add(self, maker_id: int, status: str, price: float, order_time: datetime, sign: int = 1) -> None:
+        cents = to_cents(price)
+        for period in ROLLUP_PERIODS:
+            change = self.changes[(maker_id, period, bucket_start(order_time, period), status)]
+            change[0] += sign
+            change[1] += sign * cents
+
+    def add_order(self, order: MakerOrder) -> None:
+        self.add(order.maker_id, order.status, order.price, order.order_time)
+
+    def move_order(self, order: MakerOrder, from_status: str) -> None:
+        """Shift an order that changed status from from_status to its current status."""
+        if from_status != order.status:
+            self.add(order.maker_id, from_status, order.price, order.order_time, sign=-1)
+            self.add_order(order)
+
+    def rows(self) -> list[dict]:
+        return [
+            {
+                "maker_id": maker_id,
+                "period": period,
+                "bucket_start": bucket,
+                "status": status,
+                "order_count": count,
+                "revenue_cents": cents,
+            }
+            for (maker_id, period, bucket, status), (count, cents) in self.changes.items()
+            if count or cents
+        ]
+
+
+def record_sales(dialect_name: str, deltas: SalesDeltas) -> Iterator:
+    """Multi-row upserts that add the deltas to the rollups; increments happen in the statement."""
+    dialect_insert = upsert_insert(dialect_name, "Sales rollups")
+    table = MakerSalesRollup.__table__
+    rows = deltas.rows()
+    for offset in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = dialect_insert(MakerSalesRollup).values(rows[offset : offset + UPSERT_CHUNK_SIZE])
+        yield stmt.on_conflict_do_update(
+            index_elements=[table.c.maker_id, table.c.period, table.c.bucket_start, table.c.status],
+            set_={name: table.c[name] + stmt.excluded[name] for name in ("order_count", "revenue_cents")},
+        )
+
+
+def rebuild_sales_rollups(connection: Connection, batch_size: int = 5000) -> int:
+    """Recompute every rollup from maker_orders and the order archive, folding in one keyset
+    batch of orders at a time."""
+    connection.execute(delete(MakerSalesRollup))
+    orders = 0
+    for model in (MakerOrder, MakerOrderArchive):
+        last_id = 0
+        while True:
+            batch = connection.execute(
+                select(model.id, model.maker_id, model.status, model.price, model.order_time)
+                .where(model.id > last_id)
+                .order_by(model.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            deltas = SalesDeltas()
+            for row in batch:
+                deltas.add(row.maker_id, row.status, row.price, row.order_time)
+            for stmt in record_sales(connection.dialect.name, deltas):
+                connection.execute(stmt)
+            orders += len(batch)
+            last_id = batch[-1].id
+    return orders
+
+
+def sales_figures(order_count: int, revenue_cents: int) -> dict:
+    return {
+        "orders": order_count,
+        "revenue": revenue_cents / 100,
+        "average_price": round(revenue_cents / order_count / 100, 2) if order_count else None,
+    }
+
+
+def summarize(rollups: Iterable[MakerSalesRollup]) -> dict:
+    """Totals and per-status figures for one bucket's rollup rows."""
+    by_status = {row.status: row for row in rollups if row.order_count}
+    return {
+        **sales_figures(
+            sum(row.order_count for row in by_status.values()),
+            sum(row.revenue_cents for row in by_status.values()),
+        ),
+        "by_status": {
+            status: sales_figures(row.order_count, row.revenue_cents) for status, row in sorted(by_status.items())
+        },
+    }
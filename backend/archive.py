@@ -0,0 +1,105 @@
+"""Hot/cold order archival.
+
+Completed orders whose order time is older than ARCHIVE_AFTER_DAYS move, together with
+their reviews, from maker_orders/maker_reviews into maker_orders_archive/maker_reviews_archive.
+Each batch is one short transaction: copy the orders and reviews with INSERT ... SELECT,
+then delete them from the hot tables, so a failure part-way leaves every order in exactly
+one place and writers only wait on one batch at a time. Rows keep their ids, so cursors and
+merged listings work across both tables.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import DateTime, delete, func, insert, literal, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import response_cache
+from .config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE
+from .database import engine
+from .models import MakerOrder, MakerOrderArchive, MakerReview, MakerReviewArchive
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_STATUS = "completed"
+
+
+def archive_cutoff(days: float = ARCHIVE_AFTER_DAYS) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def archivable(cutoff: datetime) -> tuple:
+    """Conditions for a hot order to be archived.
+
+    SQLite hands out max(rowid) + 1 for new rows, so the newest order, and the order behind
+    the newest review, always stay hot; otherwise a new row could reuse an archived id.
+    """
+    newest_review = select(func.max(MakerReview.id)).scalar_subquery()
+    return (
+        MakerOrder.status == ARCHIVED_STATUS,
+        MakerOrder.order_time < cutoff,
+        MakerOrder.id < select(func.max(MakerOrder.id)).scalar_subquery(),
+        MakerOrder.id.not_in(select(MakerReview.order_id).where(MakerReview.id == newest_review)),
+    )
+
+
+def copy_into(archive, hot, archived_at: datetime, condition):
+    """INSERT INTO archive SELECT hot.*, archived_at FROM hot WHERE condition."""
+    columns = [column.name for column in hot.__table__.columns]
+    rows = select(*hot.__table__.columns, literal(archived_at, DateTime(timezone=True))).where(condition)
+    return insert(archive).from_select([*columns, "archived_at"], rows)
+
+
+def archive_completed_orders(
+    bind: Engine = engine, cutoff: datetime | None = None, batch_size: int = ARCHIVE_BATCH_SIZE
+) -> tuple[int, int]:
+    """Move archivable orders and their reviews in id order; returns (orders, reviews) moved."""
+    conditions = archivable(cutoff or archive_cutoff())
+    orders = reviews = 0
+    last_id = 0
+    while True:
+        archived_at = datetime.now(timezone.utc)
+        with bind.begin() as connection:
+            # The copy both picks and locks the batch (rows other writers hold are skipped on
+            # PostgreSQL), so the deletes below remove exactly what was copied.
+            batch = (
+                select(MakerOrder.id)
+                .where(MakerOrder.id > last_id, *conditions)
+                .order_by(MakerOrder.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            moved = connection.execute(
+                copy_into(MakerOrderArchive, MakerOrder, archived_at, MakerOrder.id.in_(batch)).returning(
+                    MakerOrderArchive.id, MakerOrderArchive.maker_id
+                )
+            ).all()
+            if not moved:
+                return orders, reviews
+            order_ids = [row.id for row in moved]
+            reviewed = connection.execute(
+                copy_into(
+                    MakerReviewArchive, MakerReview, archived_at, MakerReview.order_id.in_(order_ids)
+                ).returning(MakerReviewArchive.maker_id)
+            ).all()
+            connection.execute(delete(MakerReview).where(MakerReview.order_id.in_(order_ids)))
+            connection.execute(delete(MakerOrder).where(MakerOrder.id.in_(order_ids)))
+        # Review listings read the hot table by default, so their cached pages are now stale.
+        response_cache.invalidate(*sorted({f"reviews:{row.maker_id}" for row in reviewed}))
+        orders += len(moved)
+        reviews += len(reviewed)
+        last_id = max(order_ids)
+
+
+async def run_archiver(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            orders, reviews = await run_in_threadpool(archive_completed_orders)
+        except SQLAlchemyError:
+            logger.exception("Order archiving failed; retrying in %.1f s", interval)
+            continue
+        if orders:
+            logger.info("Archived %d completed orders and %d reviews", orders, reviews)
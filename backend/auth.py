@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import TTLCache
+from .config import IDENTITY_CACHE_SIZE, IDENTITY_CACHE_TTL_SECONDS
+from .database import get_db, open_read_session, open_session, read_route, read_session_factories
+from .models import User
+from .replicas import attribute_writes, wrote_recently
+from .security import InvalidTokenError, TokenClaims, decode_access_token, decode_stream_ticket
+
+
+@dataclass(frozen=True)
+class Identity:
+    id: int
+    email: str
+    role: str
+
+
+identity_cache = TTLCache(maxsize=IDENTITY_CACHE_SIZE, ttl=IDENTITY_CACHE_TTL_SECONDS)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def load_identity(db: AsyncSession, user_id: int, fallback=None) -> Identity | None:
+    """Resolve a user's id, email and role, served from the identity cache when possible.
+
+    fallback opens a session to retry on when db does not know the user (a replica that has
+    not caught up with a new account).
+    """
+    identity = identity_cache.get(user_id)
+    if identity is None:
+        user = await db.get(User, user_id)
+        if user is None and fallback is not None:
+            async with fallback() as primary:
+                user = await primary.get(User, user_id)
+        if user is None:
+            return None
+        identity = Identity(id=user.id, email=user.email, role=user.role)
+        identity_cache.set(user_id, identity)
+    return identity
+
+
+async def find_user(db: AsyncSession, user_id: int, role: str) -> Identity | None:
+    identity = await load_identity(db, user_id)
+    return identity if identity and identity.role == role else None
+
+
+def unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def resolve_token(
+    db: AsyncSession,
+    token: str | None,
+    fallback=None,
+    decode: Callable[[str], TokenClaims] = decode_access_token,
+) -> Identity:
+    if not token:
+        raise unauthorized("Not authenticated")
+    try:
+        claims = decode(token)
+    except InvalidTokenError as exc:
+        raise unauthorized(str(exc)) from exc
+
+    identity = await load_identity(db, claims.user_id, fallback)
+    if identity is None or identity.role != claims.role:
+        raise unauthorized("Invalid token")
+    attribute_writes(db, identity.id)
+    return identity
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Identity:
+    return await resolve_token(db, credentials.credentials if credentials else None)
+
+
+async def get_stream_user(
+    ticket: str | None = Query(None),
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Identity:
+    """Like get_current_user, but also accepts a stream ticket as ?ticket=, since EventSource
+    cannot set headers. Tickets come from POST /api/orders/events/ticket, so the long-lived
+    access token never appears in a URL.
+    """
+    if credentials is None and ticket:
+        return await resolve_token(db, ticket, decode=decode_stream_ticket)
+    return await resolve_token(db, credentials.credentials if credentials else None)
+
+
+async def get_read_db(credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme)):
+    """Session for read-only handlers: a read replica, unless the caller wrote recently.
+
+    The token is only checked for its signature here; handlers authenticate through
+    get_read_user, which reuses this session. Without replicas it is a primary session.
+    """
+    if not read_session_factories:
+        async with open_session() as session:
+            yield session
+        return
+    if credentials is not None and wrote_recently(credentials.credentials):
+        read_route.set("primary")
+        opener = open_session
+    else:
+        read_route.set("replica")
+        opener = open_read_session
+    async with opener() as session:
+        yield session
+
+
+async def get_read_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_read_db),
+) -> Identity:
+    """get_current_user for read-only handlers: resolved on their get_read_db session, so the
+    request does not also hold a primary session. Only a user the replica does not have yet
+    is looked up on the primary.
+    """
+    fallback = open_session if read_route.get() == "replica" else None
+    return await resolve_token(db, credentials.credentials if credentials else None, fallback)
+
+
+def require_role(role: str, authenticate=get_current_user):
+    async def dependency(identity: Identity = Depends(authenticate)) -> Identity:
+        if identity.role != role:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"{role.capitalize()} account required",
+            )
+        return identity
+
+    return dependency
+
+
+require_maker = require_role("maker")
+require_eater = require_role("eater")
+# For handlers that take their session from get_read_db.
+require_maker_reader = require_role("maker", get_read_user)
+require_eater_reader = require_role("eater", get_read_user)
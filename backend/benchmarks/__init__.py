@@ -0,0 +1 @@
+"""Seeded load tests for the API; see `python -m backend.benchmarks --help`."""
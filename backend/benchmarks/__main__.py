@@ -0,0 +1,141 @@
+"""Benchmark CLI.
+
+    python -m backend.benchmarks run --makers 50 --output before.json
+    python -m backend.benchmarks compare before.json after.json
+
+Settings are read from the environment when the backend is imported, so the
+database URL and signing key are set here before any backend module loads.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+MODES = ("asgi", "uvicorn")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="seed a database and benchmark every endpoint")
+    run.add_argument("--database", default="aussieeat-benchmark.db", help="SQLite file to (re)create")
+    run.add_argument("--makers", type=int, default=20)
+    run.add_argument("--meals-per-maker", type=int, default=10)
+    run.add_argument("--eaters", type=int, default=50)
+    run.add_argument("--orders-per-eater", type=int, default=10)
+    run.add_argument("--review-ratio", type=float, default=0.5)
+    run.add_argument("--image-kb", type=int, default=48)
+    run.add_argument("--modes", default=",".join(MODES), help="comma-separated subset of asgi,uvicorn")
+    run.add_argument("--scenarios", help="comma-separated scenario names (default: all)")
+    run.add_argument("--requests", type=int, default=200, help="measured requests per endpoint")
+    run.add_argument("--concurrency", type=int, default=10)
+    run.add_argument("--warmup", type=int, default=10)
+    run.add_argument("--workers", type=int, default=2, help="uvicorn worker processes")
+    run.add_argument("--port", type=int, default=8765)
+    run.add_argument("--output", help="write JSON results here instead of stdout")
+
+    compare = commands.add_parser("compare", help="diff two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("candidate")
+    compare.add_argument("--metric", default="p95_ms")
+    compare.add_argument("--threshold", type=float, default=0.2, help="relative slowdown that fails the run")
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    if any(mode not in MODES for mode in modes):
+        print(f"--modes must be a subset of {','.join(MODES)}", file=sys.stderr)
+        return 2
+
+    database = Path(args.database).resolve()
+    os.environ["AUSSIEEAT_DATABASE_URL"] = f"sqlite:///{database}"
+    # uvicorn workers and the in-process token minting must share one key.
+    os.environ.setdefault("AUSSIEEAT_SECRET_KEY", "benchmark-secret")
+    # A few clients send every request, so per-client rate limits would only measure 429s.
+    os.environ.setdefault("AUSSIEEAT_RATE_LIMIT_ENABLED", "0")
+
+    from ..config import DB_MODE
+    from .runner import run_mode
+    from .scenarios import load_context, select_scenarios
+    from .seed import SeedConfig, seed_database
+
+    scenarios = select_scenarios(args.scenarios.split(",") if args.scenarios else None)
+    config = SeedConfig(
+        makers=args.makers,
+        meals_per_maker=args.meals_per_maker,
+        eaters=args.eaters,
+        orders_per_eater=args.orders_per_eater,
+        review_ratio=args.review_ratio,
+        image_kb=args.image_kb,
+    )
+
+    results = {}
+    seed_summary = None
+    for mode in modes:
+        # Reseed per mode so write scenarios in one mode do not skew the other.
+        print(f"seeding {database} for {mode}", file=sys.stderr)
+        seed = seed_database(config)
+        seed_summary = seed.summary()
+        ctx = load_context(seed, config.image_kb)
+        print(f"running {mode}", file=sys.stderr)
+        results[mode] = asyncio.run(
+            run_mode(mode, scenarios, ctx, args.requests, args.concurrency, args.warmup, args.port, args.workers)
+        )
+
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_mode": DB_MODE,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "workers": args.workers,
+            "seed": asdict(config),
+            "rows": seed_summary,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())["results"]
+    candidate = json.loads(Path(args.candidate).read_text())["results"]
+    regressions = 0
+    print(f"{'mode':8} {'scenario':24} {'baseline':>10} {'candidate':>10} {'change':>8}")
+    for mode, scenarios in candidate.items():
+        for name, stats in scenarios.items():
+            before = baseline.get(mode, {}).get(name, {}).get(args.metric)
+            after = stats.get(args.metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before else 0.0
+            flag = ""
+            if change > args.threshold:
+                regressions += 1
+                flag = "  REGRESSION"
+            print(f"{mode:8} {name:24} {before:>10.2f} {after:>10.2f} {change:>+8.1%}{flag}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
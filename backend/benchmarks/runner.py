@@ -0,0 +1,213 @@
+"""Drive scenarios against the app and summarise latency, throughput and memory."""
+import asyncio
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+
+from .scenarios import BenchContext, Scenario
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def read_rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree(pid: int) -> list[int]:
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as children:
+            for child in children.read().split():
+                pids.extend(process_tree(int(child)))
+    except OSError:
+        pass
+    return pids
+
+
+class RssSampler:
+    """Polls the resident set size of a process tree (Linux /proc) in a background thread."""
+
+    def __init__(self, pid: int, interval: float = 0.01):
+        self.pid = pid
+        self.interval = interval
+        self.available = os.path.exists(f"/proc/{pid}/status")
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def sample(self) -> None:
+        total = sum(read_rss_kb(pid) for pid in process_tree(self.pid))
+        self.peak_kb = max(self.peak_kb, total)
+
+    def reset(self) -> None:
+        self.peak_kb = 0
+        self.sample()
+
+    def start(self) -> None:
+        if self.available:
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: BenchContext,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    sampler: RssSampler,
+) -> dict:
+    total = warmup + requests
+    if scenario.capacity is not None:
+        total = min(total, scenario.capacity(ctx))
+    warmup = min(warmup, total // 2)
+
+    for index in range(warmup):
+        spec = scenario.build(ctx, index)
+        await client.request(spec.method, spec.url, json=spec.json, headers=spec.headers)
+
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+    next_index = warmup
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            spec = scenario.build(ctx, index)
+            started = time.perf_counter()
+            response = await client.request(spec.method, spec.url, json=spec.json, headers=spec.headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] += 1
+
+    sampler.reset()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    sampler.sample()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "peak_rss_kb": sampler.peak_kb if sampler.available else None,
+    }
+
+
+async def run_all(client, scenarios, ctx, sampler, requests, concurrency, warmup) -> dict:
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = await run_scenario(
+            client, scenario, ctx, requests, concurrency, warmup, sampler
+        )
+        print(f"  {scenario.name}: p95 {results[scenario.name]['p95_ms']} ms", file=sys.stderr)
+    return results
+
+
+@asynccontextmanager
+async def asgi_client():
+    """In-process client; runs the app lifespan since ASGITransport does not."""
+    from ..main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60) as client:
+            yield client, os.getpid()
+
+
+@asynccontextmanager
+async def uvicorn_client(port: int, workers: int, concurrency: int):
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "backend.main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    server = subprocess.Popen(command, cwd=REPO_ROOT, env=os.environ.copy())
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            await wait_until_healthy(client, server)
+            yield client, server.pid
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            if (await client.get("/api/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not become healthy in time")
+
+
+async def run_mode(mode: str, scenarios, ctx, requests, concurrency, warmup, port, workers) -> dict:
+    client_factory = asgi_client() if mode == "asgi" else uvicorn_client(port, workers, concurrency)
+    async with client_factory as (client, pid):
+        sampler = RssSampler(pid)
+        sampler.start()
+        try:
+            return await run_all(client, scenarios, ctx, sampler, requests, concurrency, warmup)
+        finally:
+            sampler.stop()
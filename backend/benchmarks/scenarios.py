@@ -0,0 +1,261 @@
+"""Request generators for every API endpoint, built from a seeded database."""
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable
+
+from sqlalchemy import select
+
+from ..database import SessionLocal
+from ..models import MakerOrder, MakerReview
+from ..security import create_access_token
+from .seed import CITY_CENTRE, PASSWORD, SeedResult, eater_email, fake_image, maker_email
+
+
+@dataclass
+class RequestSpec:
+    method: str
+    url: str
+    json: dict | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BenchContext:
+    seed: SeedResult
+    run_id: str
+    rng: random.Random
+    maker_orders: dict[int, list[int]]
+    maker_reviews: dict[int, list[int]]
+    unreviewed_orders: list[tuple[int, int]]
+    meal_image: str
+
+    def auth(self, user_id: int, role: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {create_access_token(user_id, role)}"}
+
+    def maker(self, i: int) -> int:
+        return self.seed.maker_ids[i % len(self.seed.maker_ids)]
+
+    def eater(self, i: int) -> int:
+        return self.seed.eater_ids[i % len(self.seed.eater_ids)]
+
+    def maker_with(self, pool: dict[int, list[int]], i: int) -> tuple[int, list[int]]:
+        makers = sorted(maker_id for maker_id, ids in pool.items() if ids)
+        maker_id = makers[i % len(makers)]
+        return maker_id, pool[maker_id]
+
+
+def load_context(seed: SeedResult, image_kb: int) -> BenchContext:
+    maker_orders: dict[int, list[int]] = {}
+    maker_reviews: dict[int, list[int]] = {}
+    with SessionLocal() as db:
+        for order_id, maker_id in db.execute(select(MakerOrder.id, MakerOrder.maker_id)):
+            maker_orders.setdefault(maker_id, []).append(order_id)
+        for review_id, maker_id in db.execute(select(MakerReview.id, MakerReview.maker_id)):
+            maker_reviews.setdefault(maker_id, []).append(review_id)
+        unreviewed = db.execute(
+            select(MakerOrder.id, MakerOrder.eater_id).where(MakerOrder.id.in_(seed.unreviewed_order_ids))
+        ).all()
+    rng = random.Random(seed.summary()["orders"])
+    return BenchContext(
+        seed=seed,
+        run_id=uuid.uuid4().hex[:8],
+        rng=rng,
+        maker_orders=maker_orders,
+        maker_reviews=maker_reviews,
+        unreviewed_orders=[tuple(row) for row in unreviewed],
+        meal_image=fake_image(rng, image_kb),
+    )
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Callable[[BenchContext, int], RequestSpec]
+    # Writes that consume seeded rows (e.g. one review per order) cap their request count.
+    capacity: Callable[[BenchContext], int] | None = None
+
+
+def get(url: str, headers: dict[str, str] | None = None) -> RequestSpec:
+    return RequestSpec("GET", url, headers=headers or {})
+
+
+SCENARIOS = (
+    Scenario("health", lambda ctx, i: get("/api/health")),
+    Scenario("list_meals", lambda ctx, i: get("/api/meals")),
+    Scenario("list_meals_summary", lambda ctx, i: get("/api/meals?view=summary")),
+    Scenario("list_meals_by_maker", lambda ctx, i: get(f"/api/meals?maker_id={ctx.maker(i)}")),
+    Scenario("list_makers", lambda ctx, i: get("/api/makers")),
+    Scenario("get_maker_stats", lambda ctx, i: get(f"/api/makers/{ctx.maker(i)}/stats")),
+    Scenario("nearby_makers", lambda ctx, i: nearby_makers(ctx)),
+    Scenario("search_meals", lambda ctx, i: get(f"/api/search?q=meal+{i % 10}")),
+    Scenario("search_makers", lambda ctx, i: get(f"/api/search?kind=makers&q=kitch+{i % 10}")),
+    Scenario("get_maker_profile", lambda ctx, i: get(f"/api/maker/profile?maker_id={ctx.maker(i)}")),
+    Scenario("list_reviews", lambda ctx, i: get(f"/api/reviews?maker_id={ctx.maker(i)}")),
+    Scenario("list_orders", lambda ctx, i: get("/api/orders", ctx.auth(ctx.maker(i), "maker"))),
+    Scenario("list_orders_summary", lambda ctx, i: get("/api/orders?view=summary", ctx.auth(ctx.maker(i), "maker"))),
+    Scenario("maker_analytics", lambda ctx, i: get("/api/maker/analytics", ctx.auth(ctx.maker(i), "maker"))),
+    Scenario("maker_analytics_hourly", lambda ctx, i: get("/api/maker/analytics?period=hour", ctx.auth(ctx.maker(i), "maker"))),
+    Scenario("list_eater_orders", lambda ctx, i: get("/api/eater/orders", ctx.auth(ctx.eater(i), "eater"))),
+    Scenario("get_eater_profile", lambda ctx, i: get("/api/eater/profile", ctx.auth(ctx.eater(i), "eater"))),
+    Scenario(
+        "get_image",
+        lambda ctx, i: get(f"/api/images/{ctx.seed.image_ids[i % len(ctx.seed.image_ids)]}"),
+    ),
+    Scenario(
+        "get_thumbnail",
+        lambda ctx, i: get(f"/api/images/{ctx.seed.image_ids[i % len(ctx.seed.image_ids)]}?size=thumb"),
+    ),
+    Scenario(
+        "login",
+        lambda ctx, i: RequestSpec(
+            "POST",
+            "/api/auth/login",
+            json={"email": maker_email(i % len(ctx.seed.maker_ids)), "password": PASSWORD},
+        ),
+    ),
+    Scenario(
+        "register",
+        lambda ctx, i: RequestSpec(
+            "POST",
+            "/api/auth/register",
+            json={"email": f"new{i}-{ctx.run_id}@bench.aussieeat", "password": PASSWORD, "role": "eater"},
+        ),
+    ),
+    Scenario(
+        "create_meal",
+        lambda ctx, i: RequestSpec(
+            "POST",
+            "/api/meals",
+            json={
+                "title": f"Bench meal {ctx.run_id}-{i}",
+                "description": "Benchmark meal",
+                "price": 12.5,
+                "image_data": ctx.meal_image,
+            },
+            headers=ctx.auth(ctx.maker(i), "maker"),
+        ),
+    ),
+    Scenario(
+        "create_order",
+        lambda ctx, i: RequestSpec(
+            "POST",
+            "/api/orders",
+            json={
+                "maker_id": ctx.maker(i),
+                "order_code": f"N{ctx.run_id}-{i}",
+                "eater_name": eater_email(i % len(ctx.seed.eater_ids)).split("@")[0],
+                "meal_name": "Bench meal",
+                "image_id": ctx.seed.image_ids[i % len(ctx.seed.image_ids)],
+                "price": 12.5,
+            },
+            headers=ctx.auth(ctx.eater(i), "eater"),
+        ),
+    ),
+    Scenario("update_order_status", lambda ctx, i: update_order_status(ctx, i)),
+    Scenario("create_orders_bulk", lambda ctx, i: create_orders_bulk(ctx, i)),
+    Scenario("update_orders_status", lambda ctx, i: update_orders_status(ctx, i)),
+    Scenario(
+        "create_review",
+        lambda ctx, i: RequestSpec(
+            "POST",
+            "/api/reviews",
+            json={"order_id": ctx.unreviewed_orders[i][0], "rating": 5, "comment": "Benchmark review"},
+            headers=ctx.auth(ctx.unreviewed_orders[i][1], "eater"),
+        ),
+        capacity=lambda ctx: len(ctx.unreviewed_orders),
+    ),
+    Scenario("update_review_reply", lambda ctx, i: update_review_reply(ctx, i)),
+    Scenario(
+        "update_maker_profile",
+        lambda ctx, i: RequestSpec(
+            "PUT",
+            "/api/maker/profile",
+            json={
+                "name": f"Benchmark Kitchen {i}",
+                "email": maker_email(i % len(ctx.seed.maker_ids)),
+                "phone": "+61 3 9000 0000",
+                "country": "Australia",
+                "location": f"{i} Spencer St, Docklands VIC 3008",
+            },
+            headers=ctx.auth(ctx.maker(i), "maker"),
+        ),
+    ),
+    Scenario(
+        "update_eater_profile",
+        lambda ctx, i: RequestSpec(
+            "PUT",
+            "/api/eater/profile",
+            json={"display_name": f"eater {i}", "favorite_cuisine": "Thai"},
+            headers=ctx.auth(ctx.eater(i), "eater"),
+        ),
+    ),
+)
+
+
+def nearby_makers(ctx: BenchContext) -> RequestSpec:
+    lat = CITY_CENTRE[0] + ctx.rng.uniform(-0.1, 0.1)
+    lng = CITY_CENTRE[1] + ctx.rng.uniform(-0.1, 0.1)
+    return get(f"/api/makers/nearby?lat={lat:.5f}&lng={lng:.5f}&radius=5")
+
+
+def update_order_status(ctx: BenchContext, i: int) -> RequestSpec:
+    maker_id, order_ids = ctx.maker_with(ctx.maker_orders, i)
+    return RequestSpec(
+        "PATCH",
+        f"/api/orders/{ctx.rng.choice(order_ids)}",
+        json={"status": ("pending", "preparing", "ready", "completed")[i % 4]},
+        headers=ctx.auth(maker_id, "maker"),
+    )
+
+
+def create_orders_bulk(ctx: BenchContext, i: int, size: int = 50) -> RequestSpec:
+    maker_id = ctx.maker(i)
+    return RequestSpec(
+        "POST",
+        "/api/orders/bulk",
+        json={
+            "orders": [
+                {
+                    "maker_id": maker_id,
+                    "order_code": f"K{ctx.run_id}-{i}-{item}",
+                    "eater_name": "walk-in",
+                    "meal_name": "Bench meal",
+                    "image_id": ctx.seed.image_ids[(i + item) % len(ctx.seed.image_ids)],
+                    "price": 12.5,
+                }
+                for item in range(size)
+            ]
+        },
+        headers=ctx.auth(maker_id, "maker"),
+    )
+
+
+def update_orders_status(ctx: BenchContext, i: int) -> RequestSpec:
+    maker_id, order_ids = ctx.maker_with(ctx.maker_orders, i)
+    return RequestSpec(
+        "PATCH",
+        "/api/orders/status",
+        json={"order_ids": order_ids[:100], "status": ("pending", "preparing", "ready", "completed")[i % 4]},
+        headers=ctx.auth(maker_id, "maker"),
+    )
+
+
+def update_review_reply(ctx: BenchContext, i: int) -> RequestSpec:
+    maker_id, review_ids = ctx.maker_with(ctx.maker_reviews, i)
+    return RequestSpec(
+        "PATCH",
+        f"/api/reviews/{ctx.rng.choice(review_ids)}",
+        json={"reply": f"Thanks for the review ({i})"},
+        headers=ctx.auth(maker_id, "maker"),
+    )
+
+
+def select_scenarios(names: list[str] | None) -> tuple[Scenario, ...]:
+    if not names:
+        return SCENARIOS
+    known = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(unknown)}")
+    return tuple(known[name] for name in names)
@@ -0,0 +1,180 @@
+"""Populate a benchmark database at a configurable scale."""
+import base64
+import io
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from PIL import Image
+from sqlalchemy import text
+
+from ..analytics import rebuild_sales_rollups
+from ..database import Base, SessionLocal, engine
+from ..geo import encode_geohash
+from ..images import store_image
+from ..migrations import upgrade_database
+from ..models import EaterProfile, MakerOrder, MakerProfile, MakerReview, Meal, User
+from ..search import drop_search_index
+from ..security import hash_password
+from ..stats import rebuild_maker_stats
+
+PASSWORD = "benchmark-password"
+NOISE_JPEG_BYTES_PER_PIXEL = 0.9
+# Makers are scattered within roughly 25 km of Melbourne CBD.
+CITY_CENTRE = (-37.8136, 144.9631)
+CITY_SPREAD_DEGREES = 0.25
+
+
+@dataclass
+class SeedConfig:
+    makers: int = 20
+    meals_per_maker: int = 10
+    eaters: int = 50
+    orders_per_eater: int = 10
+    review_ratio: float = 0.5
+    image_kb: int = 48
+    random_seed: int = 1
+
+
+@dataclass
+class SeedResult:
+    maker_ids: list[int] = field(default_factory=list)
+    eater_ids: list[int] = field(default_factory=list)
+    image_ids: list[str] = field(default_factory=list)
+    order_ids: list[int] = field(default_factory=list)
+    unreviewed_order_ids: list[int] = field(default_factory=list)
+    review_ids: list[int] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "makers": len(self.maker_ids),
+            "eaters": len(self.eater_ids),
+            "images": len(self.image_ids),
+            "orders": len(self.order_ids),
+            "reviews": len(self.review_ids),
+        }
+
+
+def fake_image(rng: random.Random, size_kb: int) -> str:
+    """A JPEG data URL of random noise, so every meal stores (and thumbnails) a distinct image.
+
+    Noise barely compresses, so the square is sized from NOISE_JPEG_BYTES_PER_PIXEL to land near size_kb KiB.
+    """
+    side = max(8, int(math.sqrt(size_kb * 1024 / NOISE_JPEG_BYTES_PER_PIXEL)))
+    image = Image.frombytes("RGB", (side, side), rng.randbytes(side * side * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def maker_email(index: int) -> str:
+    return f"maker{index}@bench.aussieeat"
+
+
+def eater_email(index: int) -> str:
+    return f"eater{index}@bench.aussieeat"
+
+
+def seed_database(config: SeedConfig) -> SeedResult:
+    rng = random.Random(config.random_seed)
+    result = SeedResult()
+    # One hash for every account: seeding cost should not be dominated by pbkdf2.
+    password_hash = hash_password(PASSWORD)
+    now = datetime.now(timezone.utc)
+
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as connection:
+        drop_search_index(connection)
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    upgrade_database(engine)
+
+    with SessionLocal() as db:
+        makers = [User(email=maker_email(i), password_hash=password_hash, role="maker") for i in range(config.makers)]
+        eaters = [User(email=eater_email(i), password_hash=password_hash, role="eater") for i in range(config.eaters)]
+        db.add_all(makers + eaters)
+        db.flush()
+        result.maker_ids = [maker.id for maker in makers]
+        result.eater_ids = [eater.id for eater in eaters]
+
+        for index, maker in enumerate(makers):
+            latitude = CITY_CENTRE[0] + rng.uniform(-CITY_SPREAD_DEGREES, CITY_SPREAD_DEGREES)
+            longitude = CITY_CENTRE[1] + rng.uniform(-CITY_SPREAD_DEGREES, CITY_SPREAD_DEGREES)
+            db.add(
+                MakerProfile(
+                    maker_id=maker.id,
+                    name=f"Benchmark Kitchen {index}",
+                    email=maker.email,
+                    phone="+61 3 9000 0000",
+                    country="Australia",
+                    location=f"{index} Spencer St, Docklands VIC 3008",
+                    latitude=latitude,
+                    longitude=longitude,
+                    geohash=encode_geohash(latitude, longitude),
+                )
+            )
+            for meal_index in range(config.meals_per_maker):
+                image_id = store_image(db, fake_image(rng, config.image_kb))
+                result.image_ids.append(image_id)
+                db.add(
+                    Meal(
+                        maker_id=maker.id,
+                        title=f"Meal {index}-{meal_index}",
+                        description="Slow-cooked, locally sourced and packed with flavour. " * 4,
+                        price=round(rng.uniform(8, 30), 2),
+                        image_id=image_id,
+                        created_at=now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+                    )
+                )
+            db.commit()
+
+        orders = []
+        for index, eater in enumerate(eaters):
+            db.add(EaterProfile(eater_id=eater.id, display_name=f"eater{index}"))
+            for order_index in range(config.orders_per_eater):
+                placed_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+                orders.append(
+                    MakerOrder(
+                        maker_id=rng.choice(result.maker_ids),
+                        eater_id=eater.id,
+                        order_code=f"B{index}-{order_index}",
+                        eater_name=f"eater{index}",
+                        meal_name=f"Meal {order_index}",
+                        image_id=rng.choice(result.image_ids),
+                        price=round(rng.uniform(8, 30), 2),
+                        order_time=placed_at,
+                        created_at=placed_at,
+                        status=rng.choice(("pending", "preparing", "ready", "completed")),
+                    )
+                )
+        db.add_all(orders)
+        db.flush()
+        result.order_ids = [order.id for order in orders]
+
+        reviews = []
+        for order in orders:
+            if rng.random() >= config.review_ratio:
+                result.unreviewed_order_ids.append(order.id)
+                continue
+            reviews.append(
+                MakerReview(
+                    maker_id=order.maker_id,
+                    eater_id=order.eater_id,
+                    order_id=order.id,
+                    order_code=order.order_code,
+                    eater_name=order.eater_name,
+                    meal_name=order.meal_name,
+                    image_id=order.image_id,
+                    rating=rng.randint(1, 5),
+                    comment="Arrived hot and on time, would order again. " * 3,
+                    created_at=order.order_time + timedelta(hours=2),
+                )
+            )
+        db.add_all(reviews)
+        db.flush()
+        result.review_ids = [review.id for review in reviews]
+        rebuild_maker_stats(db.connection())
+        rebuild_sales_rollups(db.connection())
+        db.commit()
+
+    return result
@@ -0,0 +1,229 @@
+import hashlib
+import importlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Iterable
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .config import (
+    FAST_JSON,
+    READ_YOUR_WRITES_SECONDS,
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from .database import read_route
+from .metrics import timed_serialization
+from .serialization import dump_trusted, orjson
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= self.timer():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires_at = self.timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheBackend(ABC):
+    """Storage for serialized responses plus per-namespace version counters."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    def get_version(self, namespace: str) -> int: ...
+
+    @abstractmethod
+    def bump_version(self, namespace: str) -> int: ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl)
+
+    def get_version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    def bump_version(self, namespace: str) -> int:
+        with self._lock:
+            version = self._versions.get(namespace, 0) + 1
+            self._versions[namespace] = version
+            return version
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    etag: str
+
+    def to_entry(self) -> bytes:
+        """Backend value: the ETag, a newline, then the body, so hits need not rehash it."""
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def from_entry(cls, entry: bytes) -> "CachedBody | None":
+        etag, separator, body = entry.partition(b"\n")
+        # Anything else (a bare body stored before ETags were kept) is treated as a miss.
+        if not separator or not etag.startswith(b'"'):
+            return None
+        return cls(body=body, etag=etag.decode())
+
+    def to_response(self, request: Request) -> Response:
+        # no-cache lets browsers keep the body but revalidate it with If-None-Match every time.
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.etag in parse_if_none_match(request.headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def parse_if_none_match(value: str | None) -> set[str]:
+    if not value:
+        return set()
+    return {tag.strip() for tag in value.split(",")}
+
+
+def strong_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def serialize(model: Any, data: Any) -> bytes:
+    with timed_serialization():
+        if FAST_JSON and orjson is not None:
+            return dump_trusted(model, data)
+        adapter = type_adapter(model)
+        return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+class ResponseCache:
+    """Caches serialized JSON bodies keyed by request and namespace versions.
+
+    Writers invalidate by bumping a namespace version, which orphans every key built
+    from the old version; this works the same for local and shared backends.
+
+    With read replicas, a body read from a replica may predate the latest bump, so it is kept
+    no longer than the read-your-writes window. Callers inside that window (reading from the
+    primary) skip lookups and store a fresh body instead.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+
+    def key(self, request: Request, namespaces: Iterable[str], *extra: Any) -> str:
+        versions = ",".join(f"{ns}@{self.backend.get_version(ns)}" for ns in namespaces)
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        parts = [request.url.path, query, versions, *map(str, extra)]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> CachedBody | None:
+        if not self.enabled or read_route.get() == "primary":
+            return None
+        entry = self.backend.get(key)
+        return CachedBody.from_entry(entry) if entry is not None else None
+
+    def store(self, key: str, model: Any, data: Any) -> CachedBody:
+        body = serialize(model, data)
+        cached = CachedBody(body=body, etag=strong_etag(body))
+        if self.enabled:
+            ttl = min(self.ttl, READ_YOUR_WRITES_SECONDS) if read_route.get() == "replica" else self.ttl
+            self.backend.set(key, cached.to_entry(), ttl)
+        return cached
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.bump_version(namespace)
+
+
+def load_backend(path: str) -> CacheBackend:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+response_cache = ResponseCache(
+    load_backend(RESPONSE_CACHE_BACKEND),
+    ttl=RESPONSE_CACHE_TTL_SECONDS,
+    enabled=RESPONSE_CACHE_ENABLED,
+)
+
+INVALIDATE_KEY = "response_cache.invalidate"
+
+
+def invalidate_on_commit(session: Any, *namespaces: str) -> None:
+    """Queue namespaces to invalidate once the session's transaction commits."""
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(INVALIDATE_KEY, set()).update(namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    namespaces = session.info.pop(INVALIDATE_KEY, None)
+    if namespaces:
+        response_cache.invalidate(*namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(INVALIDATE_KEY, None)
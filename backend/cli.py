@@ -0,0 +1,110 @@
+"""Maintenance commands.
+
+    python -m backend.cli migrate [REVISION]
+    python -m backend.cli rebuild-stats
+    python -m backend.cli rebuild-sales
+    python -m backend.cli build-thumbnails
+    python -m backend.cli sync-replicas [--interval SECONDS]
+    python -m backend.cli archive-orders [--older-than-days DAYS] [--batch-size N]
+"""
+import argparse
+import sys
+import time
+
+from .analytics import rebuild_sales_rollups
+from .archive import archive_completed_orders, archive_cutoff
+from .config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE
+from .database import SessionLocal, engine
+from .images import build_missing_variants
+from .migrations import current_revision, downgrade_database, upgrade_database
+from .replicas import sync_sqlite_replicas
+from .stats import rebuild_maker_stats
+
+
+def migrate(args: argparse.Namespace) -> int:
+    before = current_revision(engine)
+    if args.downgrade:
+        downgrade_database(engine, args.revision)
+    else:
+        upgrade_database(engine, args.revision)
+    print(f"Database schema: {before or 'empty'} -> {current_revision(engine)}")
+    return 0
+
+
+def rebuild_stats(args: argparse.Namespace) -> int:
+    with engine.begin() as connection:
+        makers = rebuild_maker_stats(connection)
+    print(f"Rebuilt rating stats for {makers} makers")
+    return 0
+
+
+def rebuild_sales(args: argparse.Namespace) -> int:
+    with engine.begin() as connection:
+        orders = rebuild_sales_rollups(connection, args.batch_size)
+    print(f"Rebuilt sales rollups from {orders} orders")
+    return 0
+
+
+def build_thumbnails(args: argparse.Namespace) -> int:
+    with SessionLocal() as db:
+        built, unreadable = build_missing_variants(db)
+    print(f"Built thumbnails for {built} images ({unreadable} unreadable images left as they are)")
+    return 0
+
+
+def sync_replicas(args: argparse.Namespace) -> int:
+    while True:
+        replicas = sync_sqlite_replicas()
+        if not args.interval:
+            print(f"Copied the primary database to {replicas} replicas")
+            return 0
+        time.sleep(args.interval)
+
+
+def archive_orders(args: argparse.Namespace) -> int:
+    orders, reviews = archive_completed_orders(engine, archive_cutoff(args.older_than_days), args.batch_size)
+    print(f"Archived {orders} completed orders and {reviews} reviews")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m backend.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migration = commands.add_parser("migrate", help="apply schema migrations (run before starting the app)")
+    migration.add_argument("revision", nargs="?", default="head", help="target revision (default: head)")
+    migration.add_argument("--downgrade", action="store_true", help="step back down to REVISION instead")
+    migration.set_defaults(handler=migrate)
+    rebuild = commands.add_parser("rebuild-stats", help="recompute maker rating aggregates from all reviews")
+    rebuild.set_defaults(handler=rebuild_stats)
+    sales = commands.add_parser("rebuild-sales", help="recompute maker sales rollups from all orders")
+    sales.add_argument("--batch-size", type=int, default=5000, help="orders read per batch (default: 5000)")
+    sales.set_defaults(handler=rebuild_sales)
+    thumbnails = commands.add_parser("build-thumbnails", help="generate thumbnail sizes for images stored without them")
+    thumbnails.set_defaults(handler=build_thumbnails)
+    replicas = commands.add_parser("sync-replicas", help="copy a SQLite primary onto its SQLite read replicas")
+    replicas.add_argument("--interval", type=float, default=0, help="keep copying every SECONDS (default: once)")
+    replicas.set_defaults(handler=sync_replicas)
+    archive = commands.add_parser("archive-orders", help="move old completed orders and their reviews to the archive")
+    archive.add_argument(
+        "--older-than-days",
+        type=float,
+        default=ARCHIVE_AFTER_DAYS,
+        help=f"archive orders placed more than DAYS ago (default: {ARCHIVE_AFTER_DAYS:g})",
+    )
+    archive.add_argument(
+        "--batch-size",
+        type=int,
+        default=ARCHIVE_BATCH_SIZE,
+        help=f"orders moved per transaction (default: {ARCHIVE_BATCH_SIZE})",
+    )
+    archive.set_defaults(handler=archive_orders)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
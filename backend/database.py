@@ -1,20 +1,159 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import partial
+from itertools import cycle
 
-from sqlalchemy import create_engine
+from anyio import to_thread
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
-DATABASE_URL = "sqlite:///./aussieeat.db"
-
-engine = create_engine(
+from .config import (
+    ASYNC_DATABASE_URL,
     DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    future=True,
+    DB_MAX_OVERFLOW,
+    DB_MODE,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    METRICS_ENABLED,
+    READ_REPLICA_URLS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_PERFORMANCE_PROFILE,
+    SQLITE_SYNCHRONOUS,
+)
+from .metrics import instrument_engine
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+SQLITE_PRAGMAS = (
+    f"journal_mode={SQLITE_JOURNAL_MODE}",
+    f"synchronous={SQLITE_SYNCHRONOUS}",
+    f"busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+    f"mmap_size={SQLITE_MMAP_SIZE}",
+    f"cache_size={SQLITE_CACHE_SIZE}",
 )
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+
+def is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(url: URL, is_async: bool = False) -> dict:
+    options = {
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if is_memory_sqlite(url):
+        # One shared connection, otherwise every pooled connection sees its own empty database.
+        options["poolclass"] = StaticPool
+    else:
+        if url.get_backend_name() == "sqlite":
+            # aiosqlite defaults to NullPool for files; pool explicitly so the size settings apply.
+            options["poolclass"] = AsyncAdaptedQueuePool if is_async else QueuePool
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def make_query_only(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def configure_engine(target: Engine, read_only: bool = False) -> Engine:
+    if target.dialect.name == "sqlite" and SQLITE_PERFORMANCE_PROFILE:
+        event.listen(target, "connect", apply_sqlite_pragmas)
+    if target.dialect.name == "sqlite" and read_only:
+        # A stray write to a replica fails loudly instead of diverging from the primary.
+        event.listen(target, "connect", make_query_only)
+    if METRICS_ENABLED:
+        instrument_engine(target)
+    return target
+
+
+def to_async_url(url: str) -> URL:
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername))
+
+
+database_url = make_url(DATABASE_URL)
+engine = configure_engine(create_engine(database_url, future=True, **engine_options(database_url)))
+SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
 
 Base = declarative_base()
 
 
+if DB_MODE == "async":
+    async_database_url = make_url(ASYNC_DATABASE_URL) if ASYNC_DATABASE_URL else to_async_url(DATABASE_URL)
+    async_engine = create_async_engine(async_database_url, **engine_options(async_database_url, is_async=True))
+    configure_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+else:
+    async_engine = None
+    AsyncSessionLocal = None
+
+
+# Replica engines for the configured DB_MODE; sessions are handed out round-robin.
+replica_urls = [make_url(url) for url in READ_REPLICA_URLS]
+if DB_MODE == "async":
+    read_engines = [
+        create_async_engine(to_async_url(str(url)), **engine_options(to_async_url(str(url)), is_async=True))
+        for url in replica_urls
+    ]
+    for read_engine in read_engines:
+        configure_engine(read_engine.sync_engine, read_only=True)
+    read_session_factories = [
+        async_sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False)
+        for read_engine in read_engines
+    ]
+else:
+    read_engines = [
+        configure_engine(create_engine(url, future=True, **engine_options(url)), read_only=True)
+        for url in replica_urls
+    ]
+    read_session_factories = [
+        sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False, future=True)
+        for read_engine in read_engines
+    ]
+_next_read_session = cycle(read_session_factories).__next__ if read_session_factories else None
+
+# Where the current request's reads go: "replica", or "primary" while the caller's own
+# writes may not have replicated yet. None when no replicas are configured.
+read_route: ContextVar[str | None] = ContextVar("read_route", default=None)
+
+
 @contextmanager
 def get_session():
     session = SessionLocal()
@@ -26,3 +165,101 @@ def get_session():
         raise
     finally:
         session.close()
+
+
+class ThreadedSession:
+    """AsyncSession-compatible facade over a sync Session.
+
+    Each database call runs in the threadpool, so handlers written against the
+    AsyncSession API also work when the sync engine is selected.
+    """
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def _run(self, fn, *args, **kwargs):
+        return await to_thread.run_sync(partial(fn, *args, **kwargs))
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def execute(self, *args, **kwargs):
+        return await self._run(self.sync_session.execute, *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await self._run(self.sync_session.scalar, *args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await self._run(self.sync_session.scalars, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await self._run(self.sync_session.get, *args, **kwargs)
+
+    async def delete(self, instance):
+        return await self._run(self.sync_session.delete, instance)
+
+    async def flush(self, *args, **kwargs):
+        return await self._run(self.sync_session.flush, *args, **kwargs)
+
+    async def refresh(self, *args, **kwargs):
+        return await self._run(self.sync_session.refresh, *args, **kwargs)
+
+    async def commit(self):
+        return await self._run(self.sync_session.commit)
+
+    async def rollback(self):
+        return await self._run(self.sync_session.rollback)
+
+    async def close(self):
+        return await self._run(self.sync_session.close)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await self._run(fn, self.sync_session, *args, **kwargs)
+
+
+@asynccontextmanager
+async def get_async_session(factory=None):
+    async with (factory or AsyncSessionLocal)() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+@asynccontextmanager
+async def get_threaded_session(factory=None):
+    session = ThreadedSession((factory or SessionLocal)())
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+def open_session():
+    """Open a request-scoped session for the configured DB_MODE."""
+    if DB_MODE == "async":
+        return get_async_session()
+    return get_threaded_session()
+
+
+def open_read_session():
+    """Open a session on the next read replica, or on the primary when there are none."""
+    if _next_read_session is None:
+        return open_session()
+    if DB_MODE == "async":
+        return get_async_session(_next_read_session())
+    return get_threaded_session(_next_read_session())
+
+
+async def get_db():
+    async with open_session() as session:
+        yield session
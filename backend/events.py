@@ -0,0 +1,124 @@
+import asyncio
+import importlib
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .config import EVENT_BUS_BACKEND, EVENT_SUBSCRIBER_QUEUE_SIZE
+
+ORDER_CREATED = "order.created"
+ORDER_STATUS_CHANGED = "order.status_changed"
+
+
+def maker_topic(maker_id: int) -> str:
+    return f"maker:{maker_id}"
+
+
+def eater_topic(eater_id: int) -> str:
+    return f"eater:{eater_id}"
+
+
+class Subscription:
+    def __init__(self, topic: str, maxsize: int):
+        self.topic = topic
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=maxsize)
+
+    def deliver(self, message: dict) -> None:
+        # A slow consumer loses its oldest events rather than blocking publishers.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class EventBus(ABC):
+    """Publish/subscribe channel for order events.
+
+    publish() must be safe to call from any thread and must not block; it runs in
+    Session after_commit hooks, which execute in the threadpool in sync DB mode.
+    """
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def publish(self, topic: str, message: dict) -> None: ...
+
+    @abstractmethod
+    def subscribe(self, topic: str) -> Any:
+        """Return an async context manager yielding a Subscription."""
+
+
+class InMemoryEventBus(EventBus):
+    def __init__(self, queue_size: int = EVENT_SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.subscriptions: dict[str, set[Subscription]] = {}
+
+    async def start(self) -> None:
+        self.loop = asyncio.get_running_loop()
+
+    def _fan_out(self, topic: str, message: dict) -> None:
+        for subscription in list(self.subscriptions.get(topic, ())):
+            subscription.deliver(message)
+
+    def publish(self, topic: str, message: dict) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is self.loop:
+            self._fan_out(topic, message)
+        elif self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._fan_out, topic, message)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[Subscription]:
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        subscription = Subscription(topic, self.queue_size)
+        self.subscriptions.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self.subscriptions.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscriptions[topic]
+
+
+def load_event_bus(path: str) -> EventBus:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+event_bus = load_event_bus(EVENT_BUS_BACKEND)
+
+PUBLISH_KEY = "event_bus.pending"
+
+
+def publish_on_commit(session: Any, topics: list[str], message: dict) -> None:
+    """Queue an event for delivery once the session's transaction commits."""
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(PUBLISH_KEY, []).append((topics, message))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    for topics, message in session.info.pop(PUBLISH_KEY, ()):
+        for topic in topics:
+            event_bus.publish(topic, message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PUBLISH_KEY, None)
@@ -0,0 +1,86 @@
+"""Streaming NDJSON/CSV exports.
+
+Rows are read in yield_per partitions on a session owned by the stream itself (the
+request-scoped session is closed before a StreamingResponse body runs) and encoded
+one partition at a time, so memory stays flat however long the history is.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterator, Literal, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from .config import DB_MODE, EXPORT_BATCH_SIZE
+from .database import AsyncSessionLocal, SessionLocal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def plain(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def ndjson_header(keys: Sequence[str]) -> str:
+    return ""
+
+
+def ndjson_rows(keys: Sequence[str], rows) -> str:
+    return "".join(json.dumps({key: plain(value) for key, value in zip(keys, row)}) + "\n" for row in rows)
+
+
+def csv_lines(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def csv_header(keys: Sequence[str]) -> str:
+    return csv_lines([keys])
+
+
+def csv_rows(keys: Sequence[str], rows) -> str:
+    return csv_lines([plain(value) for value in row] for row in rows)
+
+
+ENCODERS: dict[str, tuple[Callable, Callable]] = {
+    "ndjson": (ndjson_header, ndjson_rows),
+    "csv": (csv_header, csv_rows),
+}
+
+
+async def stream_async(stmt, export_format: ExportFormat) -> AsyncIterator[str]:
+    header, encode = ENCODERS[export_format]
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt)
+        keys = list(result.keys())
+        yield header(keys)
+        async for rows in result.partitions():
+            yield encode(keys, rows)
+
+
+def stream_sync(stmt, export_format: ExportFormat) -> Iterator[str]:
+    # Starlette iterates sync bodies in the threadpool, so each fetch stays off the event loop.
+    header, encode = ENCODERS[export_format]
+    with SessionLocal() as session:
+        result = session.execute(stmt)
+        keys = list(result.keys())
+        yield header(keys)
+        for rows in result.partitions():
+            yield encode(keys, rows)
+
+
+def export_response(stmt, export_format: ExportFormat, filename: str) -> StreamingResponse:
+    stmt = stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+    body = stream_async(stmt, export_format) if DB_MODE == "async" else stream_sync(stmt, export_format)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -0,0 +1,76 @@
+import math
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    use_longitude = True
+    while len(chars) < precision:
+        target, coordinate = (lng_range, longitude) if use_longitude else (lat_range, latitude)
+        middle = (target[0] + target[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            target[0] = middle
+        else:
+            target[1] = middle
+        use_longitude = not use_longitude
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def cell_size_degrees(precision: int) -> tuple[float, float]:
+    """Height and width of a geohash cell in degrees."""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def covering_precision(latitude: float, radius_km: float) -> int:
+    """Finest precision whose cells are at least radius_km on each side at this latitude."""
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size_degrees(precision)
+        if min(height * KM_PER_DEGREE, width * KM_PER_DEGREE * cos_lat) >= radius_km:
+            return precision
+    return 1
+
+
+def covering_cells(latitude: float, longitude: float, radius_km: float) -> list[str]:
+    """Geohash prefixes whose union contains the circle: the centre cell and its 8 neighbours."""
+    precision = covering_precision(latitude, radius_km)
+    height, width = cell_size_degrees(precision)
+    cells = set()
+    for d_lat in (-1, 0, 1):
+        lat = latitude + d_lat * height
+        if not -90 <= lat <= 90:
+            continue
+        for d_lng in (-1, 0, 1):
+            lng = (longitude + d_lng * width + 180) % 360 - 180
+            cells.add(encode_geohash(lat, lng, precision))
+    return sorted(cells)
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    # "~" sorts after every base32 character, so [prefix, prefix~) is exactly the prefix range.
+    return prefix + "~"
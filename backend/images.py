@@ -0,0 +1,306 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .config import (
+    IMAGE_EXECUTOR,
+    IMAGE_MAX_DIMENSION,
+    IMAGE_MAX_PIXELS,
+    IMAGE_QUALITY,
+    IMAGE_WORKERS,
+    THUMBNAIL_QUALITY,
+)
+from .models import ImageBlob, ImageVariant
+
+DATA_URL_PATTERN = re.compile(r"^data:(?P<content_type>[^;,]*)(?P<params>(?:;[^;,]*)*),(?P<payload>.*)$", re.DOTALL)
+
+# Pillow formats accepted on upload, and the content type each is served with.
+CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+}
+
+# Fixed thumbnail sizes (longest edge in pixels). List cards use "thumb"; detail views the original.
+ImageSize = Literal["thumb", "medium"]
+THUMBNAIL_SIZES: dict[str, int] = {"thumb": 400, "medium": 1024}
+THUMBNAIL_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+
+# Info keys that carry camera/location/editor metadata rather than pixels or colour.
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment", "photoshop")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+FALLBACK_IMAGE_CACHE_CONTROL = "public, max-age=3600"
+UNKNOWN_CONTENT_TYPE = "application/octet-stream"
+# Sent with every image so a stored blob is never sniffed or rendered as a document.
+IMAGE_SECURITY_HEADERS = {"X-Content-Type-Options": "nosniff", "Content-Security-Policy": "default-src 'none'"}
+
+# Larger images are rejected below; this only makes Pillow refuse them while reading the header.
+Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+
+_image_executor: Executor | None = None
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    content_type: str
+    data: bytes
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class ProcessedImage:
+    original: EncodedImage
+    variants: dict[str, EncodedImage]
+
+
+def decode_image_data(image_data: str) -> bytes:
+    """Decode a data URL or bare base64 string into raw bytes."""
+    payload = image_data.strip()
+    match = DATA_URL_PATTERN.match(payload)
+    if match:
+        if ";base64" not in match.group("params"):
+            raise InvalidImageError("Image data URL must be base64 encoded")
+        payload = match.group("payload")
+
+    try:
+        raw = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidImageError("Image data is not valid base64") from exc
+    if not raw:
+        raise InvalidImageError("Image data is empty")
+    return raw
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def decode_upload(image_data: str) -> tuple[str, bytes]:
+    raw = decode_image_data(image_data)
+    return content_hash(raw), raw
+
+
+def served_content_type(content_type: str) -> str:
+    """The stored type if it is one uploads can produce, else a type browsers only download."""
+    return content_type if content_type in CONTENT_TYPES.values() else UNKNOWN_CONTENT_TYPE
+
+
+def image_url(image_id: str, size: ImageSize | None = None) -> str:
+    url = f"/api/images/{image_id}"
+    return f"{url}?size={size}" if size else url
+
+
+def fit_within(size: tuple[int, int], edge: int) -> tuple[int, int]:
+    scale = min(1.0, edge / max(size))
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def carries_metadata(image: Image.Image) -> bool:
+    return bool(image.getexif()) or any(key in image.info for key in METADATA_KEYS)
+
+
+def encode(image: Image.Image, image_format: str, quality: int, icc_profile: bytes | None = None) -> bytes:
+    """Re-encode pixels only: EXIF, XMP and comments are never written back."""
+    options: dict = {"icc_profile": icc_profile} if icc_profile else {}
+    if image_format == "JPEG":
+        if image.mode not in ("RGB", "L", "CMYK"):
+            image = image.convert("RGB")
+        options.update(quality=quality, optimize=True, progressive=True)
+    elif image_format == "WEBP":
+        options.update(quality=quality, method=4)
+    else:
+        options.update(optimize=True)
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def thumbnail_base(image: Image.Image) -> Image.Image:
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    if has_alpha and THUMBNAIL_FORMAT == "JPEG":
+        return image.convert("RGBA").convert("RGB")
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def make_variants(image: Image.Image) -> dict[str, EncodedImage]:
+    variants = {}
+    # Largest first, each resized from the previous one, so every step shrinks less.
+    current = thumbnail_base(image)
+    for name, edge in sorted(THUMBNAIL_SIZES.items(), key=lambda item: item[1], reverse=True):
+        current = current.resize(fit_within(current.size, edge), Image.Resampling.LANCZOS)
+        variants[name] = EncodedImage(
+            content_type=CONTENT_TYPES[THUMBNAIL_FORMAT],
+            data=encode(current, THUMBNAIL_FORMAT, THUMBNAIL_QUALITY),
+            width=current.width,
+            height=current.height,
+        )
+    return variants
+
+
+def process_image(raw: bytes) -> ProcessedImage:
+    """Decode an upload, strip its metadata, re-encode it and render every thumbnail size.
+
+    CPU-bound; called on the image executor. Animated images keep their original bytes
+    (re-encoding would drop frames) and are thumbnailed from their first frame.
+    """
+    try:
+        with Image.open(io.BytesIO(raw)) as source:
+            image_format = source.format
+            if image_format not in CONTENT_TYPES:
+                raise InvalidImageError("Image must be JPEG, PNG, GIF or WebP")
+            if source.width * source.height > IMAGE_MAX_PIXELS:
+                raise InvalidImageError("Image has too many pixels")
+
+            animated = getattr(source, "is_animated", False)
+            had_metadata = carries_metadata(source)
+            icc_profile = source.info.get("icc_profile")
+            oversized = max(source.size) > IMAGE_MAX_DIMENSION
+            if image_format == "JPEG" and oversized:
+                # Let libjpeg decode at a reduced scale when the original will be downsized anyway.
+                source.draft(source.mode, fit_within(source.size, IMAGE_MAX_DIMENSION))
+            image = ImageOps.exif_transpose(source)
+
+            if animated:
+                data = raw
+            else:
+                if oversized:
+                    image = image.resize(fit_within(image.size, IMAGE_MAX_DIMENSION), Image.Resampling.LANCZOS)
+                data = encode(image, image_format, IMAGE_QUALITY, icc_profile)
+                # A clean upload that re-encodes larger is already as good as it gets.
+                if len(data) >= len(raw) and not (had_metadata or oversized):
+                    data = raw
+
+            return ProcessedImage(
+                original=EncodedImage(CONTENT_TYPES[image_format], data, image.width, image.height),
+                variants=make_variants(image),
+            )
+    except InvalidImageError:
+        raise
+    except (Image.DecompressionBombError, UnidentifiedImageError, OSError, ValueError, SyntaxError) as exc:
+        raise InvalidImageError("Image data is not a readable image") from exc
+
+
+def get_image_executor() -> Executor:
+    global _image_executor
+    if _image_executor is None:
+        if IMAGE_EXECUTOR == "process":
+            _image_executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+        else:
+            _image_executor = ThreadPoolExecutor(
+                max_workers=IMAGE_WORKERS,
+                thread_name_prefix="image-process",
+            )
+    return _image_executor
+
+
+def shutdown_image_executor() -> None:
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=False, cancel_futures=True)
+        _image_executor = None
+
+
+def image_exists(db: Session, image_id: str) -> bool:
+    return db.scalar(select(ImageBlob.id).where(ImageBlob.id == image_id)) is not None
+
+
+def variant_rows(image_id: str, variants: dict[str, EncodedImage]) -> list[ImageVariant]:
+    return [
+        ImageVariant(
+            image_id=image_id,
+            variant=name,
+            content_type=variant.content_type,
+            width=variant.width,
+            height=variant.height,
+            size=len(variant.data),
+            data=variant.data,
+        )
+        for name, variant in variants.items()
+    ]
+
+
+def save_image(db: Session, image_id: str, image: ProcessedImage) -> str:
+    try:
+        with db.begin_nested():
+            db.add(
+                ImageBlob(
+                    id=image_id,
+                    content_type=image.original.content_type,
+                    size=len(image.original.data),
+                    data=image.original.data,
+                )
+            )
+            db.add_all(variant_rows(image_id, image.variants))
+    except IntegrityError:
+        # Another request stored the same upload first; its rows are identical.
+        pass
+    return image_id
+
+
+def store_image(db: Session, image_data: str) -> str:
+    """Persist an uploaded image once and return the content hash of the upload."""
+    image_id, raw = decode_upload(image_data)
+    if not image_exists(db, image_id):
+        save_image(db, image_id, process_image(raw))
+    return image_id
+
+
+async def store_image_async(db: AsyncSession, image_data: str) -> str:
+    """store_image() with decoding and processing on the image executor, off the event loop.
+
+    Uploads are keyed by the hash of their bytes, so a repeated upload skips processing.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_image_executor()
+    image_id, raw = await loop.run_in_executor(executor, decode_upload, image_data)
+    if not await db.run_sync(image_exists, image_id):
+        processed = await loop.run_in_executor(executor, process_image, raw)
+        await db.run_sync(save_image, image_id, processed)
+    return image_id
+
+
+def build_missing_variants(db: Session, batch_size: int = 50) -> tuple[int, int]:
+    """Thumbnail stored images that have no variants yet. Returns (built, unreadable)."""
+    built = unreadable = 0
+    last_id = ""
+    while True:
+        ids = db.scalars(
+            select(ImageBlob.id)
+            .where(ImageBlob.id > last_id)
+            .where(~select(ImageVariant.image_id).where(ImageVariant.image_id == ImageBlob.id).exists())
+            .order_by(ImageBlob.id)
+            .limit(batch_size)
+        ).all()
+        if not ids:
+            return built, unreadable
+        for image_id in ids:
+            blob = db.get(ImageBlob, image_id)
+            try:
+                processed = process_image(blob.data)
+            except InvalidImageError:
+                unreadable += 1
+            else:
+                db.add_all(variant_rows(image_id, processed.variants))
+                built += 1
+            db.expunge(blob)
+        db.commit()
+        last_id = ids[-1]
@@ -1,46 +1,254 @@
-import random
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-
-from .database import Base, engine, get_session
-from typing import List, Optional
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, insert, or_, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+
+from .admission import AdmissionMiddleware
+from .analytics import (
+    DEFAULT_BUCKETS,
+    MAX_BUCKETS,
+    TOTAL_BUCKET,
+    TOTAL_PERIOD,
+    AnalyticsPeriod,
+    SalesDeltas,
+    bucket_start,
+    record_sales,
+    summarize,
+    window_buckets,
+)
+from .archive import run_archiver
+from .cache import invalidate_on_commit, response_cache, serialize
+from .auth import (
+    Identity,
+    find_user,
+    get_current_user,
+    get_read_db,
+    get_stream_user,
+    identity_cache,
+    require_eater,
+    require_eater_reader,
+    require_maker,
+    require_maker_reader,
+)
+from .config import (
+    ARCHIVE_INTERVAL_SECONDS,
+    EVENT_STREAM_KEEPALIVE_SECONDS,
+    METRICS_ENABLED,
+    MIGRATE_ON_STARTUP,
+    REPLICA_SYNC_INTERVAL_SECONDS,
+    STREAM_TICKET_TTL_SECONDS,
+)
+from .database import async_engine, engine, get_db, read_engines
+from .events import (
+    ORDER_CREATED,
+    ORDER_STATUS_CHANGED,
+    eater_topic,
+    event_bus,
+    maker_topic,
+    publish_on_commit,
+)
+from typing import List, Literal, Optional
 
 from datetime import datetime, timezone
-from .models import EaterProfile, MakerOrder, MakerProfile, MakerReview, Meal, User
+from .exports import ExportFormat, export_response
+from .geo import covering_cells, encode_geohash, haversine_km, prefix_upper_bound
+from .images import (
+    FALLBACK_IMAGE_CACHE_CONTROL,
+    IMAGE_SECURITY_HEADERS,
+    IMMUTABLE_CACHE_CONTROL,
+    ImageSize,
+    InvalidImageError,
+    image_url,
+    served_content_type,
+    shutdown_image_executor,
+    store_image_async,
+)
+from .migrations import check_database_revision, upgrade_database
+from .metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, metrics_registry
+from .models import (
+    EaterProfile,
+    ImageBlob,
+    ImageVariant,
+    MakerOrder,
+    MakerOrderArchive,
+    MakerProfile,
+    MakerReview,
+    MakerReviewArchive,
+    MakerSalesRollup,
+    MakerStats,
+    Meal,
+    User,
+)
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, merge_pages, page_of, paginate
 from .schemas import (
     AuthResponse,
+    BulkOrderCreate,
+    BulkOrderResponse,
+    BulkOrderResult,
+    BulkOrderStatusResponse,
+    BulkOrderStatusResult,
+    BulkOrderStatusUpdate,
     LoginRequest,
+    MakerAnalyticsResponse,
     MakerOrderCreate,
     MakerOrderResponse,
+    MakerOrderSummaryResponse,
     MakerOrderUpdate,
     MakerReviewCreate,
     MakerReviewResponse,
+    MakerReviewSummaryResponse,
     MakerReviewUpdate,
     MakerProfileRequest,
     MakerProfileResponse,
+    MakerSearchResult,
+    MakerStatsResponse,
     MakerSummaryResponse,
     MealCreate,
     MealResponse,
+    MealSummaryResponse,
+    NearbyMakerResponse,
+    ListView,
+    Page,
     RegisterRequest,
+    StreamTicketResponse,
     EaterProfileRequest,
     EaterProfileResponse,
     EaterOrderResponse,
-    ReviewSnippet,
 )
-from .security import hash_password, verify_password
+from .replicas import run_replica_sync, sync_sqlite_replicas
+from .search import InvalidSearchQueryError, maker_search, meal_search
+from .stats import RATINGS, average_rating, record_review
+from .serialization import JSON_RESPONSE_CLASS
+from .security import (
+    create_access_token,
+    create_stream_ticket,
+    hash_password_async,
+    shutdown_hash_executor,
+    verify_and_update_password_async,
+)
+
+
+def publish_order_event(db: AsyncSession, event_type: str, order: MakerOrder) -> None:
+    topics = [maker_topic(order.maker_id)]
+    if order.eater_id is not None:
+        topics.append(eater_topic(order.eater_id))
+    message = {
+        "type": event_type,
+        "order": MakerOrderResponse.model_validate(order).model_dump(mode="json"),
+    }
+    publish_on_commit(db, topics, message)
+
+
+async def record_order_sales(db: AsyncSession, deltas: SalesDeltas) -> None:
+    for stmt in record_sales(engine.dialect.name, deltas):
+        await db.execute(stmt)
+
+
+def paginate_or_400(stmt, keys, limit: int, cursor: Optional[str]):
+    try:
+        return paginate(stmt, keys, limit, cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
+def projection(view: ListView, entity, summary_columns):
+    """Select full ORM rows, or only the summary columns as plain rows."""
+    return select(*summary_columns) if view == "summary" else select(entity)
+
+
+def columns_on(entity, columns) -> tuple:
+    """The same columns on another model with the same attribute names (an archive table)."""
+    return tuple(getattr(entity, column.key) for column in columns)
 
 
-def get_db():
-    with get_session() as session:
-        yield session
+async def fetch_rows(db: AsyncSession, view: ListView, stmt, keys, limit: int, cursor: Optional[str]) -> list:
+    result = await db.execute(paginate_or_400(stmt, keys, limit, cursor))
+    return result.all() if view == "summary" else result.scalars().all()
 
 
-Base.metadata.create_all(bind=engine)
+async def fetch_page(
+    db: AsyncSession, view: ListView, stmt, keys, limit: int, cursor: Optional[str], archived=None
+) -> dict:
+    """One page of stmt. With archived=(stmt, keys), each table is walked along its own index
+    and the two pages are merged, so archived rows read as if they never moved."""
+    rows = await fetch_rows(db, view, stmt, keys, limit, cursor)
+    if archived is not None:
+        archived_stmt, archived_keys = archived
+        archived_rows = await fetch_rows(db, view, archived_stmt, archived_keys, limit, cursor)
+        rows = merge_pages((rows, archived_rows), keys)
+    return page_of(rows, keys, limit)
 
-app = FastAPI(title="AussieEat API", version="0.1.0")
+
+def with_archived(stmt, archived_stmt, keys):
+    """Export rows from a hot table and its archive as one stream, oldest first."""
+    return union_all(stmt, archived_stmt).order_by(*(key.key for key in keys))
+
+
+def json_response(model, data) -> Response:
+    return Response(content=serialize(model, data), media_type="application/json")
+
+
+async def store_image_or_400(db: AsyncSession, image_data: str) -> str:
+    try:
+        return await store_image_async(db, image_data)
+    except InvalidImageError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes run as a separate step (`python -m backend.cli migrate`); workers only
+    # confirm the database is at the latest revision, unless told to migrate for local use.
+    if MIGRATE_ON_STARTUP:
+        await run_in_threadpool(upgrade_database, engine)
+    else:
+        await run_in_threadpool(check_database_revision, engine)
+    replica_sync = None
+    if REPLICA_SYNC_INTERVAL_SECONDS > 0:
+        # Replicas start as a full copy, so they have the current schema before the first read.
+        await run_in_threadpool(sync_sqlite_replicas)
+        replica_sync = asyncio.create_task(run_replica_sync(REPLICA_SYNC_INTERVAL_SECONDS))
+    archiver = None
+    if ARCHIVE_INTERVAL_SECONDS > 0:
+        archiver = asyncio.create_task(run_archiver(ARCHIVE_INTERVAL_SECONDS))
+    await event_bus.start()
+    yield
+    await event_bus.close()
+    for task in (replica_sync, archiver):
+        if task is not None:
+            task.cancel()
+    shutdown_hash_executor()
+    shutdown_image_executor()
+    if async_engine is not None:
+        # aiosqlite connections own non-daemon threads that would otherwise block interpreter exit.
+        await async_engine.dispose()
+        for read_engine in read_engines:
+            await read_engine.dispose()
+
+
+app = FastAPI(
+    title="AussieEat API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=JSON_RESPONSE_CLASS,
+)
+
+# Added before CORS, so CORS wraps it and 429/503 responses stay readable by the browser.
+app.add_middleware(AdmissionMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -50,19 +258,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/api/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/api/metrics", include_in_schema=False)
+async def metrics():
+    if not METRICS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Metrics are disabled",
+        )
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.post(
     "/api/auth/register",
     response_model=AuthResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def register_user(payload: RegisterRequest, db: Session = Depends(get_db)):
-    existing_user = db.scalar(select(User).where(User.email == payload.email))
+async def register_user(payload: RegisterRequest, db: AsyncSession = Depends(get_db)):
+    existing_user = await db.scalar(select(User).where(User.email == payload.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -71,12 +292,12 @@ def register_user(payload: RegisterRequest, db: Session = Depends(get_db)):
 
     user = User(
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password_async(payload.password),
         role=payload.role,
     )
     db.add(user)
-    db.flush()
-    db.refresh(user)
+    await db.flush()
+    await db.refresh(user)
 
     return AuthResponse(
         id=user.id,
@@ -87,131 +308,479 @@ def register_user(payload: RegisterRequest, db: Session = Depends(get_db)):
 
 
 @app.post("/api/auth/login", response_model=AuthResponse)
-def login_user(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.scalar(select(User).where(User.email == payload.email))
-    if not user or not verify_password(payload.password, user.password_hash):
+async def login_user(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == payload.email))
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await verify_and_update_password_async(payload.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    if new_hash:
+        user.password_hash = new_hash
+
+    identity_cache.set(user.id, Identity(id=user.id, email=user.email, role=user.role))
     return AuthResponse(
         id=user.id,
         email=user.email,
         role=user.role,
         message="Login successful",
+        access_token=create_access_token(user.id, user.role),
+        token_type="bearer",
     )
 
 
-@app.get("/api/meals", response_model=List[MealResponse])
-def list_meals(maker_id: Optional[int] = None, db: Session = Depends(get_db)):
-    stmt = select(Meal)
-    if maker_id:
-        stmt = stmt.where(Meal.maker_id == maker_id)
-    meals = db.scalars(stmt.order_by(Meal.created_at.desc())).all()
-    return meals
+@app.get("/api/images/{image_id}")
+async def get_image(
+    image_id: str,
+    request: Request,
+    size: Optional[ImageSize] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    image = await db.get(ImageVariant, (image_id, size)) if size else None
+    cache_control = IMMUTABLE_CACHE_CONTROL
+    if size and image is None:
+        # Stored before thumbnailing: serve the original, but let a later backfill take over.
+        cache_control = FALLBACK_IMAGE_CACHE_CONTROL
+    if image is None:
+        image = await db.get(ImageBlob, image_id)
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found",
+        )
+
+    etag = f'"{image_id}-{size}"' if size else f'"{image_id}"'
+    headers = {"Cache-Control": cache_control, "ETag": etag, **IMAGE_SECURITY_HEADERS}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=image.data, media_type=served_content_type(image.content_type), headers=headers)
+
+
+PageLimit = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+MEAL_PAGE_KEYS = (Meal.created_at, Meal.id)
+MAKER_PAGE_KEYS = (MakerProfile.id,)
+MAKER_ORDER_PAGE_KEYS = (MakerOrder.created_at, MakerOrder.id)
+EATER_ORDER_PAGE_KEYS = (MakerOrder.order_time, MakerOrder.id)
+REVIEW_PAGE_KEYS = (MakerReview.created_at, MakerReview.id)
+
+# Summary projections carry the schema fields plus the page keys used to build the cursor.
+MEAL_SUMMARY_COLUMNS = (Meal.id, Meal.maker_id, Meal.title, Meal.price, Meal.image_id, Meal.created_at)
+ORDER_SUMMARY_COLUMNS = (
+    MakerOrder.id,
+    MakerOrder.order_code,
+    MakerOrder.eater_name,
+    MakerOrder.meal_name,
+    MakerOrder.image_id,
+    MakerOrder.price,
+    MakerOrder.order_time,
+    MakerOrder.status,
+    MakerOrder.created_at,
+)
+# The eater feed: the order columns EaterOrderResponse needs, plus order_review_columns.
+EATER_ORDER_COLUMNS = (
+    MakerOrder.id,
+    MakerOrder.maker_id,
+    MakerOrder.eater_id,
+    MakerOrder.order_code,
+    MakerOrder.eater_name,
+    MakerOrder.meal_name,
+    MakerOrder.image_id,
+    MakerOrder.price,
+    MakerOrder.order_time,
+    MakerOrder.status,
+)
+REVIEW_SUMMARY_COLUMNS = (
+    MakerReview.id,
+    MakerReview.order_id,
+    MakerReview.order_code,
+    MakerReview.meal_name,
+    MakerReview.rating,
+    MakerReview.reply,
+    MakerReview.created_at,
+)
+
+# Export rows are plain column tuples (no ORM identity map), oldest first.
+ORDER_EXPORT_COLUMNS = (
+    MakerOrder.id,
+    MakerOrder.order_code,
+    MakerOrder.eater_id,
+    MakerOrder.eater_name,
+    MakerOrder.meal_name,
+    MakerOrder.image_id,
+    MakerOrder.price,
+    MakerOrder.order_time,
+    MakerOrder.status,
+    MakerOrder.created_at,
+)
+REVIEW_EXPORT_COLUMNS = (
+    MakerReview.id,
+    MakerReview.order_id,
+    MakerReview.order_code,
+    MakerReview.eater_id,
+    MakerReview.eater_name,
+    MakerReview.meal_name,
+    MakerReview.rating,
+    MakerReview.comment,
+    MakerReview.reply,
+    MakerReview.created_at,
+)
 
 
-@app.get("/api/makers", response_model=List[MakerSummaryResponse])
-def list_makers(db: Session = Depends(get_db)):
-    profiles = db.scalars(select(MakerProfile)).all()
-    meals = db.scalars(select(Meal)).all()
+def order_review_columns(review) -> tuple:
+    """The eater feed's review, if any, from an outer join to a review table."""
+    return (
+        review.id.label("review_id"),
+        review.rating.label("review_rating"),
+        review.comment.label("review_comment"),
+        review.reply.label("review_reply"),
+    )
 
-    meal_map: dict[int, list[Meal]] = {}
-    for meal in meals:
-        meal_map.setdefault(meal.maker_id, []).append(meal)
 
-    summaries: List[MakerSummaryResponse] = []
-    for profile in profiles:
-        maker_meals = meal_map.get(profile.maker_id, [])
-        featured_meal = random.choice(maker_meals) if maker_meals else None
-        summaries.append(
-            MakerSummaryResponse(
-                maker_id=profile.maker_id,
-                name=profile.name,
-                location=profile.location,
-                meal_count=len(maker_meals),
-                featured_meal_name=featured_meal.title if featured_meal else None,
-                featured_meal_image=featured_meal.image_data if featured_meal else None,
+def created_between(stmt, created_at, start: Optional[datetime], end: Optional[datetime]):
+    if start and end and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    if start:
+        stmt = stmt.where(created_at >= start)
+    if end:
+        stmt = stmt.where(created_at < end)
+    return stmt
+
+
+@app.get("/api/meals", response_model=Page[MealResponse] | Page[MealSummaryResponse])
+async def list_meals(
+    request: Request,
+    maker_id: Optional[int] = None,
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    view: ListView = "full",
+    db: AsyncSession = Depends(get_read_db),
+):
+    cache_key = response_cache.key(request, ("meals",))
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        stmt = projection(view, Meal, MEAL_SUMMARY_COLUMNS)
+        if maker_id:
+            stmt = stmt.where(Meal.maker_id == maker_id)
+        page = await fetch_page(db, view, stmt, MEAL_PAGE_KEYS, limit, cursor)
+        model = Page[MealSummaryResponse] if view == "summary" else Page[MealResponse]
+        cached = response_cache.store(cache_key, model, page)
+    return cached.to_response(request)
+
+
+# The featured meal rotates once per window; within a window the default seed (and the response) is stable.
+FEATURED_MEAL_ROTATION_SECONDS = 3600
+
+
+def featured_meal_seed() -> int:
+    return int(time.time() // FEATURED_MEAL_ROTATION_SECONDS)
+
+
+def featured_meal_order(seed: int):
+    # Multiplicative hash of the seeded id: a cheap deterministic shuffle evaluated in SQL.
+    return ((Meal.id + seed) * 2654435761) % 2147483647
+
+
+@app.get("/api/makers", response_model=Page[MakerSummaryResponse])
+async def list_makers(
+    request: Request,
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    seed: Optional[int] = Query(None, ge=0, le=2**31),
+    db: AsyncSession = Depends(get_read_db),
+):
+    seed = featured_meal_seed() if seed is None else seed
+    cache_key = response_cache.key(request, ("makers",), seed)
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        summaries = await load_maker_summaries(db, limit, cursor, seed)
+        cached = response_cache.store(cache_key, Page[MakerSummaryResponse], summaries)
+    return cached.to_response(request)
+
+
+async def load_maker_summaries(db: AsyncSession, limit: int, cursor: Optional[str], seed: int) -> dict:
+    profile_stmt = select(
+        MakerProfile.id,
+        MakerProfile.maker_id,
+        MakerProfile.name,
+        MakerProfile.location,
+        MakerStats.review_count,
+        MakerStats.rating_sum,
+    ).outerjoin(MakerStats, MakerStats.maker_id == MakerProfile.maker_id)
+    profiles = (await db.execute(paginate_or_400(profile_stmt, MAKER_PAGE_KEYS, limit, cursor))).all()
+    page = page_of(profiles, MAKER_PAGE_KEYS, limit)
+    maker_ids = [profile.maker_id for profile in page["items"]]
+
+    featured_map = {}
+    if maker_ids:
+        meal_counts = (
+            select(Meal.maker_id, func.count(Meal.id).label("meal_count"))
+            .where(Meal.maker_id.in_(maker_ids))
+            .group_by(Meal.maker_id)
+            .subquery()
+        )
+        ranked_meals = (
+            select(
+                Meal.maker_id,
+                Meal.title,
+                Meal.image_id,
+                func.row_number()
+                .over(
+                    partition_by=Meal.maker_id,
+                    order_by=featured_meal_order(seed),
+                )
+                .label("position"),
             )
+            .where(Meal.maker_id.in_(maker_ids))
+            .subquery()
         )
-    return summaries
+        rows = (
+            await db.execute(
+                select(
+                    meal_counts.c.maker_id,
+                    meal_counts.c.meal_count,
+                    ranked_meals.c.title,
+                    ranked_meals.c.image_id,
+                ).join(
+                    ranked_meals,
+                    and_(
+                        ranked_meals.c.maker_id == meal_counts.c.maker_id,
+                        ranked_meals.c.position == 1,
+                    ),
+                )
+            )
+        ).all()
+        featured_map = {row.maker_id: row for row in rows}
 
+    summaries = []
+    for profile in page["items"]:
+        featured = featured_map.get(profile.maker_id)
+        summaries.append(
+            {
+                "maker_id": profile.maker_id,
+                "name": profile.name,
+                "location": profile.location,
+                "meal_count": featured.meal_count if featured else 0,
+                "featured_meal_name": featured.title if featured else None,
+                "featured_meal_image": image_url(featured.image_id, "thumb") if featured else None,
+                "review_count": profile.review_count or 0,
+                "average_rating": average_rating(profile.review_count, profile.rating_sum),
+            }
+        )
+    return {"items": summaries, "next_cursor": page["next_cursor"]}
 
-@app.post(
-    "/api/meals",
-    response_model=MealResponse,
-    status_code=status.HTTP_201_CREATED,
-)
-def create_meal(payload: MealCreate, db: Session = Depends(get_db)):
-    maker = db.scalar(select(User).where(User.id == payload.maker_id, User.role == "maker"))
+
+@app.get("/api/makers/{maker_id}/stats", response_model=MakerStatsResponse)
+async def get_maker_stats(maker_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    cache_key = response_cache.key(request, (f"reviews:{maker_id}",))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+
+    maker = await find_user(db, maker_id, "maker")
     if not maker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Maker not found",
         )
 
+    stats = await db.get(MakerStats, maker_id)
+    response = MakerStatsResponse(
+        maker_id=maker_id,
+        review_count=stats.review_count if stats else 0,
+        average_rating=average_rating(stats.review_count, stats.rating_sum) if stats else None,
+        rating_histogram={
+            rating: getattr(stats, f"rating_{rating}") if stats else 0 for rating in RATINGS
+        },
+        last_review_at=stats.last_review_at if stats else None,
+    )
+    return response_cache.store(cache_key, MakerStatsResponse, response).to_response(request)
+
+
+NEARBY_MAX_RADIUS_KM = 50.0
+
+
+@app.get("/api/makers/nearby", response_model=List[NearbyMakerResponse])
+async def list_nearby_makers(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius: float = Query(5.0, gt=0, le=NEARBY_MAX_RADIUS_KM, description="Search radius in km"),
+    limit: int = PageLimit,
+    db: AsyncSession = Depends(get_db),
+):
+    # Only makers inside the 3x3 block of geohash cells around the point are read (one index
+    # range per cell); exact distances are then computed for that small candidate set.
+    in_cells = or_(
+        *(
+            and_(MakerProfile.geohash >= cell, MakerProfile.geohash < prefix_upper_bound(cell))
+            for cell in covering_cells(lat, lng, radius)
+        )
+    )
+    rows = (
+        await db.execute(
+            select(
+                MakerProfile.maker_id,
+                MakerProfile.name,
+                MakerProfile.location,
+                MakerProfile.latitude,
+                MakerProfile.longitude,
+            ).where(in_cells)
+        )
+    ).all()
+
+    nearby = []
+    for row in rows:
+        distance = haversine_km(lat, lng, row.latitude, row.longitude)
+        if distance <= radius:
+            nearby.append(
+                NearbyMakerResponse(
+                    maker_id=row.maker_id,
+                    name=row.name,
+                    location=row.location,
+                    latitude=row.latitude,
+                    longitude=row.longitude,
+                    distance_km=round(distance, 3),
+                )
+            )
+    nearby.sort(key=lambda maker: (maker.distance_km, maker.maker_id))
+    return nearby[:limit]
+
+
+SEARCH_KINDS = {
+    "meals": (meal_search, MealResponse),
+    "makers": (maker_search, MakerSearchResult),
+}
+
+
+@app.get("/api/search", response_model=Page[MealResponse] | Page[MakerSearchResult])
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Literal["meals", "makers"] = "meals",
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    if engine.dialect.name != "sqlite":
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Search requires the SQLite FTS5 index",
+        )
+
+    # Results are best match first; the "meals"/"makers" namespaces cover every indexed write.
+    cache_key = response_cache.key(request, (kind,))
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        build_query, model = SEARCH_KINDS[kind]
+        try:
+            stmt, keys = build_query(q)
+        except InvalidSearchQueryError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+        rows = (await db.execute(paginate_or_400(stmt, keys, limit, cursor))).all()
+        cached = response_cache.store(cache_key, Page[model], page_of(rows, keys, limit))
+    return cached.to_response(request)
+
+
+@app.post(
+    "/api/meals",
+    response_model=MealResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_meal(
+    payload: MealCreate,
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
+):
     meal = Meal(
-        maker_id=payload.maker_id,
+        maker_id=maker.id,
         title=payload.title,
         description=payload.description,
         price=payload.price,
-        image_data=payload.image_data,
+        image_id=await store_image_or_400(db, payload.image_data),
     )
     db.add(meal)
-    db.flush()
-    db.refresh(meal)
+    await db.flush()
+    await db.refresh(meal)
+    invalidate_on_commit(db, "meals", "makers")
     return meal
 
 
 @app.get("/api/maker/profile", response_model=MakerProfileResponse)
-def get_maker_profile(maker_id: int, db: Session = Depends(get_db)):
-    maker = db.scalar(select(User).where(User.id == maker_id, User.role == "maker"))
+async def get_maker_profile(maker_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    cache_key = response_cache.key(request, (f"maker_profile:{maker_id}",))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+
+    maker = await find_user(db, maker_id, "maker")
     if not maker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Maker not found",
         )
 
-    profile = db.scalar(select(MakerProfile).where(MakerProfile.maker_id == maker_id))
-    if not profile:
-        profile = MakerProfile(
-            maker_id=maker_id,
-            name="Chef's Corner",
-            email=maker.email,
-            phone="+61 3 8652 1453",
-            country="Australia",
-            location="Shop LGSS09, 99 Spencer St, Docklands VIC 3008",
-        )
-        db.add(profile)
-        db.flush()
-        db.refresh(profile)
-
+    profile = await db.scalar(select(MakerProfile).where(MakerProfile.maker_id == maker_id))
+    if profile:
+        return response_cache.store(cache_key, MakerProfileResponse, profile).to_response(request)
+
+    # First visit creates the default profile; it is cached on the next read, after the commit.
+    profile = MakerProfile(
+        maker_id=maker_id,
+        name="Chef's Corner",
+        email=maker.email,
+        phone="+61 3 8652 1453",
+        country="Australia",
+        location="Shop LGSS09, 99 Spencer St, Docklands VIC 3008",
+    )
+    db.add(profile)
+    await db.flush()
+    await db.refresh(profile)
+    invalidate_on_commit(db, "makers")
     return profile
 
 
-@app.put("/api/maker/profile", response_model=MakerProfileResponse)
-def update_maker_profile(payload: MakerProfileRequest, db: Session = Depends(get_db)):
-    maker = db.scalar(select(User).where(User.id == payload.maker_id, User.role == "maker"))
-    if not maker:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Maker not found",
-        )
+def apply_coordinates(profile: MakerProfile, payload: MakerProfileRequest) -> None:
+    # Coordinates are optional on PUT; omitting them keeps the stored position.
+    if "latitude" not in payload.model_fields_set:
+        return
+    profile.latitude = payload.latitude
+    profile.longitude = payload.longitude
+    profile.geohash = (
+        encode_geohash(payload.latitude, payload.longitude) if payload.latitude is not None else None
+    )
+
 
-    profile = db.scalar(select(MakerProfile).where(MakerProfile.maker_id == payload.maker_id))
+@app.put("/api/maker/profile", response_model=MakerProfileResponse)
+async def update_maker_profile(
+    payload: MakerProfileRequest,
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
+):
+    invalidate_on_commit(db, f"maker_profile:{maker.id}", "makers")
+    profile = await db.scalar(select(MakerProfile).where(MakerProfile.maker_id == maker.id))
     if not profile:
         profile = MakerProfile(
-            maker_id=payload.maker_id,
+            maker_id=maker.id,
             name=payload.name,
             email=payload.email,
             phone=payload.phone,
             country=payload.country,
             location=payload.location,
         )
+        apply_coordinates(profile, payload)
         db.add(profile)
-        db.flush()
-        db.refresh(profile)
+        await db.flush()
+        await db.refresh(profile)
         return profile
 
     profile.name = payload.name
@@ -219,29 +788,131 @@ def update_maker_profile(payload: MakerProfileRequest, db: Session = Depends(get
     profile.phone = payload.phone
     profile.country = payload.country
     profile.location = payload.location
-    db.flush()
-    db.refresh(profile)
+    apply_coordinates(profile, payload)
+    await db.flush()
+    await db.refresh(profile)
     return profile
 
 
-@app.get("/api/orders", response_model=List[MakerOrderResponse])
-def list_orders(
-    maker_id: int,
-    status_filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+@app.get("/api/maker/analytics", response_model=MakerAnalyticsResponse)
+async def get_maker_analytics(
+    period: AnalyticsPeriod = "day",
+    buckets: Optional[int] = Query(None, ge=1, le=MAX_BUCKETS),
+    end: Optional[datetime] = None,
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
 ):
-    maker = db.scalar(select(User).where(User.id == maker_id, User.role == "maker"))
-    if not maker:
+    # The window is the `buckets` periods ending with the one holding `end` (default: now).
+    try:
+        bucket_starts = window_buckets(end or datetime.now(timezone.utc), period, buckets or DEFAULT_BUCKETS[period])
+    except ValueError as exc:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Maker not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    first, last = bucket_starts[0], bucket_starts[-1]
+    window = (
+        await db.scalars(
+            select(MakerSalesRollup).where(
+                MakerSalesRollup.maker_id == maker.id,
+                MakerSalesRollup.period == period,
+                MakerSalesRollup.bucket_start.between(first, last),
+            )
         )
+    ).all()
+    totals = (
+        await db.scalars(
+            select(MakerSalesRollup).where(
+                MakerSalesRollup.maker_id == maker.id,
+                MakerSalesRollup.period == TOTAL_PERIOD,
+                MakerSalesRollup.bucket_start == TOTAL_BUCKET,
+            )
+        )
+    ).all()
 
-    stmt = select(MakerOrder).where(MakerOrder.maker_id == maker_id)
-    if status_filter:
-        stmt = stmt.where(MakerOrder.status == status_filter.lower())
-    orders = db.scalars(stmt.order_by(MakerOrder.created_at.desc())).all()
-    return orders
+    rows_by_bucket: dict[datetime, list[MakerSalesRollup]] = {}
+    for row in window:
+        rows_by_bucket.setdefault(bucket_start(row.bucket_start, period), []).append(row)
+    # Empty buckets are filled in, so the series always has one entry per period.
+    series = [{"bucket_start": bucket, **summarize(rows_by_bucket.get(bucket, ()))} for bucket in bucket_starts]
+    return MakerAnalyticsResponse(maker_id=maker.id, period=period, totals=summarize(totals), series=series)
+
+
+@app.get("/api/orders", response_model=Page[MakerOrderResponse] | Page[MakerOrderSummaryResponse])
+async def list_orders(
+    status_filter: Optional[str] = None,
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    view: ListView = "full",
+    include_archived: bool = False,
+    maker: Identity = Depends(require_maker_reader),
+    db: AsyncSession = Depends(get_read_db),
+):
+    def orders(order):
+        stmt = projection(view, order, columns_on(order, ORDER_SUMMARY_COLUMNS)).where(order.maker_id == maker.id)
+        if status_filter:
+            stmt = stmt.where(order.status == status_filter.lower())
+        return stmt
+
+    archived = None
+    if include_archived:
+        archived = (orders(MakerOrderArchive), columns_on(MakerOrderArchive, MAKER_ORDER_PAGE_KEYS))
+    page = await fetch_page(db, view, orders(MakerOrder), MAKER_ORDER_PAGE_KEYS, limit, cursor, archived)
+    model = Page[MakerOrderSummaryResponse] if view == "summary" else Page[MakerOrderResponse]
+    return json_response(model, page)
+
+
+@app.get("/api/orders/export")
+async def export_orders(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    status_filter: Optional[str] = None,
+    include_archived: bool = False,
+    maker: Identity = Depends(require_maker),
+):
+    def orders(order):
+        stmt = select(*columns_on(order, ORDER_EXPORT_COLUMNS)).where(order.maker_id == maker.id)
+        if status_filter:
+            stmt = stmt.where(order.status == status_filter.lower())
+        return created_between(stmt, order.created_at, start, end)
+
+    if include_archived:
+        stmt = with_archived(orders(MakerOrder), orders(MakerOrderArchive), MAKER_ORDER_PAGE_KEYS)
+    else:
+        stmt = orders(MakerOrder).order_by(*MAKER_ORDER_PAGE_KEYS)
+    return export_response(stmt, export_format, f"orders-{maker.id}")
+
+
+@app.post("/api/orders/events/ticket", response_model=StreamTicketResponse)
+async def create_order_events_ticket(user: Identity = Depends(get_current_user)):
+    # EventSource cannot send headers, so the stream is opened with this instead of the access token.
+    return StreamTicketResponse(
+        ticket=create_stream_ticket(user.id, user.role),
+        expires_in=STREAM_TICKET_TTL_SECONDS,
+    )
+
+
+@app.get("/api/orders/events")
+async def stream_order_events(request: Request, user: Identity = Depends(get_stream_user)):
+    topic = maker_topic(user.id) if user.role == "maker" else eater_topic(user.id)
+
+    async def event_stream():
+        async with event_bus.subscribe(topic) as subscription:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(subscription.get(), EVENT_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post(
@@ -249,129 +920,363 @@ def list_orders(
     response_model=MakerOrderResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_order(payload: MakerOrderCreate, db: Session = Depends(get_db)):
-    maker = db.scalar(select(User).where(User.id == payload.maker_id, User.role == "maker"))
+async def create_order(
+    payload: MakerOrderCreate,
+    user: Identity = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    if user.role == "maker" and user.id != payload.maker_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Makers can only create their own orders",
+        )
+
+    maker = await find_user(db, payload.maker_id, "maker")
     if not maker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Maker not found",
         )
 
-    existing = db.scalar(select(MakerOrder).where(MakerOrder.order_code == payload.order_code))
+    # Codes stay unique across archived orders too, so a code always names one order.
+    existing = await db.scalar(
+        union_all(
+            select(MakerOrder.id).where(MakerOrder.order_code == payload.order_code),
+            select(MakerOrderArchive.id).where(MakerOrderArchive.order_code == payload.order_code),
+        ).limit(1)
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Order code already exists",
         )
 
+    if payload.image_id:
+        if await db.get(ImageBlob, payload.image_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Image not found",
+            )
+        image_id = payload.image_id
+    else:
+        image_id = await store_image_or_400(db, payload.image_data)
+
     order = MakerOrder(
         maker_id=payload.maker_id,
         order_code=payload.order_code,
         eater_name=payload.eater_name,
-        eater_id=payload.eater_id,
+        eater_id=user.id if user.role == "eater" else payload.eater_id,
         meal_name=payload.meal_name,
-        image_data=payload.image_data,
+        image_id=image_id,
         price=payload.price,
         order_time=payload.order_time or datetime.now(timezone.utc),
     )
     db.add(order)
-    db.flush()
-    db.refresh(order)
+    await db.flush()
+    await db.refresh(order)
+    deltas = SalesDeltas()
+    deltas.add_order(order)
+    await record_order_sales(db, deltas)
+    publish_order_event(db, ORDER_CREATED, order)
     return order
 
 
+@app.post("/api/orders/bulk", response_model=BulkOrderResponse)
+async def create_orders_bulk(
+    payload: BulkOrderCreate,
+    user: Identity = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    items = payload.orders
+    errors: dict[int, str] = {}
+
+    # Each lookup is one set-based query for the whole batch.
+    maker_ids = {item.maker_id for item in items}
+    known_makers = set(
+        (await db.scalars(select(User.id).where(User.id.in_(maker_ids), User.role == "maker"))).all()
+    )
+    codes = {item.order_code for item in items}
+    taken_codes = set(
+        (
+            await db.scalars(
+                union_all(
+                    select(MakerOrder.order_code).where(MakerOrder.order_code.in_(codes)),
+                    select(MakerOrderArchive.order_code).where(MakerOrderArchive.order_code.in_(codes)),
+                )
+            )
+        ).all()
+    )
+    image_ids = {item.image_id for item in items if item.image_id}
+    known_images = set()
+    if image_ids:
+        known_images = set((await db.scalars(select(ImageBlob.id).where(ImageBlob.id.in_(image_ids)))).all())
+
+    # A code is only claimed by an item that passed every check, so a rejected item never
+    # makes a later valid one with the same code look like a duplicate.
+    batch_codes = set()
+    stored_images: dict[str, str] = {}
+    rows = []
+    row_indexes = []
+    now = datetime.now(timezone.utc)
+    for index, item in enumerate(items):
+        if user.role == "maker" and item.maker_id != user.id:
+            errors[index] = "Makers can only create their own orders"
+        elif item.maker_id not in known_makers:
+            errors[index] = "Maker not found"
+        elif item.order_code in taken_codes:
+            errors[index] = "Order code already exists"
+        elif item.order_code in batch_codes:
+            errors[index] = "Duplicate order code in batch"
+        elif item.image_id and item.image_id not in known_images:
+            errors[index] = "Image not found"
+        if index in errors:
+            continue
+        image_id = item.image_id
+        if not image_id:
+            if item.image_data not in stored_images:
+                try:
+                    stored_images[item.image_data] = await store_image_async(db, item.image_data)
+                except InvalidImageError as exc:
+                    errors[index] = str(exc)
+                    continue
+            image_id = stored_images[item.image_data]
+        batch_codes.add(item.order_code)
+        rows.append(
+            {
+                "maker_id": item.maker_id,
+                "order_code": item.order_code,
+                "eater_name": item.eater_name,
+                "eater_id": user.id if user.role == "eater" else item.eater_id,
+                "meal_name": item.meal_name,
+                "image_id": image_id,
+                "price": item.price,
+                "order_time": item.order_time or now,
+            }
+        )
+        row_indexes.append(index)
+
+    created = []
+    if rows:
+        try:
+            # executemany INSERT ... RETURNING, sent as multi-row VALUES batches (insertmanyvalues).
+            # RETURNING order is not guaranteed, so results are matched back by order_code.
+            created = (await db.scalars(insert(MakerOrder).returning(MakerOrder), rows)).all()
+        except IntegrityError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Order codes were taken by a concurrent request; retry the batch",
+            ) from exc
+
+    created_by_code = {order.order_code: order for order in created}
+    orders_by_index = {index: created_by_code[items[index].order_code] for index in row_indexes}
+    deltas = SalesDeltas()
+    for order in created:
+        deltas.add_order(order)
+        publish_order_event(db, ORDER_CREATED, order)
+    await record_order_sales(db, deltas)
+
+    results = []
+    for index in range(len(items)):
+        order = orders_by_index.get(index)
+        results.append(
+            BulkOrderResult(
+                index=index,
+                ok=order is not None,
+                order=MakerOrderResponse.model_validate(order) if order is not None else None,
+                error=errors.get(index),
+            )
+        )
+    return BulkOrderResponse(created=len(created), failed=len(items) - len(created), results=results)
+
+
+# Registered before /api/orders/{order_id} so "status" is not parsed as an order id.
+@app.patch("/api/orders/status", response_model=BulkOrderStatusResponse)
+async def update_orders_status(
+    payload: BulkOrderStatusUpdate,
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
+):
+    stmt = update(MakerOrder).where(MakerOrder.maker_id == maker.id)
+    previous_statuses: dict[int, str] = {}
+    if payload.order_ids is not None:
+        stmt = stmt.where(MakerOrder.id.in_(payload.order_ids))
+        if payload.from_status is None:
+            # RETURNING only has the new status; the sales rollups also need the old one.
+            previous_statuses = dict(
+                (
+                    await db.execute(
+                        select(MakerOrder.id, MakerOrder.status)
+                        .where(MakerOrder.maker_id == maker.id, MakerOrder.id.in_(payload.order_ids))
+                        .with_for_update()
+                    )
+                ).all()
+            )
+    if payload.from_status is not None:
+        stmt = stmt.where(MakerOrder.status == payload.from_status)
+    updated = (
+        await db.scalars(
+            stmt.values(status=payload.status).returning(MakerOrder),
+            execution_options={"synchronize_session": False},
+        )
+    ).all()
+    deltas = SalesDeltas()
+    for order in updated:
+        deltas.move_order(order, previous_statuses.get(order.id, payload.from_status))
+        publish_order_event(db, ORDER_STATUS_CHANGED, order)
+    await record_order_sales(db, deltas)
+
+    if payload.order_ids is None:
+        order_ids = [order.id for order in updated]
+    else:
+        order_ids = list(dict.fromkeys(payload.order_ids))
+    updated_by_id = {order.id: order for order in updated}
+    missing = "Order not found" + (f" or not {payload.from_status}" if payload.from_status else "")
+    results = []
+    for order_id in order_ids:
+        order = updated_by_id.get(order_id)
+        results.append(
+            BulkOrderStatusResult(
+                order_id=order_id,
+                ok=order is not None,
+                order=MakerOrderResponse.model_validate(order) if order is not None else None,
+                error=None if order is not None else missing,
+            )
+        )
+    return BulkOrderStatusResponse(
+        updated=len(updated),
+        failed=len(results) - len(updated),
+        results=results,
+    )
+
+
 @app.patch("/api/orders/{order_id}", response_model=MakerOrderResponse)
-def update_order_status(
+async def update_order_status(
     order_id: int,
     payload: MakerOrderUpdate,
-    db: Session = Depends(get_db),
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
 ):
-    order = db.get(MakerOrder, order_id)
-    if not order:
+    order = await db.get(MakerOrder, order_id, with_for_update=True)
+    if not order or order.maker_id != maker.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found",
         )
 
+    previous_status = order.status
     order.status = payload.status
-    db.flush()
-    db.refresh(order)
+    await db.flush()
+    await db.refresh(order)
+    deltas = SalesDeltas()
+    deltas.move_order(order, previous_status)
+    await record_order_sales(db, deltas)
+    publish_order_event(db, ORDER_STATUS_CHANGED, order)
     return order
 
 
-@app.get("/api/eater/orders", response_model=List[EaterOrderResponse])
-def list_eater_orders(
-    eater_id: int,
+@app.get("/api/eater/orders", response_model=Page[EaterOrderResponse] | Page[MakerOrderSummaryResponse])
+async def list_eater_orders(
     status_filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    view: ListView = "full",
+    include_archived: bool = False,
+    eater: Identity = Depends(require_eater_reader),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    eater = db.scalar(select(User).where(User.id == eater_id, User.role == "eater"))
-    if not eater:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Eater not found",
-        )
-
-    stmt = select(MakerOrder).where(MakerOrder.eater_id == eater_id)
-    if status_filter:
-        stmt = stmt.where(MakerOrder.status == status_filter.lower())
-    orders = db.scalars(stmt.order_by(MakerOrder.order_time.desc())).all()
-
-    order_ids = [order.id for order in orders]
-    review_map = {}
-    if order_ids:
-        reviews = db.scalars(
-            select(MakerReview).where(MakerReview.order_id.in_(order_ids))
-        ).all()
-        review_map = {review.order_id: review for review in reviews}
-
-    eater_orders: List[EaterOrderResponse] = []
-    for order in orders:
-        review = review_map.get(order.id)
-        snippet = (
-            ReviewSnippet(
-                review_id=review.id,
-                rating=review.rating,
-                comment=review.comment,
-                reply=review.reply,
+    def eater_orders(order, review):
+        if view == "summary":
+            # Summaries skip the review join entirely.
+            stmt = select(*columns_on(order, ORDER_SUMMARY_COLUMNS))
+        else:
+            # One page of orders walked along (eater_id, order_time, id), each LEFT OUTER JOINed
+            # to its review through the unique order_id index.
+            stmt = select(*columns_on(order, EATER_ORDER_COLUMNS), *order_review_columns(review)).outerjoin(
+                review, review.order_id == order.id
             )
-            if review
-            else None
-        )
-        eater_orders.append(
-            EaterOrderResponse(
-                id=order.id,
-                maker_id=order.maker_id,
-                eater_id=order.eater_id,
-                order_code=order.order_code,
-                eater_name=order.eater_name,
-                meal_name=order.meal_name,
-                image_data=order.image_data,
-                price=order.price,
-                order_time=order.order_time,
-                status=order.status,
-                review=snippet,
-            )
-        )
-
-    return eater_orders
-
+        stmt = stmt.where(order.eater_id == eater.id)
+        if status_filter:
+            stmt = stmt.where(order.status == status_filter.lower())
+        return paginate_or_400(stmt, columns_on(order, EATER_ORDER_PAGE_KEYS), limit, cursor)
+
+    rows = (await db.execute(eater_orders(MakerOrder, MakerReview))).all()
+    if include_archived:
+        archived_rows = (await db.execute(eater_orders(MakerOrderArchive, MakerReviewArchive))).all()
+        rows = merge_pages((rows, archived_rows), EATER_ORDER_PAGE_KEYS)
+    page = page_of(rows, EATER_ORDER_PAGE_KEYS, limit)
+    if view == "summary":
+        return json_response(Page[MakerOrderSummaryResponse], page)
+
+    # Plain dicts over the joined rows; serialization encodes them without re-validating.
+    eater_orders = [
+        {
+            **row._mapping,
+            "review": (
+                {
+                    "review_id": row.review_id,
+                    "rating": row.review_rating,
+                    "comment": row.review_comment,
+                    "reply": row.review_reply,
+                }
+                if row.review_id is not None
+                else None
+            ),
+        }
+        for row in page["items"]
+    ]
+    return json_response(Page[EaterOrderResponse], {"items": eater_orders, "next_cursor": page["next_cursor"]})
+
+
+@app.get("/api/reviews", response_model=Page[MakerReviewResponse] | Page[MakerReviewSummaryResponse])
+async def list_reviews(
+    request: Request,
+    maker_id: int,
+    limit: int = PageLimit,
+    cursor: Optional[str] = None,
+    view: ListView = "full",
+    include_archived: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+):
+    cache_key = response_cache.key(request, (f"reviews:{maker_id}",))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
 
-@app.get("/api/reviews", response_model=List[MakerReviewResponse])
-def list_reviews(maker_id: int, db: Session = Depends(get_db)):
-    maker = db.scalar(select(User).where(User.id == maker_id, User.role == "maker"))
+    maker = await find_user(db, maker_id, "maker")
     if not maker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Maker not found",
         )
 
-    reviews = db.scalars(
-        select(MakerReview)
-        .where(MakerReview.maker_id == maker_id)
-        .order_by(MakerReview.created_at.desc())
-    ).all()
-    return reviews
+    def reviews(review):
+        return projection(view, review, columns_on(review, REVIEW_SUMMARY_COLUMNS)).where(review.maker_id == maker_id)
+
+    archived = None
+    if include_archived:
+        archived = (reviews(MakerReviewArchive), columns_on(MakerReviewArchive, REVIEW_PAGE_KEYS))
+    page = await fetch_page(db, view, reviews(MakerReview), REVIEW_PAGE_KEYS, limit, cursor, archived)
+    model = Page[MakerReviewSummaryResponse] if view == "summary" else Page[MakerReviewResponse]
+    return response_cache.store(cache_key, model, page).to_response(request)
+
+
+@app.get("/api/reviews/export")
+async def export_reviews(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    include_archived: bool = False,
+    maker: Identity = Depends(require_maker),
+):
+    def reviews(review):
+        stmt = select(*columns_on(review, REVIEW_EXPORT_COLUMNS)).where(review.maker_id == maker.id)
+        return created_between(stmt, review.created_at, start, end)
+
+    if include_archived:
+        stmt = with_archived(reviews(MakerReview), reviews(MakerReviewArchive), REVIEW_PAGE_KEYS)
+    else:
+        stmt = reviews(MakerReview).order_by(*REVIEW_PAGE_KEYS)
+    return export_response(stmt, export_format, f"reviews-{maker.id}")
 
 
 @app.post(
@@ -379,21 +1284,19 @@ def list_reviews(maker_id: int, db: Session = Depends(get_db)):
     response_model=MakerReviewResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_review(payload: MakerReviewCreate, db: Session = Depends(get_db)):
-    order = db.get(MakerOrder, payload.order_id)
-    if not order:
+async def create_review(
+    payload: MakerReviewCreate,
+    eater: Identity = Depends(require_eater),
+    db: AsyncSession = Depends(get_db),
+):
+    order = await db.get(MakerOrder, payload.order_id)
+    if not order or order.eater_id != eater.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found",
         )
 
-    if order.eater_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Order is not associated with an eater",
-        )
-
-    existing = db.scalar(select(MakerReview).where(MakerReview.order_id == order.id))
+    existing = await db.scalar(select(MakerReview).where(MakerReview.order_id == order.id))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -407,86 +1310,83 @@ def create_review(payload: MakerReviewCreate, db: Session = Depends(get_db)):
         order_code=order.order_code,
         eater_name=order.eater_name,
         meal_name=order.meal_name,
-        image_data=order.image_data,
+        image_id=order.image_id,
         rating=payload.rating,
         comment=payload.comment,
     )
     db.add(review)
-    db.flush()
-    db.refresh(review)
+    await db.flush()
+    await db.refresh(review)
+    await db.execute(record_review(engine.dialect.name, review.maker_id, review.rating, review.created_at))
+    invalidate_on_commit(db, f"reviews:{review.maker_id}", "makers")
     return review
 
 
 @app.patch("/api/reviews/{review_id}", response_model=MakerReviewResponse)
-def update_review_reply(
+async def update_review_reply(
     review_id: int,
     payload: MakerReviewUpdate,
-    db: Session = Depends(get_db),
+    maker: Identity = Depends(require_maker),
+    db: AsyncSession = Depends(get_db),
 ):
-    review = db.get(MakerReview, review_id)
-    if not review:
+    review = await db.get(MakerReview, review_id)
+    if not review or review.maker_id != maker.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Review not found",
         )
 
     review.reply = payload.reply
-    db.flush()
-    db.refresh(review)
+    await db.flush()
+    await db.refresh(review)
+    invalidate_on_commit(db, f"reviews:{review.maker_id}")
     return review
 
 
 @app.get("/api/eater/profile", response_model=EaterProfileResponse)
-def get_eater_profile(eater_id: int, db: Session = Depends(get_db)):
-    eater = db.scalar(select(User).where(User.id == eater_id, User.role == "eater"))
-    if not eater:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Eater not found",
-        )
-
-    profile = db.scalar(select(EaterProfile).where(EaterProfile.eater_id == eater_id))
+async def get_eater_profile(
+    eater: Identity = Depends(require_eater),
+    db: AsyncSession = Depends(get_db),
+):
+    profile = await db.scalar(select(EaterProfile).where(EaterProfile.eater_id == eater.id))
     if not profile:
         profile = EaterProfile(
-            eater_id=eater_id,
+            eater_id=eater.id,
             display_name=eater.email.split("@")[0],
             phone=None,
             favorite_cuisine=None,
             note=None,
         )
         db.add(profile)
-        db.flush()
-        db.refresh(profile)
+        await db.flush()
+        await db.refresh(profile)
     return profile
 
 
 @app.put("/api/eater/profile", response_model=EaterProfileResponse)
-def update_eater_profile(payload: EaterProfileRequest, db: Session = Depends(get_db)):
-    eater = db.scalar(select(User).where(User.id == payload.eater_id, User.role == "eater"))
-    if not eater:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Eater not found",
-        )
-
-    profile = db.scalar(select(EaterProfile).where(EaterProfile.eater_id == payload.eater_id))
+async def update_eater_profile(
+    payload: EaterProfileRequest,
+    eater: Identity = Depends(require_eater),
+    db: AsyncSession = Depends(get_db),
+):
+    profile = await db.scalar(select(EaterProfile).where(EaterProfile.eater_id == eater.id))
     if not profile:
         profile = EaterProfile(
-            eater_id=payload.eater_id,
+            eater_id=eater.id,
             display_name=payload.display_name,
             phone=payload.phone,
             favorite_cuisine=payload.favorite_cuisine,
             note=payload.note,
         )
         db.add(profile)
-        db.flush()
-        db.refresh(profile)
+        await db.flush()
+        await db.refresh(profile)
         return profile
 
     profile.display_name = payload.display_name
     profile.phone = payload.phone
     profile.favorite_cuisine = payload.favorite_cuisine
     profile.note = payload.note
-    db.flush()
-    db.refresh(profile)
+    await db.flush()
+    await db.refresh(profile)
     return profile
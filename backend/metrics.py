@@ -0,0 +1,251 @@
+import cProfile
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import PROFILE_DIR, PROFILE_EVERY_N_REQUESTS, SLOW_QUERY_MS
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Statements per request; a route that keeps landing in the high buckets has an N+1.
+STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+QUERY_START_KEY = "metrics.query_start"
+
+
+@dataclass
+class RequestStats:
+    path: str
+    statements: int = 0
+    db_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    response_bytes: int = 0
+
+
+# Set per request by MetricsMiddleware; the threadpool and SQLAlchemy's greenlets inherit
+# the context, so hooks running there update the same object.
+current_stats: ContextVar[RequestStats | None] = ContextVar("current_stats", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+@dataclass
+class RouteMetrics:
+    statuses: Counter = field(default_factory=Counter)
+    duration: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS))
+    statements: Histogram = field(default_factory=lambda: Histogram(STATEMENT_BUCKETS))
+    db_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    response_bytes: int = 0
+
+
+def label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Per-process aggregates rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+        self.slow_queries = 0
+
+    def observe(self, method: str, route: str, status: int, duration: float, stats: RequestStats) -> None:
+        with self._lock:
+            metrics = self._routes.setdefault((method, route), RouteMetrics())
+            metrics.statuses[status] += 1
+            metrics.duration.observe(duration)
+            metrics.statements.observe(stats.statements)
+            metrics.db_seconds += stats.db_seconds
+            metrics.serialize_seconds += stats.serialize_seconds
+            metrics.response_bytes += stats.response_bytes
+
+    def record_slow_query(self) -> None:
+        with self._lock:
+            self.slow_queries += 1
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = []
+
+            def header(name: str, kind: str, help_text: str) -> None:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+            def labels(method: str, route: str, **extra: str) -> str:
+                pairs = {"method": method, "route": route, **extra}
+                return ",".join(f'{key}="{label_value(str(value))}"' for key, value in pairs.items())
+
+            def histogram(name: str, help_text: str, attr: str) -> None:
+                header(name, "histogram", help_text)
+                for (method, route), metrics in routes:
+                    hist = getattr(metrics, attr)
+                    for bound, observed in zip(hist.buckets, hist.counts):
+                        lines.append(f"{name}_bucket{{{labels(method, route, le=bound)}}} {observed}")
+                    lines.append(f'{name}_bucket{{{labels(method, route, le="+Inf")}}} {hist.count}')
+                    lines.append(f"{name}_sum{{{labels(method, route)}}} {hist.sum}")
+                    lines.append(f"{name}_count{{{labels(method, route)}}} {hist.count}")
+
+            def counter(name: str, help_text: str, attr: str) -> None:
+                header(name, "counter", help_text)
+                for (method, route), metrics in routes:
+                    lines.append(f"{name}{{{labels(method, route)}}} {getattr(metrics, attr)}")
+
+            header("aussieeat_http_requests_total", "counter", "Requests served, by route and status.")
+            for (method, route), metrics in routes:
+                for status, total in sorted(metrics.statuses.items()):
+                    lines.append(f"aussieeat_http_requests_total{{{labels(method, route, status=status)}}} {total}")
+            histogram("aussieeat_http_request_duration_seconds", "Request latency.", "duration")
+            histogram("aussieeat_db_statements_per_request", "SQL statements executed per request.", "statements")
+            counter("aussieeat_db_seconds_total", "Time spent executing SQL.", "db_seconds")
+            counter("aussieeat_serialize_seconds_total", "Time spent serializing response bodies.", "serialize_seconds")
+            counter("aussieeat_response_bytes_total", "Response body bytes sent.", "response_bytes")
+            header("aussieeat_slow_queries_total", "counter", f"Statements slower than {SLOW_QUERY_MS:g} ms.")
+            lines.append(f"aussieeat_slow_queries_total {self.slow_queries}")
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+# Start times are keyed by execution context, not stacked, so a statement that fails (and
+# never reaches after_cursor_execute) cannot leave an entry that a later statement pops.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(QUERY_START_KEY, {})[context] = time.perf_counter()
+
+
+def _handle_error(exception_context):
+    if exception_context.connection is not None:
+        exception_context.connection.info.get(QUERY_START_KEY, {}).pop(exception_context.execution_context, None)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info[QUERY_START_KEY].pop(context)
+    stats = current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        metrics_registry.record_slow_query()
+        logger.warning(
+            "Slow query (%.1f ms) during %s: %s",
+            elapsed * 1000,
+            stats.path if stats else "-",
+            statement,
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def timed_serialization():
+    stats = current_stats.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialize_seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """ASGI middleware that records per-route metrics and samples requests with cProfile.
+
+    The profiler follows the event loop thread, so a sampled profile also contains
+    whatever other requests ran on the loop meanwhile; only one request is profiled at a time.
+    """
+
+    def __init__(
+        self,
+        app,
+        registry: MetricsRegistry = metrics_registry,
+        profile_every: int = PROFILE_EVERY_N_REQUESTS,
+        profile_dir: str = PROFILE_DIR,
+    ):
+        self.app = app
+        self.registry = registry
+        self.profile_every = profile_every
+        self.profile_dir = Path(profile_dir)
+        self._requests = count(1)
+        self._profiling = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(path=scope["path"])
+        token = current_stats.set(stats)
+        status_code = 500
+
+        async def send_with_metrics(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                stats.response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        profiler = self._start_profiler()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            duration = time.perf_counter() - started
+            if profiler is not None:
+                profiler.disable()
+            current_stats.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self.registry.observe(scope["method"], route, status_code, duration, stats)
+            if profiler is not None:
+                self._dump_profile(profiler, scope["method"], route, duration)
+
+    def _start_profiler(self) -> cProfile.Profile | None:
+        if self.profile_every <= 0 or next(self._requests) % self.profile_every or self._profiling:
+            return None
+        self._profiling = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _dump_profile(self, profiler: cProfile.Profile, method: str, route: str, duration: float) -> None:
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+            path = self.profile_dir / f"{int(time.time() * 1000)}-{method}-{slug}.prof"
+            profiler.dump_stats(path)
+            logger.info("Profiled %s %s (%.1f ms) -> %s", method, route, duration * 1000, path)
+        finally:
+            self._profiling = False
@@ -0,0 +1,57 @@
+"""Alembic migrations for the application schema.
+
+    python -m backend.cli migrate                                  # upgrade to the latest revision
+    alembic -c backend/alembic.ini revision --autogenerate -m "..."  # draft a new revision
+"""
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(bind: Engine) -> str | None:
+    with bind.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def upgrade_database(bind: Engine, revision: str = "head") -> None:
+    config = alembic_config()
+    with bind.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def downgrade_database(bind: Engine, revision: str) -> None:
+    config = alembic_config()
+    with bind.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, revision)
+
+
+def check_database_revision(bind: Engine) -> None:
+    """Fail fast when the database is not at the latest revision (one indexed read, no DDL)."""
+    current, head = current_revision(bind), head_revision()
+    if current != head:
+        raise SchemaOutOfDateError(
+            f"Database schema is at {current or 'no revision'}, expected {head}; "
+            "run `python -m backend.cli migrate` first"
+        )
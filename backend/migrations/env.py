@@ -0,0 +1,47 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+from backend import models  # noqa: F401  (registers every table on Base.metadata)
+from backend.database import Base, engine
+from backend.search import SEARCH_INDEXES
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# FTS5 virtual tables (and the shadow tables SQLite creates for them) are managed by the
+# revisions directly, so autogenerate must not propose dropping them.
+SEARCH_TABLE_PREFIXES = tuple(index["name"] for index in SEARCH_INDEXES)
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    return not (type_ == "table" and reflected and compare_to is None and name.startswith(SEARCH_TABLE_PREFIXES))
+
+
+def configure(**options) -> None:
+    context.configure(
+        target_metadata=Base.metadata,
+        include_object=include_object,
+        # SQLite cannot ALTER most constraints; batch mode rebuilds the table instead.
+        render_as_batch=True,
+        **options,
+    )
+
+
+if context.is_offline_mode():
+    configure(url=engine.url, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+else:
+    # backend.migrations.upgrade_database() hands over its connection; the alembic CLI does not.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+    else:
+        with engine.begin() as connection:
+            configure(connection=connection)
+            with context.begin_transaction():
+                context.run_migrations()
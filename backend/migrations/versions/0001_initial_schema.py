@@ -0,0 +1,191 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+The schema as it was before migrations existed, when create_all built it at startup:
+images inline as base64 text, no search, location or aggregate tables. A database from
+that version is adopted in place by `migrate`, and the later revisions bring it forward.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Every column create_all produced, per table, for checking a database before adopting it.
+BASELINE_COLUMNS = {
+    "users": {"id", "email", "password_hash", "role", "created_at"},
+    "meals": {"id", "maker_id", "title", "description", "price", "image_data", "created_at"},
+    "maker_profiles": {"id", "maker_id", "name", "email", "phone", "country", "location", "updated_at"},
+    "maker_orders": {
+        "id",
+        "maker_id",
+        "order_code",
+        "eater_name",
+        "meal_name",
+        "image_data",
+        "price",
+        "order_time",
+        "status",
+        "eater_id",
+        "created_at",
+        "updated_at",
+    },
+    "maker_reviews": {
+        "id",
+        "maker_id",
+        "order_id",
+        "order_code",
+        "eater_name",
+        "eater_id",
+        "meal_name",
+        "image_data",
+        "rating",
+        "comment",
+        "reply",
+        "created_at",
+        "updated_at",
+    },
+    "eater_profiles": {"id", "eater_id", "display_name", "phone", "favorite_cuisine", "note", "updated_at"},
+}
+TABLES = tuple(BASELINE_COLUMNS)
+
+
+def timestamp(name: str, **kwargs) -> sa.Column:
+    return sa.Column(name, sa.DateTime(timezone=True), server_default=sa.func.now(), **kwargs)
+
+
+def create_tables() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+        timestamp("created_at"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "meals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("title", sa.String(120), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("image_data", sa.Text(), nullable=False),
+        timestamp("created_at"),
+    )
+    op.create_index("ix_meals_id", "meals", ["id"])
+
+    op.create_table(
+        "maker_profiles",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
+        ),
+        sa.Column("name", sa.String(120), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("phone", sa.String(64), nullable=False),
+        sa.Column("country", sa.String(64), nullable=False),
+        sa.Column("location", sa.Text(), nullable=False),
+        timestamp("updated_at"),
+    )
+    op.create_index("ix_maker_profiles_id", "maker_profiles", ["id"])
+
+    op.create_table(
+        "maker_orders",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("order_code", sa.String(32), nullable=False, unique=True),
+        sa.Column("eater_name", sa.String(120), nullable=False),
+        sa.Column("meal_name", sa.String(120), nullable=False),
+        sa.Column("image_data", sa.Text(), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        timestamp("order_time", nullable=False),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("eater_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+        timestamp("created_at"),
+        timestamp("updated_at"),
+    )
+    op.create_index("ix_maker_orders_id", "maker_orders", ["id"])
+    op.create_index("ix_maker_orders_maker_id", "maker_orders", ["maker_id"])
+    op.create_index("ix_maker_orders_eater_id", "maker_orders", ["eater_id"])
+
+    op.create_table(
+        "maker_reviews",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column(
+            "order_id",
+            sa.Integer(),
+            sa.ForeignKey("maker_orders.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("order_code", sa.String(32), nullable=False),
+        sa.Column("eater_name", sa.String(120), nullable=False),
+        sa.Column("eater_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("meal_name", sa.String(120), nullable=False),
+        sa.Column("image_data", sa.Text(), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=False),
+        sa.Column("reply", sa.Text(), nullable=True),
+        timestamp("created_at"),
+        timestamp("updated_at"),
+    )
+    op.create_index("ix_maker_reviews_id", "maker_reviews", ["id"])
+    op.create_index("ix_maker_reviews_maker_id", "maker_reviews", ["maker_id"])
+
+    op.create_table(
+        "eater_profiles",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "eater_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
+        ),
+        sa.Column("display_name", sa.String(120), nullable=False),
+        sa.Column("phone", sa.String(64), nullable=True),
+        sa.Column("favorite_cuisine", sa.String(120), nullable=True),
+        sa.Column("note", sa.Text(), nullable=True),
+        timestamp("updated_at"),
+    )
+    op.create_index("ix_eater_profiles_id", "eater_profiles", ["id"])
+
+
+def check_adoptable(inspector) -> None:
+    """Refuse to adopt tables that are not exactly the pre-migration schema."""
+    mismatched = []
+    for table, expected in BASELINE_COLUMNS.items():
+        found = {column["name"] for column in inspector.get_columns(table)}
+        if found != expected:
+            mismatched.append(f"{table} ({', '.join(sorted(found ^ expected))})")
+    if mismatched:
+        raise RuntimeError(
+            "Database tables differ from the schema migrations start from, in columns of "
+            f"{'; '.join(mismatched)}; recreate it or bring those tables in line before migrating"
+        )
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+    if existing.issuperset(TABLES):
+        # Created by create_all before migrations existed: adopt it as is.
+        check_adoptable(inspector)
+    elif existing & set(TABLES):
+        raise RuntimeError(
+            f"Database has only some application tables ({', '.join(sorted(existing & set(TABLES)))}); "
+            "recreate it or create the missing tables before migrating"
+        )
+    else:
+        create_tables()
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_table(table)
@@ -0,0 +1,174 @@
+"""Content-addressed images
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+Moves images out of the meal, order and review rows into images (one row per distinct
+upload, keyed by the SHA-256 of its bytes, as new uploads are) plus image_variants for
+their thumbnails, and replaces each inline image_data column with an image_id foreign key.
+
+Stored images are decoded and kept byte for byte; values that do not decode are kept as
+their text so nothing is lost. Run `python -m backend.cli build-thumbnails` afterwards to
+render the thumbnail sizes. Downgrading turns every image back into an inline data URL.
+"""
+import base64
+import io
+
+from alembic import op
+import sqlalchemy as sa
+from PIL import Image, UnidentifiedImageError
+
+from backend.images import (
+    CONTENT_TYPES,
+    DATA_URL_PATTERN,
+    InvalidImageError,
+    content_hash,
+    decode_image_data,
+    served_content_type,
+)
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+IMAGE_TABLES = ("meals", "maker_orders", "maker_reviews")
+BATCH_SIZE = 500
+
+images = sa.table(
+    "images",
+    sa.column("id", sa.String(64)),
+    sa.column("content_type", sa.String(64)),
+    sa.column("size", sa.Integer()),
+    sa.column("data", sa.LargeBinary()),
+)
+
+
+def image_rows_table(name: str) -> sa.TableClause:
+    return sa.table(name, sa.column("id", sa.Integer()), sa.column("image_data", sa.Text()), sa.column("image_id"))
+
+
+def foreign_key_name(table: str) -> str:
+    return f"fk_{table}_image_id_images"
+
+
+def sniff_content_type(raw: bytes, declared: str | None) -> str:
+    try:
+        with Image.open(io.BytesIO(raw)) as image:
+            if image.format in CONTENT_TYPES:
+                return CONTENT_TYPES[image.format]
+    except (UnidentifiedImageError, OSError, ValueError, SyntaxError):
+        pass
+    # The declared type is only trusted when it is an image type uploads could have produced.
+    return served_content_type(declared or "")
+
+
+def inline_image(image_data: str) -> tuple[str, dict]:
+    """The images row for an inline value, keyed like decode_upload() keys a new upload."""
+    match = DATA_URL_PATTERN.match(image_data.strip())
+    declared = match.group("content_type") if match else None
+    try:
+        raw = decode_image_data(image_data)
+    except InvalidImageError:
+        raw = image_data.encode()
+        declared = None
+    image_id = content_hash(raw)
+    return image_id, {
+        "id": image_id,
+        "content_type": sniff_content_type(raw, declared)[:64],
+        "size": len(raw),
+        "data": raw,
+    }
+
+
+def batches(bind, table: sa.TableClause, *columns, source=None):
+    """Rows of table in keyset batches of BATCH_SIZE, with columns read from source (a join)."""
+    stmt = sa.select(table.c.id, *columns).select_from(table if source is None else source)
+    last_id = 0
+    while True:
+        rows = bind.execute(stmt.where(table.c.id > last_id).order_by(table.c.id).limit(BATCH_SIZE)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def move_inline_images(bind) -> None:
+    stored: set[str] = set()
+    for name in IMAGE_TABLES:
+        table = image_rows_table(name)
+        assign = table.update().where(table.c.id == sa.bindparam("row_id")).values(image_id=sa.bindparam("new_id"))
+        for rows in batches(bind, table, table.c.image_data):
+            new_images, assignments = [], []
+            for row in rows:
+                image_id, image = inline_image(row.image_data)
+                if image_id not in stored:
+                    stored.add(image_id)
+                    new_images.append(image)
+                assignments.append({"row_id": row.id, "new_id": image_id})
+            if new_images:
+                bind.execute(images.insert(), new_images)
+            bind.execute(assign, assignments)
+
+
+def restore_inline_images(bind) -> None:
+    for name in IMAGE_TABLES:
+        table = image_rows_table(name)
+        assign = table.update().where(table.c.id == sa.bindparam("row_id")).values(
+            image_data=sa.bindparam("new_data")
+        )
+        source = table.join(images, images.c.id == table.c.image_id)
+        for rows in batches(bind, table, images.c.content_type, images.c.data, source=source):
+            bind.execute(
+                assign,
+                [
+                    {
+                        "row_id": row.id,
+                        "new_data": f"data:{row.content_type};base64,{base64.b64encode(row.data).decode()}",
+                    }
+                    for row in rows
+                ],
+            )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "images",
+        sa.Column("id", sa.String(64), primary_key=True),
+        sa.Column("content_type", sa.String(64), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "image_variants",
+        sa.Column("image_id", sa.String(64), sa.ForeignKey("images.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("variant", sa.String(16), primary_key=True),
+        sa.Column("content_type", sa.String(64), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("height", sa.Integer(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+    )
+    for table in IMAGE_TABLES:
+        op.add_column(table, sa.Column("image_id", sa.String(64), nullable=True))
+    move_inline_images(op.get_bind())
+    for table in IMAGE_TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column("image_id", existing_type=sa.String(64), nullable=False)
+            batch.create_foreign_key(foreign_key_name(table), "images", ["image_id"], ["id"])
+            batch.drop_column("image_data")
+
+
+def downgrade() -> None:
+    for table in IMAGE_TABLES:
+        op.add_column(table, sa.Column("image_data", sa.Text(), nullable=True))
+    restore_inline_images(op.get_bind())
+    for table in IMAGE_TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column("image_data", existing_type=sa.Text(), nullable=False)
+            batch.drop_constraint(foreign_key_name(table), type_="foreignkey")
+            batch.drop_column("image_id")
+    op.drop_table("image_variants")
+    op.drop_table("images")
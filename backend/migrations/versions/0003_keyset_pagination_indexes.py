@@ -0,0 +1,46 @@
+"""Keyset pagination indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Composite indexes in the order each list endpoint walks its pages, newest first:
+meals overall and per maker, a maker's orders (also by status, for status-filtered lists,
+exports and bulk status updates), an eater's orders by order time and a maker's reviews.
+They lead with maker_id/eater_id, so the single-column indexes on those are dropped;
+that saves a B-tree update on every order and review write.
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+PAGE_INDEXES = (
+    ("ix_meals_created_at_id", "meals", ["created_at", "id"]),
+    ("ix_meals_maker_id_created_at_id", "meals", ["maker_id", "created_at", "id"]),
+    ("ix_maker_orders_maker_id_created_at_id", "maker_orders", ["maker_id", "created_at", "id"]),
+    ("ix_maker_orders_maker_id_status_created_at_id", "maker_orders", ["maker_id", "status", "created_at", "id"]),
+    ("ix_maker_orders_eater_id_order_time_id", "maker_orders", ["eater_id", "order_time", "id"]),
+    ("ix_maker_reviews_maker_id_created_at_id", "maker_reviews", ["maker_id", "created_at", "id"]),
+)
+REDUNDANT_INDEXES = (
+    ("ix_maker_orders_maker_id", "maker_orders", ["maker_id"]),
+    ("ix_maker_orders_eater_id", "maker_orders", ["eater_id"]),
+    ("ix_maker_reviews_maker_id", "maker_reviews", ["maker_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in PAGE_INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in reversed(PAGE_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,31 @@
+"""Maker locations
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+Adds latitude, longitude and an indexed geohash to maker_profiles for
+GET /api/makers/nearby. Existing makers have none until they save their profile again.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("maker_profiles", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column("maker_profiles", sa.Column("longitude", sa.Float(), nullable=True))
+    op.add_column("maker_profiles", sa.Column("geohash", sa.String(12), nullable=True))
+    op.create_index("ix_maker_profiles_geohash", "maker_profiles", ["geohash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_maker_profiles_geohash", table_name="maker_profiles")
+    with op.batch_alter_table("maker_profiles") as batch:
+        batch.drop_column("geohash")
+        batch.drop_column("longitude")
+        batch.drop_column("latitude")
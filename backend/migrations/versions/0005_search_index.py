@@ -0,0 +1,26 @@
+"""Search index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+Creates the FTS5 indexes (and their triggers) behind GET /api/search on SQLite and fills
+them from the existing meals and maker profiles. It follows every revision that rebuilds
+meals or maker_profiles in batch mode, since dropping a table drops its triggers.
+"""
+from alembic import op
+
+from backend.search import create_search_index, drop_search_index
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_index(op.get_bind())
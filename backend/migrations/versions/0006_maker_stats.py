@@ -0,0 +1,48 @@
+"""Maker rating stats
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+Adds maker_stats, the per-maker rating aggregates behind /api/makers and
+/api/makers/{id}/stats, and fills it from the reviews already stored.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+RATINGS = range(1, 6)
+
+
+def upgrade() -> None:
+    stats = op.create_table(
+        "maker_stats",
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("review_count", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.Integer(), nullable=False),
+        *(sa.Column(f"rating_{rating}", sa.Integer(), nullable=False) for rating in RATINGS),
+        sa.Column("last_review_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    reviews = sa.table(
+        "maker_reviews",
+        sa.column("id", sa.Integer()),
+        sa.column("maker_id", sa.Integer()),
+        sa.column("rating", sa.Integer()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    aggregates = sa.select(
+        reviews.c.maker_id,
+        sa.func.count(reviews.c.id),
+        sa.func.sum(reviews.c.rating),
+        *(sa.func.sum(sa.case((reviews.c.rating == rating, 1), else_=0)) for rating in RATINGS),
+        sa.func.max(reviews.c.created_at),
+    ).group_by(reviews.c.maker_id)
+    op.execute(stats.insert().from_select([column.name for column in stats.columns], aggregates))
+
+
+def downgrade() -> None:
+    op.drop_table("maker_stats")
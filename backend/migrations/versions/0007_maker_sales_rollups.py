@@ -0,0 +1,32 @@
+"""Maker sales rollups
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+Adds maker_sales_rollups for GET /api/maker/analytics. The table starts empty; run
+`python -m backend.cli rebuild-sales` once to fold in orders placed before this revision.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "maker_sales_rollups",
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("period", sa.String(8), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("status", sa.String(32), primary_key=True),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("revenue_cents", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("maker_sales_rollups")
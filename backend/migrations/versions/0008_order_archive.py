@@ -0,0 +1,73 @@
+"""Order archive
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+Adds maker_orders_archive and maker_reviews_archive, the cold tables completed orders are
+moved into by `python -m backend.cli archive-orders` and the archive scheduler.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "maker_orders_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("order_code", sa.String(32), nullable=False, unique=True),
+        sa.Column("eater_name", sa.String(120), nullable=False),
+        sa.Column("meal_name", sa.String(120), nullable=False),
+        sa.Column("image_id", sa.String(64), sa.ForeignKey("images.id"), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("order_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("eater_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_maker_orders_archive_maker_id_created_at_id", "maker_orders_archive", ["maker_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_maker_orders_archive_eater_id_order_time_id", "maker_orders_archive", ["eater_id", "order_time", "id"]
+    )
+
+    op.create_table(
+        "maker_reviews_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("maker_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column(
+            "order_id",
+            sa.Integer(),
+            sa.ForeignKey("maker_orders_archive.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("order_code", sa.String(32), nullable=False),
+        sa.Column("eater_name", sa.String(120), nullable=False),
+        sa.Column("eater_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("meal_name", sa.String(120), nullable=False),
+        sa.Column("image_id", sa.String(64), sa.ForeignKey("images.id"), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=False),
+        sa.Column("reply", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_maker_reviews_archive_maker_id_created_at_id", "maker_reviews_archive", ["maker_id", "created_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("maker_reviews_archive")
+    op.drop_table("maker_orders_archive")
@@ -0,0 +1,49 @@
+"""Timestamp storage format
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+Rows written before migrations existed took their timestamps from CURRENT_TIMESTAMP, stored
+on SQLite as 'YYYY-MM-DD HH:MM:SS'. SQLAlchemy binds datetimes as 'YYYY-MM-DD HH:MM:SS.ffffff',
+and as text the shorter value sorts first, so a keyset cursor taken from such a row matched
+the row again and pages never advanced. This rewrites every page-key timestamp still in
+another format into SQLAlchemy's. Other databases store real timestamps and are left alone.
+"""
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+# The timestamp columns list endpoints page along, per table.
+PAGE_KEY_TIMESTAMPS = {
+    "meals": ("created_at",),
+    "maker_orders": ("created_at", "order_time"),
+    "maker_reviews": ("created_at",),
+    "maker_orders_archive": ("created_at", "order_time"),
+    "maker_reviews_archive": ("created_at",),
+}
+DIGITS = "[0-9]"
+STORAGE_FORMAT_GLOB = (
+    f"{DIGITS * 4}-{DIGITS * 2}-{DIGITS * 2} {DIGITS * 2}:{DIGITS * 2}:{DIGITS * 2}.{DIGITS * 6}"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table, columns in PAGE_KEY_TIMESTAMPS.items():
+        for column in columns:
+            # Values already in the storage format are skipped, so they keep their microseconds.
+            # %f is seconds to the millisecond, finer than anything CURRENT_TIMESTAMP wrote.
+            op.execute(
+                f"UPDATE {table} SET {column} = strftime('%Y-%m-%d %H:%M:%f000', {column}) "
+                f"WHERE {column} NOT GLOB '{STORAGE_FORMAT_GLOB}'"
+            )
+
+
+def downgrade() -> None:
+    # Both formats read back as the same datetimes; there is nothing to undo.
+    pass
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text, func
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, func
 
 from .database import Base
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -13,6 +19,30 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class ImageBlob(Base):
+    __tablename__ = "images"
+
+    id = Column(String(64), primary_key=True)
+    content_type = Column(String(64), nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ImageVariant(Base):
+    """A resized, re-encoded copy of an image, served by /api/images/{id}?size=<variant>."""
+
+    __tablename__ = "image_variants"
+
+    image_id = Column(String(64), ForeignKey("images.id", ondelete="CASCADE"), primary_key=True)
+    variant = Column(String(16), primary_key=True)
+    content_type = Column(String(64), nullable=False)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+
+
 class Meal(Base):
     __tablename__ = "meals"
 
@@ -21,8 +51,14 @@ class Meal(Base):
     title = Column(String(120), nullable=False)
     description = Column(Text, nullable=False)
     price = Column(Float, nullable=False)
-    image_data = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    image_id = Column(String(64), ForeignKey("images.id"), nullable=False)
+    # Python-side default keeps the stored timestamp format identical to bound cursor values.
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_meals_created_at_id", "created_at", "id"),
+        Index("ix_meals_maker_id_created_at_id", "maker_id", "created_at", "id"),
+    )
 
 
 class MakerProfile(Base):
@@ -35,6 +71,10 @@ class MakerProfile(Base):
     phone = Column(String(64), nullable=False)
     country = Column(String(64), nullable=False)
     location = Column(Text, nullable=False)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    # Geohash of (latitude, longitude); prefix range scans on its index find nearby makers.
+    geohash = Column(String(12), nullable=True, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
@@ -42,36 +82,128 @@ class MakerOrder(Base):
     __tablename__ = "maker_orders"
 
     id = Column(Integer, primary_key=True, index=True)
-    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     order_code = Column(String(32), nullable=False, unique=True)
     eater_name = Column(String(120), nullable=False)
     meal_name = Column(String(120), nullable=False)
-    image_data = Column(Text, nullable=False)
+    image_id = Column(String(64), ForeignKey("images.id"), nullable=False)
     price = Column(Float, nullable=False)
-    order_time = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    order_time = Column(DateTime(timezone=True), nullable=False, default=utcnow, server_default=func.now())
     status = Column(String(32), nullable=False, default="pending")
-    eater_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    eater_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_maker_orders_maker_id_created_at_id", "maker_id", "created_at", "id"),
+        Index("ix_maker_orders_maker_id_status_created_at_id", "maker_id", "status", "created_at", "id"),
+        Index("ix_maker_orders_eater_id_order_time_id", "eater_id", "order_time", "id"),
+    )
+
 
 class MakerReview(Base):
     __tablename__ = "maker_reviews"
 
     id = Column(Integer, primary_key=True, index=True)
-    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     order_id = Column(Integer, ForeignKey("maker_orders.id", ondelete="CASCADE"), unique=True, nullable=False)
     order_code = Column(String(32), nullable=False)
     eater_name = Column(String(120), nullable=False)
     eater_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     meal_name = Column(String(120), nullable=False)
-    image_data = Column(Text, nullable=False)
+    image_id = Column(String(64), ForeignKey("images.id"), nullable=False)
     rating = Column(Integer, nullable=False)
     comment = Column(Text, nullable=False)
     reply = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_maker_reviews_maker_id_created_at_id", "maker_id", "created_at", "id"),
+    )
+
+
+class MakerOrderArchive(Base):
+    """Completed orders moved out of maker_orders by the archiver, keeping their ids.
+    Same columns as MakerOrder plus archived_at; rows are never written by the API."""
+
+    __tablename__ = "maker_orders_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    order_code = Column(String(32), nullable=False, unique=True)
+    eater_name = Column(String(120), nullable=False)
+    meal_name = Column(String(120), nullable=False)
+    image_id = Column(String(64), ForeignKey("images.id"), nullable=False)
+    price = Column(Float, nullable=False)
+    order_time = Column(DateTime(timezone=True), nullable=False)
+    status = Column(String(32), nullable=False)
+    eater_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_maker_orders_archive_maker_id_created_at_id", "maker_id", "created_at", "id"),
+        Index("ix_maker_orders_archive_eater_id_order_time_id", "eater_id", "order_time", "id"),
+    )
+
+
+class MakerReviewArchive(Base):
+    """Reviews of archived orders, moved in the same transaction as their order."""
+
+    __tablename__ = "maker_reviews_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    order_id = Column(Integer, ForeignKey("maker_orders_archive.id", ondelete="CASCADE"), unique=True, nullable=False)
+    order_code = Column(String(32), nullable=False)
+    eater_name = Column(String(120), nullable=False)
+    eater_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    meal_name = Column(String(120), nullable=False)
+    image_id = Column(String(64), ForeignKey("images.id"), nullable=False)
+    rating = Column(Integer, nullable=False)
+    comment = Column(Text, nullable=False)
+    reply = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_maker_reviews_archive_maker_id_created_at_id", "maker_id", "created_at", "id"),
+    )
+
+
+class MakerStats(Base):
+    """Per-maker rating aggregates, kept current by create_review and rebuilt by the CLI."""
+
+    __tablename__ = "maker_stats"
+
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+    last_review_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class MakerSalesRollup(Base):
+    """Order count and revenue per maker, time bucket and status, kept current by the order
+    endpoints and rebuilt by the CLI. period is hour, day, week or total (one all-time bucket)."""
+
+    __tablename__ = "maker_sales_rollups"
+
+    maker_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(String(8), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    status = Column(String(32), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    # Whole cents, so increments and decrements never drift.
+    revenue_cents = Column(Integer, nullable=False, default=0)
+
 
 class EaterProfile(Base):
     __tablename__ = "eater_profiles"
@@ -0,0 +1,90 @@
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import DateTime, Float, Integer, String, and_, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    encoded = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(encoded, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[ColumnElement]) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursorError("Invalid cursor")
+
+    return [decode_cursor_value(key, value) for key, value in zip(keys, values)]
+
+
+def decode_cursor_value(key: ColumnElement, value: Any) -> Any:
+    """Check a decoded JSON value against its key's type before it is bound into SQL."""
+    key_type = key.type
+    if isinstance(key_type, DateTime):
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError as exc:
+                raise InvalidCursorError("Invalid cursor") from exc
+    elif isinstance(key_type, Integer):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    elif isinstance(key_type, Float):
+        # Relevance scores (search ranks): any finite JSON number.
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+            return float(value)
+    elif isinstance(key_type, String):
+        if isinstance(value, str):
+            return value
+    raise InvalidCursorError("Invalid cursor")
+
+
+def keyset_filter(keys: Sequence[ColumnElement], values: Sequence[Any]) -> ColumnElement:
+    """Build `keys < values` in row-value order for a descending keyset scan."""
+    clauses = []
+    for position, (key, value) in enumerate(zip(keys, values)):
+        equal_prefix = [keys[i] == values[i] for i in range(position)]
+        clauses.append(and_(*equal_prefix, key < value))
+    return or_(*clauses)
+
+
+def paginate(stmt: Select, keys: Sequence[ColumnElement], limit: int, cursor: str | None) -> Select:
+    """Apply newest-first keyset pagination, fetching one extra row to detect the next page."""
+    if cursor:
+        stmt = stmt.where(keyset_filter(keys, decode_cursor(cursor, keys)))
+    return stmt.order_by(*(key.desc() for key in keys)).limit(limit + 1)
+
+
+def page_of(rows: Sequence[Any], keys: Sequence[ColumnElement], limit: int) -> dict:
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def merge_pages(pages: Sequence[Sequence[Any]], keys: Sequence[ColumnElement]) -> list:
+    """Merge pages paginated separately along the same keys (say a hot table and its archive)
+    into one newest-first run; page_of then cuts it to the limit and the cursor applies to both."""
+    names = [key.key for key in keys]
+    rows = [row for page in pages for row in page]
+    return sorted(rows, key=lambda row: tuple(getattr(row, name) for name in names), reverse=True)
@@ -0,0 +1,101 @@
+"""Read replica support: read-your-writes tracking and local SQLite replica syncing.
+
+A request session that resolved a caller's token remembers who the caller is; when it
+commits after flushing changes, the caller is marked as a recent writer in the response
+cache backend (shared between workers when that backend is). For READ_YOUR_WRITES_SECONDS
+afterwards get_read_db() sends the caller's reads to the primary instead of a replica.
+"""
+import asyncio
+import logging
+import sqlite3
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.engine import URL
+from sqlalchemy.orm import Session
+
+from .cache import response_cache
+from .config import READ_YOUR_WRITES_SECONDS, SQLITE_BUSY_TIMEOUT_MS
+from .database import database_url, is_memory_sqlite, replica_urls
+from .security import InvalidTokenError, decode_access_token
+
+logger = logging.getLogger(__name__)
+
+WRITER_KEY = "read_your_writes.user_id"
+WROTE_KEY = "read_your_writes.wrote"
+
+
+def writer_mark(user_id: int) -> str:
+    return f"recent_write:{user_id}"
+
+
+def attribute_writes(session: Any, user_id: int) -> None:
+    """Record the caller behind a request session, so its committed writes mark them."""
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info[WRITER_KEY] = user_id
+
+
+def wrote_recently(token: str) -> bool:
+    try:
+        claims = decode_access_token(token)
+    except InvalidTokenError:
+        return False
+    return response_cache.backend.get(writer_mark(claims.user_id)) is not None
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flush(session: Session, flush_context) -> None:
+    if WRITER_KEY in session.info:
+        session.info[WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_writer_after_commit(session: Session) -> None:
+    if session.info.pop(WROTE_KEY, False):
+        response_cache.backend.set(writer_mark(session.info[WRITER_KEY]), b"1", READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(WROTE_KEY, None)
+
+
+def sqlite_file(url: URL) -> str | None:
+    if url.get_backend_name() != "sqlite" or is_memory_sqlite(url):
+        return None
+    return url.database
+
+
+def sync_sqlite_replica(primary_path: str, replica_path: str) -> None:
+    """Copy the primary onto a replica file with SQLite's online backup API.
+
+    The copy is one consistent snapshot; replica readers keep their current snapshot and see
+    the new one on their next transaction, and writers on the primary are never blocked.
+    """
+    source = sqlite3.connect(primary_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+    target = sqlite3.connect(replica_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def sync_sqlite_replicas() -> int:
+    primary_path = sqlite_file(database_url)
+    replica_paths = [sqlite_file(url) for url in replica_urls]
+    if primary_path is None or None in replica_paths:
+        raise RuntimeError("Replica syncing needs a file-backed SQLite primary and SQLite replica files")
+    for replica_path in replica_paths:
+        sync_sqlite_replica(primary_path, replica_path)
+    return len(replica_paths)
+
+
+async def run_replica_sync(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(sync_sqlite_replicas)
+        except sqlite3.Error:
+            logger.exception("Replica sync failed; retrying in %.1f s", interval)
@@ -1,5 +1,37 @@
-from pydantic import BaseModel, EmailStr, Field, PositiveFloat, constr
+from pydantic import BaseModel, EmailStr, Field, PositiveFloat, computed_field, constr, model_validator
 from datetime import datetime
+from typing import Generic, List, Literal, TypeVar
+
+from .images import image_url as build_image_url
+
+
+T = TypeVar("T")
+
+ORDER_STATUS_PATTERN = "^(pending|preparing|ready|completed)$"
+MAX_BULK_ORDERS = 500
+MAX_BULK_STATUS_UPDATES = 1000
+
+# "summary" list views select only the columns their slim schemas need.
+ListView = Literal["summary", "full"]
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: str | None = None
+
+
+class ImageReference(BaseModel):
+    image_id: str
+
+    @computed_field
+    @property
+    def image_url(self) -> str:
+        return build_image_url(self.image_id)
+
+    @computed_field
+    @property
+    def thumbnail_url(self) -> str:
+        return build_image_url(self.image_id, "thumb")
 
 
 class RegisterRequest(BaseModel):
@@ -20,35 +52,57 @@ class AuthResponse(BaseModel):
     email: EmailStr
     role: str
     message: str
+    access_token: str | None = None
+    token_type: str | None = None
+
+
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expires_in: int
 
 
 class MealCreate(BaseModel):
-    maker_id: int
     title: constr(min_length=1, max_length=120)
     description: constr(min_length=1, max_length=500)
     price: PositiveFloat
     image_data: constr(min_length=1)
 
 
-class MealResponse(BaseModel):
+class MealResponse(ImageReference):
     id: int
     maker_id: int
     title: str
     description: str
     price: float
-    image_data: str
 
     class Config:
         from_attributes = True
 
 
-class MakerProfileRequest(BaseModel):
+class MealSummaryResponse(ImageReference):
+    id: int
     maker_id: int
+    title: str
+    price: float
+
+    class Config:
+        from_attributes = True
+
+
+class MakerProfileRequest(BaseModel):
     name: constr(min_length=1, max_length=120)
     email: EmailStr
     phone: constr(min_length=1, max_length=64)
     country: constr(min_length=1, max_length=64)
     location: constr(min_length=1, max_length=500)
+    latitude: float | None = Field(default=None, ge=-90, le=90)
+    longitude: float | None = Field(default=None, ge=-180, le=180)
+
+    @model_validator(mode="after")
+    def require_coordinate_pair(self):
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("latitude and longitude must be provided together")
+        return self
 
 
 class MakerProfileResponse(BaseModel):
@@ -58,6 +112,8 @@ class MakerProfileResponse(BaseModel):
     phone: str
     country: str
     location: str
+    latitude: float | None = None
+    longitude: float | None = None
 
     class Config:
         from_attributes = True
@@ -70,6 +126,62 @@ class MakerSummaryResponse(BaseModel):
     meal_count: int
     featured_meal_name: str | None = None
     featured_meal_image: str | None = None
+    review_count: int = 0
+    average_rating: float | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class MakerStatsResponse(BaseModel):
+    maker_id: int
+    review_count: int
+    average_rating: float | None
+    # Star value (1-5) -> number of reviews with that rating.
+    rating_histogram: dict[int, int]
+    last_review_at: datetime | None
+
+
+class SalesFigures(BaseModel):
+    orders: int
+    revenue: float
+    average_price: float | None
+
+
+class StatusSalesFigures(SalesFigures):
+    # Status -> figures for the orders currently in that status.
+    by_status: dict[str, SalesFigures]
+
+
+class SalesBucket(BaseModel):
+    bucket_start: datetime
+    orders: int
+    revenue: float
+    average_price: float | None
+    by_status: dict[str, SalesFigures]
+
+
+class MakerAnalyticsResponse(BaseModel):
+    maker_id: int
+    period: str
+    # All-time figures; series covers the requested window only.
+    totals: StatusSalesFigures
+    series: List[SalesBucket]
+
+
+class NearbyMakerResponse(BaseModel):
+    maker_id: int
+    name: str
+    location: str
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+class MakerSearchResult(BaseModel):
+    maker_id: int
+    name: str
+    location: str
 
     class Config:
         from_attributes = True
@@ -81,25 +193,49 @@ class MakerOrderCreate(BaseModel):
     eater_name: constr(min_length=1, max_length=120)
     eater_id: int | None = None
     meal_name: constr(min_length=1, max_length=120)
-    image_data: constr(min_length=1)
+    image_id: constr(min_length=1, max_length=64) | None = None
+    image_data: constr(min_length=1) | None = None
     price: PositiveFloat
     order_time: datetime | None = None
 
+    @model_validator(mode="after")
+    def require_image(self):
+        if not self.image_id and not self.image_data:
+            raise ValueError("Either image_id or image_data is required")
+        return self
+
 
 class MakerOrderUpdate(BaseModel):
     status: constr(to_lower=True, strip_whitespace=True) = Field(
-        pattern="^(pending|preparing|ready|completed)$"
+        pattern=ORDER_STATUS_PATTERN
     )
 
 
-class MakerOrderResponse(BaseModel):
+class BulkOrderCreate(BaseModel):
+    orders: List[MakerOrderCreate] = Field(min_length=1, max_length=MAX_BULK_ORDERS)
+
+
+class BulkOrderStatusUpdate(BaseModel):
+    status: constr(to_lower=True, strip_whitespace=True) = Field(pattern=ORDER_STATUS_PATTERN)
+    order_ids: List[int] | None = Field(default=None, min_length=1, max_length=MAX_BULK_STATUS_UPDATES)
+    from_status: constr(to_lower=True, strip_whitespace=True) | None = Field(
+        default=None, pattern=ORDER_STATUS_PATTERN
+    )
+
+    @model_validator(mode="after")
+    def require_selection(self):
+        if self.order_ids is None and self.from_status is None:
+            raise ValueError("Either order_ids or from_status is required")
+        return self
+
+
+class MakerOrderResponse(ImageReference):
     id: int
     maker_id: int
     eater_id: int | None
     order_code: str
     eater_name: str
     meal_name: str
-    image_data: str
     price: float
     order_time: datetime
     status: str
@@ -108,6 +244,45 @@ class MakerOrderResponse(BaseModel):
         from_attributes = True
 
 
+class MakerOrderSummaryResponse(ImageReference):
+    id: int
+    order_code: str
+    eater_name: str
+    meal_name: str
+    price: float
+    order_time: datetime
+    status: str
+
+    class Config:
+        from_attributes = True
+
+
+class BulkOrderResult(BaseModel):
+    index: int
+    ok: bool
+    order: MakerOrderResponse | None = None
+    error: str | None = None
+
+
+class BulkOrderResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkOrderResult]
+
+
+class BulkOrderStatusResult(BaseModel):
+    order_id: int
+    ok: bool
+    order: MakerOrderResponse | None = None
+    error: str | None = None
+
+
+class BulkOrderStatusResponse(BaseModel):
+    updated: int
+    failed: int
+    results: List[BulkOrderStatusResult]
+
+
 class MakerReviewCreate(BaseModel):
     order_id: int
     rating: int = Field(ge=1, le=5)
@@ -118,7 +293,7 @@ class MakerReviewUpdate(BaseModel):
     reply: constr(min_length=1, max_length=500)
 
 
-class MakerReviewResponse(BaseModel):
+class MakerReviewResponse(ImageReference):
     id: int
     maker_id: int
     eater_id: int
@@ -126,7 +301,6 @@ class MakerReviewResponse(BaseModel):
     order_code: str
     eater_name: str
     meal_name: str
-    image_data: str
     rating: int
     comment: str
     reply: str | None
@@ -137,6 +311,19 @@ class MakerReviewResponse(BaseModel):
         from_attributes = True
 
 
+class MakerReviewSummaryResponse(BaseModel):
+    id: int
+    order_id: int
+    order_code: str
+    meal_name: str
+    rating: int
+    reply: str | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class ReviewSnippet(BaseModel):
     review_id: int
     rating: int
@@ -144,14 +331,13 @@ class ReviewSnippet(BaseModel):
     reply: str | None
 
 
-class EaterOrderResponse(BaseModel):
+class EaterOrderResponse(ImageReference):
     id: int
     maker_id: int
     eater_id: int | None
     order_code: str
     eater_name: str
     meal_name: str
-    image_data: str
     price: float
     order_time: datetime
     status: str
@@ -162,7 +348,6 @@ class EaterOrderResponse(BaseModel):
 
 
 class EaterProfileRequest(BaseModel):
-    eater_id: int
     display_name: constr(min_length=1, max_length=120)
     phone: constr(min_length=0, max_length=64) | None = None
     favorite_cuisine: constr(min_length=0, max_length=120) | None = None
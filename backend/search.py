@@ -0,0 +1,135 @@
+import re
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, bindparam, select, text
+from sqlalchemy.engine import Connection
+
+from .models import MakerProfile, Meal
+
+
+class InvalidSearchQueryError(ValueError):
+    pass
+
+
+# FTS5 indexes over meals and maker profiles. They are external-content tables: the text
+# lives only in the source tables and triggers keep the index in step with every write,
+# whichever code path makes it.
+SEARCH_INDEXES = (
+    {
+        "name": "meals_fts",
+        "source": "meals",
+        "columns": ("title", "description"),
+        # Title hits outrank description hits.
+        "weights": (10.0, 1.0),
+    },
+    {
+        "name": "maker_profiles_fts",
+        "source": "maker_profiles",
+        "columns": ("name", "location"),
+        "weights": (10.0, 2.0),
+    },
+)
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# The virtual tables are kept out of Base.metadata so create_all/drop_all leave them alone.
+search_metadata = MetaData()
+meals_fts = Table(
+    "meals_fts",
+    search_metadata,
+    Column("rowid", Integer),
+    Column("meals_fts", Text),
+    Column("rank", Float),
+)
+maker_profiles_fts = Table(
+    "maker_profiles_fts",
+    search_metadata,
+    Column("rowid", Integer),
+    Column("maker_profiles_fts", Text),
+    Column("rank", Float),
+)
+
+
+def search_index_ddl(index: dict) -> list[str]:
+    name, source, columns = index["name"], index["source"], index["columns"]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {name}({name}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {name}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5("
+        f"{column_list}, content='{source}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {source} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {source} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {column_list} ON {source} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def missing_search_objects(connection: Connection, index: dict) -> bool:
+    expected = {index["name"], *(f"{index['name']}_{suffix}" for suffix in ("ai", "ad", "au"))}
+    found = connection.execute(
+        text("SELECT name FROM sqlite_master WHERE name IN :names").bindparams(bindparam("names", expanding=True)),
+        {"names": sorted(expected)},
+    ).scalars()
+    return set(found) != expected
+
+
+def create_search_index(connection: Connection) -> None:
+    """Create the FTS5 tables and triggers, rebuilding any index that may have drifted.
+
+    A missing trigger means writes went unindexed (for example after the source table was
+    dropped and recreated), so the index is rebuilt from its content table. Called from the
+    schema migrations, inside their transaction.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for index in SEARCH_INDEXES:
+        if not missing_search_objects(connection, index):
+            continue
+        for statement in search_index_ddl(index):
+            connection.execute(text(statement))
+        name = index["name"]
+        weights = ", ".join(str(weight) for weight in index["weights"])
+        connection.execute(text(f"INSERT INTO {name}({name}, rank) VALUES ('rank', 'bm25({weights})')"))
+        connection.execute(text(f"INSERT INTO {name}({name}) VALUES ('rebuild')"))
+
+
+def drop_search_index(connection: Connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    for index in SEARCH_INDEXES:
+        # Dropping the virtual table removes its shadow tables; triggers belong to the source table.
+        for suffix in ("ai", "ad", "au"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {index['name']}_{suffix}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {index['name']}"))
+
+
+def fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query that ANDs every term as a prefix match."""
+    tokens = TOKEN_PATTERN.findall(query)
+    if not tokens:
+        raise InvalidSearchQueryError("Search query must contain letters or digits")
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def meal_search(query: str):
+    score = (-meals_fts.c.rank).label("score")
+    stmt = (
+        select(*Meal.__table__.columns, score)
+        .join(meals_fts, meals_fts.c.rowid == Meal.id)
+        .where(meals_fts.c.meals_fts.match(fts_query(query)))
+    )
+    return stmt, (score, Meal.id)
+
+
+def maker_search(query: str):
+    score = (-maker_profiles_fts.c.rank).label("score")
+    stmt = (
+        select(MakerProfile.id, MakerProfile.maker_id, MakerProfile.name, MakerProfile.location, score)
+        .join(maker_profiles_fts, maker_profiles_fts.c.rowid == MakerProfile.id)
+        .where(maker_profiles_fts.c.maker_profiles_fts.match(fts_query(query)))
+    )
+    return stmt, (score, MakerProfile.id)
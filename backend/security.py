@@ -1,7 +1,35 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
 from passlib.context import CryptContext
 
+from .config import (
+    ACCESS_TOKEN_TTL_SECONDS,
+    PASSWORD_HASH_EXECUTOR,
+    PASSWORD_HASH_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    SECRET_KEY,
+    STREAM_TICKET_TTL_SECONDS,
+)
+
 # pbkdf2_sha256 avoids native bcrypt backend issues and supports long passwords.
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Pinning min/max rounds to the configured cost makes needs_update() flag hashes made with other settings.
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=PASSWORD_HASH_ROUNDS,
+)
+
+_hash_executor: Executor | None = None
 
 
 def hash_password(password: str) -> str:
@@ -10,3 +38,109 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
+
+
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify a password and return a replacement hash when the stored one is outdated."""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+def get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        if PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), hash_password, password)
+
+
+async def verify_and_update_password_async(password: str, hashed: str) -> tuple[bool, str | None]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), verify_and_update_password, password, hashed)
+
+
+class InvalidTokenError(ValueError):
+    pass
+
+
+# Audience of stream tickets; access tokens carry none, so neither is accepted as the other.
+STREAM_TICKET_AUDIENCE = "order-events"
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    user_id: int
+    role: str
+    expires_at: int
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(SECRET_KEY.encode(), payload.encode(), hashlib.sha256).digest())
+
+
+def _encode_token(claims: dict) -> str:
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload)}"
+
+
+def create_access_token(user_id: int, role: str, ttl: int = ACCESS_TOKEN_TTL_SECONDS) -> str:
+    return _encode_token({"sub": user_id, "role": role, "exp": int(time.time()) + ttl})
+
+
+def create_stream_ticket(user_id: int, role: str, ttl: int = STREAM_TICKET_TTL_SECONDS) -> str:
+    """A short-lived token that only opens the order event stream, for use in its URL."""
+    return _encode_token(
+        {"sub": user_id, "role": role, "exp": int(time.time()) + ttl, "aud": STREAM_TICKET_AUDIENCE}
+    )
+
+
+def decode_access_token(token: str) -> TokenClaims:
+    return _decode_token(token, audience=None)
+
+
+def decode_stream_ticket(ticket: str) -> TokenClaims:
+    return _decode_token(ticket, audience=STREAM_TICKET_AUDIENCE)
+
+
+def _decode_token(token: str, audience: str | None) -> TokenClaims:
+    # Tokens are base64url; anything else would make compare_digest raise TypeError on str input.
+    if not token.isascii():
+        raise InvalidTokenError("Invalid token")
+    payload, _, signature = token.partition(".")
+    if not payload or not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidTokenError("Invalid token")
+    try:
+        claims = json.loads(_b64decode(payload))
+        result = TokenClaims(user_id=int(claims["sub"]), role=str(claims["role"]), expires_at=int(claims["exp"]))
+        token_audience = claims.get("aud")
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise InvalidTokenError("Invalid token") from exc
+    if token_audience != audience:
+        raise InvalidTokenError("Invalid token")
+    if result.expires_at <= time.time():
+        raise InvalidTokenError("Token expired")
+    return result
@@ -0,0 +1,120 @@
+"""Trusted-row JSON encoding for response bodies.
+
+Validating rows we selected ourselves through the response model costs more than the
+encoding: every ORM attribute goes through its instrumented descriptor and every value
+is re-checked against types the database already guarantees. dump_trusted() instead
+copies each model field straight from the row (a loaded ORM instance's __dict__, a Core
+row's mapping, or a plain dict), adds computed fields and encodes with orjson. The
+output is byte-for-byte what TypeAdapter.dump_json produces for the same data.
+"""
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Mapping, Union, get_args, get_origin
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional speedup; serialize() falls back to pydantic
+    orjson = None
+
+# Z for UTC and stringified int keys match pydantic's JSON output.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+JSON_RESPONSE_CLASS = ORJSONResponse if orjson else JSONResponse
+
+_MISSING = object()
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+class FieldView:
+    """Attribute access over encoded values, so computed-field properties can run on them."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: dict):
+        self.values = values
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def row_mapping(source: Any) -> Mapping:
+    if isinstance(source, Mapping):
+        return source
+    mapping = getattr(source, "_mapping", None)
+    if mapping is not None:
+        return mapping
+    # Loaded ORM columns and pydantic fields both live in the instance dict.
+    return source.__dict__
+
+
+@lru_cache(maxsize=None)
+def encoder_for(annotation: Any) -> Callable[[Any], Any]:
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(members) == 1:
+            inner = encoder_for(members[0])
+            if inner is identity:
+                return identity
+            return lambda value: None if value is None else inner(value)
+        if any(isinstance(arg, type) and issubclass(arg, BaseModel) for arg in members):
+            raise TypeError(f"Trusted encoding cannot pick a member of {annotation!r}")
+        return identity
+    if origin in (list, tuple):
+        inner = encoder_for(get_args(annotation)[0])
+        if inner is identity:
+            return list
+        return lambda values: [inner(value) for value in values]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return model_encoder(annotation)
+    return identity
+
+
+@lru_cache(maxsize=None)
+def model_encoder(model: type[BaseModel]) -> Callable[[Any], dict]:
+    decorators = model.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        raise TypeError(f"{model.__name__} has custom serializers; encode it through pydantic")
+
+    fields = [
+        (
+            name,
+            _MISSING if info.is_required() else info.get_default(call_default_factory=True),
+            encoder_for(info.annotation),
+        )
+        for name, info in model.model_fields.items()
+    ]
+    computed = [(name, info.wrapped_property.fget) for name, info in model.model_computed_fields.items()]
+
+    def encode(source: Any) -> dict:
+        values = row_mapping(source)
+        is_instance = values is getattr(source, "__dict__", None)
+        encoded = {}
+        for name, default, nested in fields:
+            value = values.get(name, _MISSING)
+            if value is _MISSING:
+                # Expired or deferred ORM attributes load on access; rows and dicts fall back to defaults.
+                value = getattr(source, name) if is_instance else default
+                if value is _MISSING:
+                    raise KeyError(f"{model.__name__}.{name} is missing from {type(source).__name__}")
+            encoded[name] = value if nested is identity else nested(value)
+        if computed:
+            view = FieldView(encoded)
+            for name, getter in computed:
+                encoded[name] = getter(view)
+        return encoded
+
+    return encode
+
+
+def dump_trusted(model: Any, data: Any) -> bytes:
+    """Encode data shaped like model without validating it (data must come from our own queries)."""
+    return orjson.dumps(encoder_for(model)(data), option=ORJSON_OPTIONS)
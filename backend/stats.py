@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from sqlalchemy import case, delete, func, insert, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+
+from .models import MakerReview, MakerReviewArchive, MakerStats
+
+RATINGS = range(1, 6)
+COUNTER_COLUMNS = ("review_count", "rating_sum", *(f"rating_{rating}" for rating in RATINGS))
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE.
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_insert(dialect_name: str, what: str):
+    try:
+        return UPSERT_INSERTS[dialect_name]
+    except KeyError:
+        raise RuntimeError(f"{what} need an upsert-capable database, not {dialect_name!r}") from None
+
+
+def record_review(dialect_name: str, maker_id: int, rating: int, reviewed_at: datetime):
+    """Single upsert that folds one new review into the maker's aggregates.
+
+    The increment happens inside the statement, so concurrent reviews never lose updates
+    and the stats commit or roll back together with the review itself.
+    """
+    stmt = upsert_insert(dialect_name, "Maker stats")(MakerStats).values(
+        maker_id=maker_id,
+        review_count=1,
+        rating_sum=rating,
+        last_review_at=reviewed_at,
+        **{f"rating_{value}": int(value == rating) for value in RATINGS},
+    )
+    table = MakerStats.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.maker_id],
+        set_={
+            **{name: table.c[name] + stmt.excluded[name] for name in COUNTER_COLUMNS},
+            "last_review_at": stmt.excluded.last_review_at,
+        },
+    )
+
+
+def rebuild_maker_stats(connection: Connection) -> int:
+    """Recompute every maker's aggregates from all reviews, archived ones included, in one
+    INSERT ... SELECT."""
+    reviews = union_all(
+        *(
+            select(model.maker_id, model.id, model.rating, model.created_at)
+            for model in (MakerReview, MakerReviewArchive)
+        )
+    ).subquery()
+    aggregates = select(
+        reviews.c.maker_id,
+        func.count(reviews.c.id),
+        func.sum(reviews.c.rating),
+        *(func.sum(case((reviews.c.rating == rating, 1), else_=0)) for rating in RATINGS),
+        func.max(reviews.c.created_at),
+    ).group_by(reviews.c.maker_id)
+
+    connection.execute(delete(MakerStats))
+    result = connection.execute(
+        insert(MakerStats).from_select(["maker_id", *COUNTER_COLUMNS, "last_review_at"], aggregates)
+    )
+    return result.rowcount
+
+
+def average_rating(review_count: int | None, rating_sum: int | None) -> float | None:
+    if not review_count:
+        return None
+    return round(rating_sum / review_count, 2)
@@ -0,0 +1,117 @@
+"""Shared fixtures: one migrated SQLite file for the session, emptied before every test.
+
+Settings are read from the environment when backend.config is imported, so they are fixed
+here first. Rate limits and the concurrency cap are off for the API tests; the admission
+tests build their own middleware around a stub app.
+"""
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="aussieeat-tests-")
+os.environ.update(
+    {
+        "AUSSIEEAT_DATABASE_URL": f"sqlite:///{TEST_DIR}/aussieeat.db",
+        "AUSSIEEAT_READ_REPLICA_URLS": "",
+        "AUSSIEEAT_MIGRATE_ON_STARTUP": "0",
+        "AUSSIEEAT_SECRET_KEY": "test-secret",
+        "AUSSIEEAT_PASSWORD_HASH_ROUNDS": "1000",
+        "AUSSIEEAT_RATE_LIMIT_ENABLED": "0",
+        "AUSSIEEAT_MAX_CONCURRENT_REQUESTS": "0",
+        "AUSSIEEAT_MAX_CONCURRENT_EXPORTS": "0",
+        "AUSSIEEAT_ARCHIVE_INTERVAL_SECONDS": "0",
+        "AUSSIEEAT_REPLICA_SYNC_INTERVAL_SECONDS": "0",
+    }
+)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import delete, event  # noqa: E402
+
+from backend.auth import identity_cache  # noqa: E402
+from backend.cache import InMemoryCacheBackend, response_cache  # noqa: E402
+from backend.database import Base, async_engine, engine  # noqa: E402
+from backend.main import app  # noqa: E402
+from backend.migrations import upgrade_database  # noqa: E402
+
+# A real 4x4 PNG, small enough to inline in every request.
+PNG_DATA_URL = (
+    "data:image/png;base64,"
+    "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAFElEQVR4nGM8wcXFAANMDEgANwcALLoA5DVVUv0AAAAASUVORK5CYII="
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    upgrade_database(engine)
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(delete(table))
+    monkeypatch.setattr(response_cache, "backend", InMemoryCacheBackend())
+    identity_cache.clear()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def statements():
+    """SQL statements run on the primary (either mode) while the test runs, in order."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    targets = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    for target in targets:
+        event.listen(target, "before_cursor_execute", record)
+    yield executed
+    for target in targets:
+        event.remove(target, "before_cursor_execute", record)
+
+
+def sign_up(client: TestClient, email: str, role: str) -> dict:
+    password = "password123"
+    registered = client.post("/api/auth/register", json={"email": email, "password": password, "role": role})
+    assert registered.status_code == 201, registered.text
+    login = client.post("/api/auth/login", json={"email": email, "password": password}).json()
+    return {"id": registered.json()["id"], "headers": {"Authorization": f"Bearer {login['access_token']}"}}
+
+
+@pytest.fixture
+def maker(client):
+    return sign_up(client, "maker@example.com", "maker")
+
+
+@pytest.fixture
+def eater(client):
+    return sign_up(client, "eater@example.com", "eater")
+
+
+@pytest.fixture
+def place_order(client, maker, eater):
+    """Create an order for the maker, placed by the eater; returns the response body."""
+
+    def place(order_code: str, price: float = 10.0, order_time: str | None = None, **fields) -> dict:
+        payload = {
+            "maker_id": maker["id"],
+            "order_code": order_code,
+            "eater_name": "Eater",
+            "meal_name": "Meat pie",
+            "image_data": PNG_DATA_URL,
+            "price": price,
+            **fields,
+        }
+        if order_time:
+            payload["order_time"] = order_time
+        response = client.post("/api/orders", json=payload, headers=eater["headers"])
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return place
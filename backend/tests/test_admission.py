@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from backend.admission import (
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+    InMemoryRateLimitBackend,
+    Rate,
+    client_key,
+    parse_rates,
+    route_class,
+)
+
+
+class StubApp:
+    """Answers 200, holding requests to `held` paths open until `finish` is set."""
+
+    def __init__(self, held=()):
+        self.held = set(held)
+        self.finish = asyncio.Event()
+        self.running = 0
+
+    async def __call__(self, scope, receive, send):
+        self.running += 1
+        try:
+            if scope["path"] in self.held:
+                await self.finish.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            self.running -= 1
+
+
+async def call(middleware, path: str, method: str = "GET", client: str = "10.0.0.1") -> tuple[int, dict]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "client": (client, 5000)}
+    await middleware(scope, receive, send)
+    start = messages[0]
+    return start["status"], {name.decode(): value.decode() for name, value in start["headers"]}
+
+
+def limiter(limit: int = 1, queue_size: int = 0, timeout: float = 0.05) -> ConcurrencyLimiter:
+    return ConcurrencyLimiter(limit, queue_size, timeout)
+
+
+def test_route_classes():
+    assert route_class("POST", "/api/auth/login") == "auth"
+    assert route_class("GET", "/api/orders/export") == "export"
+    assert route_class("GET", "/api/meals") == "read"
+    assert route_class("PATCH", "/api/orders/1") == "write"
+    assert route_class("GET", "/api/health") is None
+    assert route_class("GET", "/images/abc") is None
+
+
+def test_parse_rates():
+    assert parse_rates("auth=20/60, read=600/60") == {"auth": Rate(20, 60.0), "read": Rate(600, 60.0)}
+    for spec in ("read=600", "read=0/60", "read=ten/60"):
+        with pytest.raises(RuntimeError):
+            parse_rates(spec)
+
+
+def test_unreadable_tokens_are_limited_by_ip():
+    scope = {"headers": [(b"authorization", "Bearer abc.dé".encode("latin-1"))], "client": ("10.0.0.1", 5000)}
+    assert client_key(scope) == "ip:10.0.0.1"
+
+
+def test_empty_bucket_gets_429_per_class_and_client():
+    async def scenario():
+        middleware = AdmissionMiddleware(
+            StubApp(),
+            backend=InMemoryRateLimitBackend(timer=lambda: 0.0),
+            rates={"read": Rate(2, 60), "write": Rate(1, 60)},
+            limiter=limiter(limit=10),
+        )
+        assert [(await call(middleware, "/api/meals"))[0] for _ in range(3)] == [200, 200, 429]
+        status, headers = await call(middleware, "/api/meals")
+        assert (status, headers["retry-after"]) == (429, "30")
+        assert (await call(middleware, "/api/meals", client="10.0.0.2"))[0] == 200
+        assert (await call(middleware, "/api/orders", method="POST"))[0] == 200
+        # Classes without a rate, and exempt paths, are never limited.
+        assert (await call(middleware, "/api/auth/login", method="POST"))[0] == 200
+        assert (await call(middleware, "/api/health"))[0] == 200
+
+    asyncio.run(scenario())
+
+
+def test_requests_over_the_cap_and_queue_are_shed_with_503():
+    async def scenario():
+        app = StubApp(held={"/api/slow"})
+        middleware = AdmissionMiddleware(app, rates={}, limiter=limiter(limit=1, queue_size=1, timeout=5))
+        slow = asyncio.create_task(call(middleware, "/api/slow"))
+        queued = asyncio.create_task(call(middleware, "/api/meals"))
+        await asyncio.sleep(0.01)
+        status, headers = await call(middleware, "/api/meals")
+        assert (status, headers["retry-after"]) == (503, "5")
+
+        app.finish.set()
+        assert (await slow)[0] == 200
+        assert (await queued)[0] == 200
+
+    asyncio.run(scenario())
+
+
+def test_queued_requests_time_out_with_503():
+    async def scenario():
+        app = StubApp(held={"/api/slow"})
+        middleware = AdmissionMiddleware(app, rates={}, limiter=limiter(limit=1, queue_size=1))
+        slow = asyncio.create_task(call(middleware, "/api/slow"))
+        await asyncio.sleep(0.01)
+        assert (await call(middleware, "/api/meals"))[0] == 503
+        app.finish.set()
+        await slow
+
+    asyncio.run(scenario())
+
+
+def test_streams_and_exports_do_not_hold_request_slots():
+    async def scenario():
+        app = StubApp(held={"/api/orders/events", "/api/orders/export"})
+        middleware = AdmissionMiddleware(app, rates={}, limiter=limiter(), export_limiter=limiter())
+        stream = asyncio.create_task(call(middleware, "/api/orders/events"))
+        export = asyncio.create_task(call(middleware, "/api/orders/export"))
+        await asyncio.sleep(0.01)
+        assert app.running == 2
+
+        assert (await call(middleware, "/api/meals"))[0] == 200
+        # The export cap is separate and full.
+        assert (await call(middleware, "/api/reviews/export"))[0] == 503
+
+        app.finish.set()
+        assert [(await stream)[0], (await export)[0]] == [200, 200]
+        assert (await call(middleware, "/api/reviews/export"))[0] == 200
+
+    asyncio.run(scenario())
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+
+from backend.analytics import window_buckets
+
+
+def analytics(client, maker, **params) -> dict:
+    response = client.get("/api/maker/analytics", params=params, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_window_buckets_end_with_the_bucket_holding_end():
+    assert window_buckets(datetime(2026, 10, 15, 13, 45), "week", 2) == [datetime(2026, 10, 5), datetime(2026, 10, 12)]
+    assert window_buckets(datetime(9999, 12, 31, 23, 0), "day", 1) == [datetime(9999, 12, 31)]
+    with pytest.raises(ValueError):
+        window_buckets(datetime(1, 1, 1), "hour", 366)
+
+
+def test_rollups_follow_status_changes(client, maker, place_order):
+    first = place_order("A1", price=10.0, order_time="2026-10-15T09:15:00")
+    second = place_order("A2", price=4.5, order_time="2026-10-15T18:00:00")
+    place_order("A3", price=7.25, order_time="2026-10-13T12:00:00")
+
+    response = client.patch(f"/api/orders/{first['id']}", json={"status": "completed"}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    response = client.patch(
+        "/api/orders/status",
+        json={"status": "ready", "order_ids": [first["id"], second["id"]]},
+        headers=maker["headers"],
+    )
+    assert response.json()["updated"] == 2
+
+    result = analytics(client, maker, period="day", buckets=3, end="2026-10-15T23:00:00")
+    assert result["totals"]["orders"] == 3
+    assert result["totals"]["revenue"] == 21.75
+    assert result["totals"]["by_status"] == {
+        "pending": {"orders": 1, "revenue": 7.25, "average_price": 7.25},
+        "ready": {"orders": 2, "revenue": 14.5, "average_price": 7.25},
+    }
+    assert [bucket["bucket_start"] for bucket in result["series"]] == [
+        "2026-10-13T00:00:00",
+        "2026-10-14T00:00:00",
+        "2026-10-15T00:00:00",
+    ]
+    assert [bucket["orders"] for bucket in result["series"]] == [1, 0, 2]
+    assert result["series"][2]["by_status"] == {"ready": {"orders": 2, "revenue": 14.5, "average_price": 7.25}}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"period": "week", "end": "9999-12-31T00:00:00"},
+        {"period": "day", "buckets": 1, "end": "9999-12-31T23:59:59"},
+    ],
+)
+def test_window_at_the_end_of_time(client, maker, params):
+    series = analytics(client, maker, **params)["series"]
+    assert series[-1]["bucket_start"].startswith("9999-12-")
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"period": "hour", "buckets": 366, "end": "0001-01-01T00:00:00"},
+        {"period": "day", "end": "0001-01-02T00:00:00"},
+        {"period": "hour", "buckets": 1, "end": "0001-01-01T00:00:00+10:00"},
+    ],
+)
+def test_window_before_the_start_of_time_is_rejected(client, maker, params):
+    response = client.get("/api/maker/analytics", params=params, headers=maker["headers"])
+    assert response.status_code == 400
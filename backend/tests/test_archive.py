@@ -0,0 +1,104 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.archive import archive_completed_orders
+from backend.database import engine
+
+from .test_pagination import walk
+
+RECENT = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0) - timedelta(days=1)
+
+
+@pytest.fixture
+def history(client, maker, eater, place_order):
+    """Six reviewed orders, alternately old and recent; the old ones are completed and archived.
+
+    The newest order and newest review are on a recent order, since the archiver always
+    leaves those rows hot.
+    """
+    orders = []
+    for number in range(6):
+        old = number % 2 == 0
+        order_time = datetime(2020, 1, 1 + number) if old else RECENT + timedelta(minutes=number)
+        order = place_order(f"H{number}", order_time=order_time.isoformat())
+        if old:
+            response = client.patch(
+                f"/api/orders/{order['id']}", json={"status": "completed"}, headers=maker["headers"]
+            )
+            assert response.status_code == 200, response.text
+        response = client.post(
+            "/api/reviews",
+            json={"order_id": order["id"], "rating": 5, "comment": f"Order {number}"},
+            headers=eater["headers"],
+        )
+        assert response.status_code == 201, response.text
+        orders.append({**order, "archived": old})
+
+    moved = archive_completed_orders(engine, cutoff=RECENT - timedelta(days=30), batch_size=2)
+    assert moved == (3, 3)
+    return orders
+
+
+def ids(items) -> list[int]:
+    return [item["id"] for item in items]
+
+
+def test_lists_read_hot_rows_unless_asked(client, maker, eater, history):
+    hot = [order["id"] for order in history if not order["archived"]]
+    assert sorted(ids(walk(client, "/api/orders", maker["headers"]))) == hot
+    assert sorted(ids(walk(client, "/api/eater/orders", eater["headers"]))) == hot
+    reviews = walk(client, "/api/reviews", maker_id=maker["id"])
+    assert [review["comment"] for review in reviews] == ["Order 5", "Order 3", "Order 1"]
+
+
+def test_maker_pages_merge_both_tables_newest_first(client, maker, history):
+    merged = walk(client, "/api/orders", maker["headers"], include_archived="true")
+    # Maker pages are keyed on (created_at, id), and every order was created in this test.
+    assert ids(merged) == list(reversed(ids(history)))
+
+
+def test_eater_pages_merge_both_tables_by_order_time(client, eater, history):
+    merged = walk(client, "/api/eater/orders", eater["headers"], include_archived="true")
+    by_order_time = sorted(history, key=lambda order: (order["order_time"], order["id"]), reverse=True)
+    assert ids(merged) == ids(by_order_time)
+    assert [order["review"]["comment"] for order in merged] == [f"Order {number}" for number in (5, 3, 1, 4, 2, 0)]
+
+
+def test_archived_reviews_are_listed_on_request(client, maker, history):
+    reviews = walk(client, "/api/reviews", maker_id=maker["id"], include_archived="true")
+    assert [review["comment"] for review in reviews] == [f"Order {number}" for number in range(5, -1, -1)]
+
+
+def test_exports_stream_both_tables_oldest_first(client, maker, history):
+    response = client.get("/api/orders/export", params={"include_archived": "true"}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["order_code"] for row in exported] == [f"H{number}" for number in range(6)]
+
+
+def test_archived_orders_are_frozen_and_keep_their_codes(client, maker, eater, history):
+    archived = history[0]
+    response = client.patch(f"/api/orders/{archived['id']}", json={"status": "ready"}, headers=maker["headers"])
+    assert response.status_code == 404
+    response = client.post(
+        "/api/orders",
+        json={
+            "maker_id": maker["id"],
+            "order_code": archived["order_code"],
+            "eater_name": "Eater",
+            "meal_name": "Meat pie",
+            "image_id": archived["image_id"],
+            "price": 10.0,
+        },
+        headers=eater["headers"],
+    )
+    assert response.status_code == 409
+
+
+def test_analytics_still_count_archived_orders(client, maker, history):
+    response = client.get("/api/maker/analytics", headers=maker["headers"])
+    totals = response.json()["totals"]
+    assert totals["orders"] == 6
+    assert totals["by_status"]["completed"]["orders"] == 3
@@ -0,0 +1,104 @@
+import anyio
+import pytest
+from fastapi import HTTPException
+
+from backend import auth, database
+from backend.auth import get_stream_user, identity_cache, load_identity
+from backend.database import open_session
+from backend.security import InvalidTokenError, create_stream_ticket, decode_access_token
+
+
+@pytest.fixture
+def opened_sessions(monkeypatch) -> list[str]:
+    """Names of the session openers used, recorded as each session is opened."""
+    opened = []
+
+    def counting(name, opener):
+        def open_counted():
+            opened.append(name)
+            return opener()
+
+        return open_counted
+
+    monkeypatch.setattr(database, "open_session", counting("primary", database.open_session))
+    monkeypatch.setattr(auth, "open_session", counting("read", auth.open_session))
+    return opened
+
+
+@pytest.mark.parametrize(
+    ("url", "account"),
+    [("/api/orders", "maker"), ("/api/eater/orders", "eater")],
+)
+def test_signed_in_lists_authenticate_on_their_read_session(client, request, opened_sessions, url, account):
+    headers = request.getfixturevalue(account)["headers"]
+    identity_cache.clear()
+    opened_sessions.clear()
+
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    assert opened_sessions == ["read"]
+
+
+def test_write_routes_still_authenticate_on_the_primary(client, maker, opened_sessions):
+    response = client.put(
+        "/api/maker/profile",
+        json={
+            "name": "Pie Palace",
+            "email": "maker@example.com",
+            "phone": "0400 000 000",
+            "country": "Australia",
+            "location": "Fitzroy",
+        },
+        headers=maker["headers"],
+    )
+    assert response.status_code == 200, response.text
+    assert opened_sessions == ["primary"]
+
+
+class EmptyReplica:
+    async def get(self, entity, ident):
+        return None
+
+
+def test_users_missing_from_a_replica_are_looked_up_on_the_primary(maker):
+    identity_cache.clear()
+
+    async def lookup(fallback):
+        return await load_identity(EmptyReplica(), maker["id"], fallback)
+
+    assert anyio.run(lookup, None) is None
+    assert anyio.run(lookup, open_session).id == maker["id"]
+
+
+def test_non_ascii_tokens_are_rejected_not_crashed(client, maker):
+    token = maker["headers"]["Authorization"].partition(" ")[2]
+    forged = token[:-1] + "é"
+    with pytest.raises(InvalidTokenError):
+        decode_access_token(forged)
+
+    response = client.get("/api/orders", headers={"Authorization": f"Bearer {forged}".encode("latin-1")})
+    assert response.status_code == 401
+    assert client.get("/api/orders/events", params={"ticket": forged}).status_code == 401
+
+
+def stream_user(ticket: str):
+    async def resolve():
+        async with open_session() as session:
+            return await get_stream_user(ticket=ticket, credentials=None, db=session)
+
+    return anyio.run(resolve)
+
+
+def test_stream_tickets_only_open_the_event_stream(client, maker):
+    assert client.post("/api/orders/events/ticket").status_code == 401
+    response = client.post("/api/orders/events/ticket", headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    ticket = response.json()["ticket"]
+    assert stream_user(ticket).id == maker["id"]
+
+    assert client.get("/api/orders", headers={"Authorization": f"Bearer {ticket}"}).status_code == 401
+    access_token = maker["headers"]["Authorization"].partition(" ")[2]
+    for rejected in (access_token, create_stream_ticket(maker["id"], "maker", ttl=-1)):
+        with pytest.raises(HTTPException) as excinfo:
+            stream_user(rejected)
+        assert excinfo.value.status_code == 401
@@ -0,0 +1,48 @@
+from .conftest import PNG_DATA_URL
+
+
+def order_item(maker, order_code: str, **fields) -> dict:
+    return {
+        "maker_id": maker["id"],
+        "order_code": order_code,
+        "eater_name": "Eater",
+        "meal_name": "Sausage roll",
+        "image_data": PNG_DATA_URL,
+        "price": 6.0,
+        **fields,
+    }
+
+
+def create_bulk(client, eater, items) -> dict:
+    response = client.post("/api/orders/bulk", json={"orders": items}, headers=eater["headers"])
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def outcomes(result) -> list:
+    return [item["error"] if not item["ok"] else item["order"]["order_code"] for item in result["results"]]
+
+
+def test_rejected_item_does_not_claim_its_order_code(client, maker, eater):
+    result = create_bulk(
+        client,
+        eater,
+        [
+            order_item(maker, "B1", maker_id=maker["id"] + 1000),
+            order_item(maker, "B1"),
+            order_item(maker, "B2", image_data="not an image"),
+            order_item(maker, "B2"),
+            order_item(maker, "B2"),
+        ],
+    )
+    bad_image = result["results"][2]
+    assert not bad_image["ok"] and bad_image["error"]
+    assert outcomes(result)[:2] == ["Maker not found", "B1"]
+    assert outcomes(result)[3:] == ["B2", "Duplicate order code in batch"]
+    assert (result["created"], result["failed"]) == (2, 3)
+
+
+def test_codes_already_stored_are_rejected(client, maker, eater, place_order):
+    place_order("B1")
+    result = create_bulk(client, eater, [order_item(maker, "B1"), order_item(maker, "B3")])
+    assert outcomes(result) == ["Order code already exists", "B3"]
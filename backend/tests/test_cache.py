@@ -0,0 +1,90 @@
+import pytest
+
+from backend import cache
+from backend.cache import CachedBody, InMemoryCacheBackend, ResponseCache, TTLCache
+
+from .test_pagination import create_meals
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    clock = Clock()
+    entries = TTLCache(maxsize=2, ttl=10, timer=clock)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.get("a")
+    entries.set("c", 3)
+    assert (entries.get("a"), entries.get("b"), entries.get("c")) == (1, None, 3)
+    clock.now = 10
+    assert entries.get("a") is None
+
+
+def test_cached_entries_keep_their_etag():
+    body = CachedBody(body=b'{"items": []}\n', etag='"abc"')
+    assert CachedBody.from_entry(body.to_entry()) == body
+    # A bare body from before ETags were stored is a miss, not a corrupt hit.
+    assert CachedBody.from_entry(b'{"items": []}') is None
+
+
+def test_hits_reuse_the_stored_etag(client, maker, monkeypatch):
+    create_meals(client, maker, 1)
+    hashed = []
+    original = cache.strong_etag
+    monkeypatch.setattr(cache, "strong_etag", lambda body: hashed.append(body) or original(body))
+
+    first = client.get("/api/meals")
+    second = client.get("/api/meals")
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(hashed) == 1
+
+
+def test_matching_if_none_match_gets_304(client, maker):
+    create_meals(client, maker, 1)
+    etag = client.get("/api/meals").headers["etag"]
+    revalidated = client.get("/api/meals", headers={"If-None-Match": f'"stale", {etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+def test_new_meal_invalidates_meal_pages(client, maker):
+    create_meals(client, maker, 1)
+    before = client.get("/api/meals")
+    create_meals(client, maker, 1)
+    after = client.get("/api/meals", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert len(after.json()["items"]) == 2
+
+
+def test_review_and_reply_invalidate_reviews(client, maker, eater, place_order):
+    order = place_order("R1")
+    url = f"/api/reviews?maker_id={maker['id']}"
+    assert client.get(url).json()["items"] == []
+
+    response = client.post(
+        "/api/reviews",
+        json={"order_id": order["id"], "rating": 4, "comment": "Great crust"},
+        headers=eater["headers"],
+    )
+    assert response.status_code == 201, response.text
+    [review] = client.get(url).json()["items"]
+    assert review["rating"] == 4
+
+    response = client.patch(f"/api/reviews/{review['id']}", json={"reply": "Thanks!"}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    assert client.get(url).json()["items"][0]["reply"] == "Thanks!"
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_disabled_cache_still_sends_etags(enabled):
+    responses = ResponseCache(InMemoryCacheBackend(), ttl=60, enabled=enabled)
+    stored = responses.store("key", dict, {"a": 1})
+    assert stored.etag.startswith('"')
+    assert (responses.get("key") == stored) is enabled
@@ -0,0 +1,73 @@
+import anyio
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from backend import auth, database
+from backend.config import DB_MAX_OVERFLOW, DB_POOL_SIZE, SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE
+from backend.database import async_engine, get_async_session, get_threaded_session
+from backend.models import User
+
+from .conftest import PNG_DATA_URL, TEST_DIR, sign_up
+
+SESSION_OPENERS = [get_threaded_session] + ([get_async_session] if async_engine is not None else [])
+
+
+def count_users() -> int:
+    with database.get_session() as session:
+        return session.scalar(select(func.count(User.id)))
+
+
+@pytest.mark.parametrize("opener", SESSION_OPENERS)
+def test_request_sessions_commit_or_roll_back(opener):
+    async def add_user(email: str, fail: bool) -> None:
+        async with opener() as session:
+            session.add(User(email=email, password_hash="x", role="eater"))
+            await session.flush()
+            if fail:
+                raise RuntimeError("handler failed")
+
+    anyio.run(add_user, "kept@example.com", False)
+    with pytest.raises(RuntimeError):
+        anyio.run(add_user, "dropped@example.com", True)
+    assert count_users() == 1
+
+
+def test_handlers_also_run_on_the_sync_engine(client, monkeypatch):
+    # AUSSIEEAT_DB_MODE=sync hands the same handlers a ThreadedSession over the sync engine.
+    monkeypatch.setattr(database, "open_session", get_threaded_session)
+    monkeypatch.setattr(auth, "open_session", get_threaded_session)
+    maker = sign_up(client, "maker@example.com", "maker")
+    response = client.post(
+        "/api/meals",
+        json={"title": "Lamington", "description": "Coconut", "price": 4.5, "image_data": PNG_DATA_URL},
+        headers=maker["headers"],
+    )
+    assert response.status_code == 201, response.text
+    listed = client.get("/api/meals", params={"maker_id": maker["id"]}).json()["items"]
+    assert [meal["title"] for meal in listed] == ["Lamington"]
+
+
+def test_engine_options_pool_files_and_share_memory_databases():
+    file_options = database.engine_options(make_url(f"sqlite:///{TEST_DIR}/pool.db"))
+    assert file_options["poolclass"] is QueuePool
+    assert (file_options["pool_size"], file_options["max_overflow"]) == (DB_POOL_SIZE, DB_MAX_OVERFLOW)
+    assert database.engine_options(make_url("sqlite+aiosqlite:///pool.db"), is_async=True)["poolclass"] is (
+        AsyncAdaptedQueuePool
+    )
+    memory_options = database.engine_options(make_url("sqlite://"))
+    assert memory_options["poolclass"] is StaticPool
+    assert "pool_size" not in memory_options
+
+
+def test_sqlite_connections_get_the_performance_pragmas():
+    with database.engine.connect() as connection:
+
+        def pragma(name: str):
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == SQLITE_BUSY_TIMEOUT_MS
+        assert pragma("cache_size") == SQLITE_CACHE_SIZE
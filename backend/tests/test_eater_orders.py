@@ -0,0 +1,39 @@
+from backend.database import engine
+
+from .test_pagination import walk
+
+
+def test_eater_orders_come_with_their_reviews_from_one_query(client, maker, eater, place_order, statements):
+    orders = [place_order(f"E{number}") for number in range(5)]
+    for order, rating in [(orders[1], 4), (orders[3], 5)]:
+        response = client.post(
+            "/api/reviews",
+            json={"order_id": order["id"], "rating": rating, "comment": f"Order {order['order_code']}"},
+            headers=eater["headers"],
+        )
+        assert response.status_code == 201, response.text
+
+    statements.clear()
+    response = client.get("/api/eater/orders", params={"limit": 2}, headers=eater["headers"])
+    assert response.status_code == 200, response.text
+    [query] = [statement for statement in statements if "maker_orders" in statement]
+    assert "LEFT OUTER JOIN maker_reviews" in query
+    assert " IN (" not in query
+
+    pages = walk(client, "/api/eater/orders", eater["headers"], limit=2)
+    listed = {order["order_code"]: order["review"] for order in pages}
+    assert listed.keys() == {order["order_code"] for order in orders}
+    assert (listed["E1"]["rating"], listed["E1"]["comment"]) == (4, "Order E1")
+    assert (listed["E3"]["rating"], listed["E3"]["comment"]) == (5, "Order E3")
+    assert listed["E0"] is listed["E2"] is listed["E4"] is None
+
+
+def test_eater_pages_walk_the_eater_order_time_index(client, eater, statements):
+    client.get("/api/eater/orders", params={"limit": 2}, headers=eater["headers"])
+    [query] = [statement for statement in statements if "maker_orders" in statement]
+    with engine.connect() as connection:
+        # eater_id, then the page size plus one and the offset.
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", (eater["id"], 3, 0)).all()
+    details = " ".join(row.detail for row in plan)
+    assert "ix_maker_orders_eater_id_order_time_id" in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import threading
+
+import anyio
+
+from backend import events, main
+from backend.auth import Identity
+from backend.events import ORDER_CREATED, ORDER_STATUS_CHANGED, EventBus, InMemoryEventBus, eater_topic, maker_topic
+
+
+class RecordingBus(EventBus):
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic: str, message: dict) -> None:
+        self.published.append((topic, message["type"], message["order"]["order_code"]))
+
+    def subscribe(self, topic: str):
+        raise NotImplementedError
+
+
+def test_order_writes_publish_to_maker_and_eater_after_commit(client, maker, eater, place_order, monkeypatch):
+    bus = RecordingBus()
+    monkeypatch.setattr(events, "event_bus", bus)
+
+    order = place_order("E1")
+    response = client.patch(f"/api/orders/{order['id']}", json={"status": "ready"}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    # A rejected write rolls back and publishes nothing.
+    fields = ("maker_id", "order_code", "eater_name", "meal_name", "image_id", "price")
+    duplicate = client.post("/api/orders", json={key: order[key] for key in fields}, headers=eater["headers"])
+    assert duplicate.status_code == 409
+
+    assert bus.published == [
+        (maker_topic(maker["id"]), ORDER_CREATED, "E1"),
+        (eater_topic(eater["id"]), ORDER_CREATED, "E1"),
+        (maker_topic(maker["id"]), ORDER_STATUS_CHANGED, "E1"),
+        (eater_topic(eater["id"]), ORDER_STATUS_CHANGED, "E1"),
+    ]
+
+
+def test_in_memory_bus_fans_out_per_topic_and_drops_the_oldest():
+    async def scenario():
+        bus = InMemoryEventBus(queue_size=2)
+        await bus.start()
+        async with bus.subscribe("maker:1") as mine, bus.subscribe("maker:2") as other:
+            # Publishers may run in the threadpool (sync DB mode).
+            thread = threading.Thread(target=bus.publish, args=("maker:1", {"n": 0}))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0)
+            for n in (1, 2):
+                bus.publish("maker:1", {"n": n})
+            assert [(await mine.get())["n"] for _ in range(2)] == [1, 2]
+            assert other.queue.empty()
+        assert bus.subscriptions == {}
+
+    anyio.run(scenario)
+
+
+class DisconnectingRequest:
+    """Reports the client as gone once the stream has sent `messages` events."""
+
+    def __init__(self, messages: int):
+        self.remaining = messages
+
+    async def is_disconnected(self) -> bool:
+        self.remaining -= 1
+        return self.remaining < 0
+
+
+def test_event_stream_sends_the_callers_events(monkeypatch):
+    async def scenario():
+        bus = InMemoryEventBus()
+        await bus.start()
+        monkeypatch.setattr(main, "event_bus", bus)
+        response = await main.stream_order_events(
+            DisconnectingRequest(1), Identity(id=7, email="maker@example.com", role="maker")
+        )
+        assert response.media_type == "text/event-stream"
+        chunks = response.body_iterator
+        assert await chunks.__anext__() == "retry: 3000\n\n"
+        bus.publish(eater_topic(7), {"type": ORDER_CREATED, "order": {"id": 1}})
+        bus.publish(maker_topic(7), {"type": ORDER_CREATED, "order": {"id": 2}})
+        event_type, data = (await chunks.__anext__()).strip().split("\n")
+        assert event_type == f"event: {ORDER_CREATED}"
+        assert json.loads(data.removeprefix("data: "))["order"] == {"id": 2}
+        assert [chunk async for chunk in chunks] == []
+
+    anyio.run(scenario)
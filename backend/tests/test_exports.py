@@ -0,0 +1,100 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime
+
+import anyio
+import pytest
+from sqlalchemy import select, update
+
+from backend import admission, exports
+from backend.admission import AdmissionMiddleware
+from backend.database import engine
+from backend.models import MakerOrder
+
+from .test_admission import StubApp, call
+
+
+@pytest.fixture
+def dated_orders(place_order):
+    """Three orders created on 1, 2 and 3 March 2026."""
+    orders = [place_order(f"X{day}", price=5.0 + day) for day in (1, 2, 3)]
+    with engine.begin() as connection:
+        for day, order in zip((1, 2, 3), orders):
+            connection.execute(
+                update(MakerOrder).where(MakerOrder.id == order["id"]).values(created_at=datetime(2026, 3, day, 12))
+            )
+    return orders
+
+
+def test_orders_export_as_ndjson_within_the_date_range(client, maker, dated_orders):
+    response = client.get(
+        "/api/orders/export",
+        params={"start": "2026-03-02T00:00:00", "end": "2026-03-04T00:00:00"},
+        headers=maker["headers"],
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == f'attachment; filename="orders-{maker["id"]}.ndjson"'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["order_code"], row["price"]) for row in rows] == [("X2", 7.0), ("X3", 8.0)]
+    assert rows[0]["created_at"].startswith("2026-03-02T12:00:00")
+
+
+def test_reviews_export_as_csv(client, maker, eater, dated_orders):
+    for order in dated_orders[:2]:
+        response = client.post(
+            "/api/reviews",
+            json={"order_id": order["id"], "rating": 5, "comment": 'Crisp, "golden" crust'},
+            headers=eater["headers"],
+        )
+        assert response.status_code == 201, response.text
+
+    response = client.get("/api/reviews/export", params={"format": "csv"}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    header, *rows = list(csv.reader(io.StringIO(response.text)))
+    assert header[:3] == ["id", "order_id", "order_code"]
+    assert [row[header.index("order_code")] for row in rows] == ["X1", "X2"]
+    assert rows[0][header.index("comment")] == 'Crisp, "golden" crust'
+
+
+def test_exports_are_for_makers_and_check_the_range(client, maker, eater):
+    assert client.get("/api/orders/export", headers=eater["headers"]).status_code == 403
+    response = client.get(
+        "/api/orders/export",
+        params={"start": "2026-03-02T00:00:00", "end": "2026-03-01T00:00:00"},
+        headers=maker["headers"],
+    )
+    assert response.status_code == 400
+
+
+def test_exports_stream_one_partition_at_a_time(dated_orders, monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_BATCH_SIZE", 2)
+    stmt = select(MakerOrder.order_code).order_by(MakerOrder.id)
+    body = exports.export_response(stmt, "csv", "orders").body_iterator
+
+    async def collect() -> list[str]:
+        if hasattr(body, "__anext__"):
+            return [chunk async for chunk in body]
+        return list(body)
+
+    # The header, then one chunk per yield_per partition.
+    assert anyio.run(collect) == ["order_code\r\n", "X1\r\nX2\r\n", "X3\r\n"]
+
+
+def test_concurrent_exports_are_capped_by_configuration(monkeypatch):
+    monkeypatch.setattr(admission, "MAX_CONCURRENT_EXPORTS", 1)
+
+    async def scenario():
+        app = StubApp(held={"/api/orders/export"})
+        middleware = AdmissionMiddleware(app, rates={})
+        export = asyncio.create_task(call(middleware, "/api/orders/export"))
+        await asyncio.sleep(0.01)
+        assert (await call(middleware, "/api/reviews/export"))[0] == 503
+        app.finish.set()
+        assert (await export)[0] == 200
+        assert (await call(middleware, "/api/reviews/export"))[0] == 200
+
+    asyncio.run(scenario())
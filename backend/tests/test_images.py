@@ -0,0 +1,196 @@
+import base64
+import io
+import threading
+
+import sqlalchemy as sa
+from PIL import Image
+from sqlalchemy import create_engine, inspect
+
+from backend import images
+from backend.config import IMAGE_MAX_DIMENSION
+from backend.database import engine as app_engine, get_session
+from backend.images import (
+    CONTENT_TYPES,
+    THUMBNAIL_FORMAT,
+    THUMBNAIL_SIZES,
+    build_missing_variants,
+    content_hash,
+    process_image,
+)
+from backend.migrations import downgrade_database, upgrade_database
+
+from .conftest import PNG_DATA_URL, TEST_DIR
+
+PNG_BYTES = base64.b64decode(PNG_DATA_URL.partition(",")[2])
+HTML_BYTES = b"<script>alert(document.cookie)</script>"
+HTML_DATA_URL = "data:text/html;base64," + base64.b64encode(HTML_BYTES).decode()
+ORIENTATION_TAG = 0x0112
+CAMERA_MAKE_TAG = 0x010F
+SAFE_HEADERS = {"x-content-type-options": "nosniff", "content-security-policy": "default-src 'none'"}
+
+
+def post_meal(client, maker, **image):
+    return client.post(
+        "/api/meals",
+        json={"title": "Pavlova", "description": "Meringue", "price": 9.0, **image},
+        headers=maker["headers"],
+    )
+
+
+def test_uploads_are_stored_once_by_content(client, maker, place_order):
+    first = post_meal(client, maker, image_data=PNG_DATA_URL).json()
+    # Bare base64 of the same bytes, and an order referencing the stored image.
+    second = post_meal(client, maker, image_data=PNG_DATA_URL.partition(",")[2]).json()
+    third = place_order("I1", image_data=None, image_id=first["image_id"])
+    assert first["image_id"] == second["image_id"] == third["image_id"]
+    assert first["image_url"] == f"/api/images/{first['image_id']}"
+
+
+def test_images_and_thumbnails_are_served_with_etags(client, maker):
+    meal = post_meal(client, maker, image_data=PNG_DATA_URL).json()
+    original = client.get(meal["image_url"])
+    assert original.headers["content-type"] == "image/png"
+    assert "immutable" in original.headers["cache-control"]
+
+    thumb = client.get(meal["thumbnail_url"])
+    assert thumb.headers["content-type"] == "image/webp"
+    revalidated = client.get(meal["thumbnail_url"], headers={"If-None-Match": thumb.headers["etag"]})
+    assert revalidated.status_code == 304
+    for response in (original, thumb, revalidated):
+        assert SAFE_HEADERS.items() <= response.headers.items()
+
+
+def test_stored_non_images_are_served_as_downloads(client, maker):
+    assert post_meal(client, maker, image_data=HTML_DATA_URL).status_code == 400
+    # A blob that predates upload checks, stored under the type its data URL declared.
+    image_id = content_hash(HTML_BYTES)
+    with app_engine.begin() as connection:
+        connection.execute(
+            sa.text("INSERT INTO images (id, content_type, size, data) VALUES (:id, 'text/html', :size, :data)"),
+            {"id": image_id, "size": len(HTML_BYTES), "data": HTML_BYTES},
+        )
+    response = client.get(f"/api/images/{image_id}")
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert SAFE_HEADERS.items() <= response.headers.items()
+
+
+def test_unknown_and_unreadable_images_are_rejected(client, maker, eater):
+    assert client.get("/api/images/" + "0" * 64).status_code == 404
+    assert post_meal(client, maker, image_data="data:image/png;base64,bm90IGFuIGltYWdl").status_code == 400
+    order = {
+        "maker_id": maker["id"],
+        "order_code": "I2",
+        "eater_name": "Eater",
+        "meal_name": "Pavlova",
+        "image_id": "0" * 64,
+        "price": 9.0,
+    }
+    assert client.post("/api/orders", json=order, headers=eater["headers"]).status_code == 404
+
+
+def test_migration_moves_inline_images_into_the_images_table():
+    engine = create_engine(f"sqlite:///{TEST_DIR}/inline-images.db")
+    upgrade_database(engine, "0001")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text("INSERT INTO users (id, email, password_hash, role) VALUES (1, 'm@example.com', 'x', 'maker')")
+        )
+        for meal_id, image_data in [
+            (1, PNG_DATA_URL),
+            (2, PNG_DATA_URL.partition(",")[2]),
+            (3, "not base64 at all"),
+            (4, HTML_DATA_URL),
+        ]:
+            connection.execute(
+                sa.text(
+                    "INSERT INTO meals (id, maker_id, title, description, price, image_data) "
+                    "VALUES (:id, 1, 'Pie', 'Beef', 5.0, :image_data)"
+                ),
+                {"id": meal_id, "image_data": image_data},
+            )
+
+    upgrade_database(engine)
+    assert "image_data" not in {column["name"] for column in inspect(engine).get_columns("meals")}
+    with engine.connect() as connection:
+        meals = dict(connection.execute(sa.text("SELECT id, image_id FROM meals")).all())
+        images = {
+            row.id: row
+            for row in connection.execute(sa.text("SELECT id, content_type, data FROM images")).all()
+        }
+    assert meals[1] == meals[2] == content_hash(PNG_BYTES)
+    assert (images[meals[1]].content_type, images[meals[1]].data) == ("image/png", PNG_BYTES)
+    assert images[meals[3]].data == b"not base64 at all"
+    assert (images[meals[4]].content_type, images[meals[4]].data) == ("application/octet-stream", HTML_BYTES)
+    assert len(images) == 3
+
+    downgrade_database(engine, "0001")
+    with engine.connect() as connection:
+        restored = dict(connection.execute(sa.text("SELECT id, image_data FROM meals")).all())
+    assert restored[1] == restored[2] == PNG_DATA_URL
+    assert base64.b64decode(restored[3].partition(",")[2]) == b"not base64 at all"
+    engine.dispose()
+
+
+def data_url(image: Image.Image, image_format: str, **options) -> str:
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return f"data:image/{image_format.lower()};base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def served_image(client, url: str) -> Image.Image:
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return Image.open(io.BytesIO(response.content))
+
+
+def test_uploads_are_oriented_downsized_stripped_and_thumbnailed(client, maker, monkeypatch):
+    threads = []
+
+    def recording_process(raw: bytes):
+        threads.append(threading.current_thread().name)
+        return process_image(raw)
+
+    monkeypatch.setattr(images, "process_image", recording_process)
+    exif = Image.Exif()
+    exif[ORIENTATION_TAG] = 6  # stored sideways: rotate 90 degrees to display
+    exif[CAMERA_MAKE_TAG] = "Pocket camera"
+    photo = data_url(Image.new("RGB", (3000, 1500), "orange"), "JPEG", exif=exif.tobytes())
+
+    response = post_meal(client, maker, image_data=photo)
+    assert response.status_code == 201, response.text
+    meal = response.json()
+    assert threads and threads[0].startswith("image-process")
+
+    original = served_image(client, meal["image_url"])
+    assert original.size == (IMAGE_MAX_DIMENSION // 2, IMAGE_MAX_DIMENSION)
+    assert not original.getexif()
+    for size, edge in THUMBNAIL_SIZES.items():
+        assert max(served_image(client, f"{meal['image_url']}?size={size}").size) == edge
+
+
+def test_non_image_uploads_are_rejected_before_anything_is_stored(client, maker):
+    svg = b'<svg xmlns="http://www.w3.org/2000/svg" onload="alert(1)"/>'
+    for image_data in (
+        "data:image/png;base64," + base64.b64encode(svg).decode(),
+        HTML_DATA_URL,
+        data_url(Image.new("RGB", (8, 8)), "BMP"),
+    ):
+        response = post_meal(client, maker, image_data=image_data)
+        assert response.status_code == 400, response.text
+    with app_engine.connect() as connection:
+        assert connection.execute(sa.text("SELECT COUNT(*) FROM images")).scalar() == 0
+
+
+def test_backfill_thumbnails_images_stored_before_processing(client):
+    with app_engine.begin() as connection:
+        for data in (PNG_BYTES, b"not an image"):
+            connection.execute(
+                sa.text("INSERT INTO images (id, content_type, size, data) VALUES (:id, 'image/png', :size, :data)"),
+                {"id": content_hash(data), "size": len(data), "data": data},
+            )
+    thumb_url = f"/api/images/{content_hash(PNG_BYTES)}?size=thumb"
+    assert client.get(thumb_url).headers["content-type"] == "image/png"
+
+    with get_session() as session:
+        assert build_missing_variants(session) == (1, 1)
+    assert client.get(thumb_url).headers["content-type"] == CONTENT_TYPES[THUMBNAIL_FORMAT]
@@ -0,0 +1,45 @@
+from .conftest import PNG_DATA_URL, sign_up
+from .test_nearby import save_profile
+
+
+def add_meals(client, account, *titles: str) -> None:
+    for title in titles:
+        response = client.post(
+            "/api/meals",
+            json={"title": title, "description": "Fresh", "price": 8.0, "image_data": PNG_DATA_URL},
+            headers=account["headers"],
+        )
+        assert response.status_code == 201, response.text
+
+
+def makers(client, **params) -> dict:
+    response = client.get("/api/makers", params=params)
+    assert response.status_code == 200, response.text
+    return {summary["name"]: summary for summary in response.json()["items"]}
+
+
+def test_makers_list_counts_and_one_featured_meal(client, maker, statements):
+    save_profile(client, maker, "Pie Palace", None)
+    add_meals(client, maker, "Meat pie", "Pasty", "Sausage roll")
+    other = sign_up(client, "other@example.com", "maker")
+    save_profile(client, other, "Empty Kitchen", None)
+
+    statements.clear()
+    listed = makers(client, seed=1)
+    pies, empty = listed["Pie Palace"], listed["Empty Kitchen"]
+    assert pies["meal_count"] == 3
+    assert pies["featured_meal_name"] in {"Meat pie", "Pasty", "Sausage roll"}
+    assert pies["featured_meal_image"].endswith("?size=thumb")
+    assert (empty["meal_count"], empty["featured_meal_name"], empty["featured_meal_image"]) == (0, None, None)
+    # Counts and the featured meal come from SQL; no image bytes are read.
+    assert statements
+    assert not any("images" in statement for statement in statements)
+
+
+def test_featured_meal_rotates_with_the_seed(client, maker):
+    save_profile(client, maker, "Pie Palace", None)
+    add_meals(client, maker, *(f"Pie {number}" for number in range(6)))
+
+    featured = {seed: makers(client, seed=seed)["Pie Palace"]["featured_meal_name"] for seed in range(12)}
+    assert all(makers(client, seed=seed)["Pie Palace"]["featured_meal_name"] == featured[seed] for seed in (0, 5))
+    assert len(set(featured.values())) > 1
@@ -0,0 +1,28 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+
+from backend.metrics import QUERY_START_KEY, RequestStats, current_stats, instrument_engine
+
+
+def test_failed_statements_leave_no_start_time_behind():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    stats = RequestStats(path="/test")
+    token = current_stats.set(stats)
+    try:
+        with engine.connect() as connection:
+            connection.execute(sa.text("CREATE TABLE seen (id INTEGER PRIMARY KEY)"))
+            connection.execute(sa.text("INSERT INTO seen (id) VALUES (1)"))
+            for _ in range(3):
+                with pytest.raises(IntegrityError):
+                    connection.execute(sa.text("INSERT INTO seen (id) VALUES (1)"))
+            assert connection.info[QUERY_START_KEY] == {}
+            connection.execute(sa.text("SELECT id FROM seen"))
+            assert connection.info[QUERY_START_KEY] == {}
+    finally:
+        current_stats.reset(token)
+        engine.dispose()
+    # Only statements that completed are counted and timed.
+    assert stats.statements == 3
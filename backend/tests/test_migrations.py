@@ -0,0 +1,72 @@
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from sqlalchemy import create_engine
+
+from backend.migrations import (
+    SchemaOutOfDateError,
+    alembic_config,
+    check_database_revision,
+    current_revision,
+    downgrade_database,
+    head_revision,
+    upgrade_database,
+)
+
+from .conftest import TEST_DIR
+
+
+@pytest.fixture
+def new_engine(request):
+    engine = create_engine(f"sqlite:///{TEST_DIR}/{request.node.name}.db")
+    yield engine
+    engine.dispose()
+
+
+def test_migrated_schema_matches_the_models_and_round_trips(new_engine):
+    with pytest.raises(SchemaOutOfDateError):
+        check_database_revision(new_engine)
+    upgrade_database(new_engine)
+    check_database_revision(new_engine)
+
+    config = alembic_config()
+    with new_engine.connect() as connection:
+        config.attributes["connection"] = connection
+        command.check(config)  # raises if the models and the migrated schema differ
+
+    downgrade_database(new_engine, "base")
+    assert current_revision(new_engine) is None
+    assert sa.inspect(new_engine).get_table_names() == ["alembic_version"]
+    upgrade_database(new_engine)
+    assert current_revision(new_engine) == head_revision()
+
+
+def test_databases_from_before_migrations_are_adopted(new_engine):
+    # A database create_all built: the baseline tables, holding data, with no alembic_version.
+    upgrade_database(new_engine, "0001")
+    with new_engine.begin() as connection:
+        connection.execute(sa.text("DROP TABLE alembic_version"))
+        connection.execute(
+            sa.text("INSERT INTO users (id, email, password_hash, role) VALUES (1, 'm@example.com', 'x', 'maker')")
+        )
+
+    upgrade_database(new_engine)
+    check_database_revision(new_engine)
+    with new_engine.connect() as connection:
+        assert connection.execute(sa.text("SELECT email FROM users")).scalar() == "m@example.com"
+
+
+def test_partial_schemas_are_not_adopted(new_engine):
+    with new_engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT)"))
+    with pytest.raises(RuntimeError, match="only some application tables"):
+        upgrade_database(new_engine)
+
+
+def test_schemas_with_unknown_columns_are_not_adopted(new_engine):
+    upgrade_database(new_engine, "0001")
+    with new_engine.begin() as connection:
+        connection.execute(sa.text("DROP TABLE alembic_version"))
+        connection.execute(sa.text("ALTER TABLE meals ADD COLUMN spice_level INTEGER"))
+    with pytest.raises(RuntimeError, match=r"meals \(spice_level\)"):
+        upgrade_database(new_engine)
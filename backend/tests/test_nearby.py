@@ -0,0 +1,92 @@
+import math
+import random
+
+import pytest
+
+from backend.geo import KM_PER_DEGREE, covering_cells, encode_geohash, haversine_km
+
+from .conftest import sign_up
+
+FLINDERS_STREET = (-37.8183, 144.9671)
+
+
+def save_profile(client, maker, name: str, coordinates: tuple[float, float] | None) -> None:
+    profile = {"name": name, "email": "maker@example.com", "phone": "0400 000 000", "country": "Australia"}
+    if coordinates:
+        profile.update(latitude=coordinates[0], longitude=coordinates[1])
+    response = client.put("/api/maker/profile", json={**profile, "location": name}, headers=maker["headers"])
+    assert response.status_code == 200, response.text
+
+
+def offset(origin: tuple[float, float], north_km: float, east_km: float) -> tuple[float, float]:
+    latitude, longitude = origin
+    return (
+        latitude + north_km / KM_PER_DEGREE,
+        longitude + east_km / (KM_PER_DEGREE * math.cos(math.radians(latitude))),
+    )
+
+
+def test_geohash_and_distance():
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert haversine_km(-37.8136, 144.9631, -33.8688, 151.2093) == pytest.approx(713.4, abs=1)
+
+
+@pytest.mark.parametrize(
+    ("centre", "radius_km"),
+    [(FLINDERS_STREET, 0.5), (FLINDERS_STREET, 5.0), ((0.0, 179.99), 20.0), ((-89.9, 0.0), 2.0)],
+)
+def test_covering_cells_contain_the_whole_circle(centre, radius_km):
+    cells = covering_cells(*centre, radius_km)
+    precision = len(cells[0])
+    points = random.Random(7)
+    for _ in range(2000):
+        bearing = points.uniform(0, 2 * math.pi)
+        distance = radius_km * math.sqrt(points.random())
+        latitude, longitude = offset(centre, distance * math.cos(bearing), distance * math.sin(bearing))
+        if abs(latitude) > 90:
+            continue
+        longitude = (longitude + 180) % 360 - 180
+        assert encode_geohash(latitude, longitude, precision) in cells
+
+
+def test_nearby_makers_are_filtered_by_radius_and_sorted_by_distance(client, maker):
+    save_profile(client, maker, "Far", offset(FLINDERS_STREET, 0, 9))
+    makers = {"Far": maker["id"]}
+    for name, coordinates in [
+        ("Next door", offset(FLINDERS_STREET, 0.1, 0)),
+        ("Across the river", offset(FLINDERS_STREET, -1.5, 1.5)),
+        ("Nowhere", None),
+    ]:
+        account = sign_up(client, f"{name.replace(' ', '.').lower()}@example.com", "maker")
+        save_profile(client, account, name, coordinates)
+        makers[name] = account["id"]
+
+    response = client.get(
+        "/api/makers/nearby", params={"lat": FLINDERS_STREET[0], "lng": FLINDERS_STREET[1], "radius": 5}
+    )
+    assert response.status_code == 200, response.text
+    nearby = response.json()
+    assert [found["maker_id"] for found in nearby] == [makers["Next door"], makers["Across the river"]]
+    assert nearby[0]["distance_km"] == pytest.approx(0.1, abs=0.001)
+    assert nearby[1]["distance_km"] == pytest.approx(math.hypot(1.5, 1.5), abs=0.01)
+
+    wider = client.get(
+        "/api/makers/nearby", params={"lat": FLINDERS_STREET[0], "lng": FLINDERS_STREET[1], "radius": 10}
+    ).json()
+    assert [found["maker_id"] for found in wider][-1] == makers["Far"]
+
+
+def test_coordinates_must_come_in_pairs(client, maker):
+    response = client.put(
+        "/api/maker/profile",
+        json={
+            "name": "Half",
+            "email": "maker@example.com",
+            "phone": "0400 000 000",
+            "country": "Australia",
+            "location": "Somewhere",
+            "latitude": -37.8,
+        },
+        headers=maker["headers"],
+    )
+    assert response.status_code == 422
@@ -0,0 +1,141 @@
+import base64
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from backend.migrations import upgrade_database
+from backend.models import Meal, MakerOrder, MakerProfile
+from backend.pagination import InvalidCursorError, decode_cursor, encode_cursor, page_of, paginate
+
+from .conftest import PNG_DATA_URL, TEST_DIR
+
+
+def raw_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def create_meals(client, maker, count: int) -> list[int]:
+    ids = []
+    for number in range(count):
+        response = client.post(
+            "/api/meals",
+            json={"title": f"Pie {number}", "description": "Flaky", "price": 5.0, "image_data": PNG_DATA_URL},
+            headers=maker["headers"],
+        )
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+def walk(client, url: str, headers=None, **params) -> list[dict]:
+    """Every item of a list endpoint, two per page."""
+    items, cursor = [], None
+    while True:
+        page_params = {**params, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(url, params=page_params, headers=headers).json()
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_cursor_round_trip():
+    keys = (Meal.created_at, Meal.id)
+    row = SimpleNamespace(created_at=datetime(2026, 10, 17, 8, 30), id=7)
+    page = page_of([row, row], keys, limit=1)
+    assert decode_cursor(page["next_cursor"], keys) == [row.created_at, 7]
+    assert decode_cursor(encode_cursor([1.5, 3]), (Meal.price, Meal.id)) == [1.5, 3]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        raw_cursor({"created_at": "2026-10-17T00:00:00"}),
+        raw_cursor(["2026-10-17T00:00:00"]),
+        raw_cursor(["2026-10-17T00:00:00", {"a": 1}]),
+        raw_cursor(["2026-10-17T00:00:00", "7"]),
+        raw_cursor(["2026-10-17T00:00:00", True]),
+        raw_cursor(["2026-10-17T00:00:00", 7.5]),
+        raw_cursor(["yesterday", 7]),
+        raw_cursor([20261017, 7]),
+    ],
+)
+def test_decode_rejects_malformed_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, (Meal.created_at, Meal.id))
+
+
+def test_decode_checks_integer_and_float_keys():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(raw_cursor(["nope"]), (MakerProfile.id,))
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(raw_cursor([{"x": 1}]), (MakerProfile.id,))
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor([float("nan"), 1]), (Meal.price, Meal.id))
+
+
+def test_meal_pages_cover_every_meal_once_newest_first(client, maker):
+    ids = create_meals(client, maker, 5)
+    assert [meal["id"] for meal in walk(client, "/api/meals")] == list(reversed(ids))
+
+
+def test_order_pages_cover_every_order_once(client, maker, place_order):
+    ids = [place_order(f"P{number}")["id"] for number in range(5)]
+    assert [order["id"] for order in walk(client, "/api/orders", maker["headers"])] == list(reversed(ids))
+
+
+@pytest.mark.parametrize("url", ["/api/meals", "/api/orders", "/api/eater/orders", "/api/makers"])
+@pytest.mark.parametrize(
+    "values",
+    [["2026-10-17T00:00:00", {"a": 1}], [{"x": 1}], ["nope"], ["2026-10-17T00:00:00", [1]]],
+)
+def test_malformed_cursors_are_rejected_with_400(client, maker, eater, url, values):
+    headers = eater["headers"] if url.startswith("/api/eater") else maker["headers"]
+    response = client.get(url, params={"cursor": raw_cursor(values)}, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_pages_advance_over_rows_stored_before_migrations():
+    """Rows from the create_all era hold CURRENT_TIMESTAMP text ('YYYY-MM-DD HH:MM:SS'), which
+    sorts below the same instant bound from a cursor unless the migrations rewrite it."""
+    engine = sa.create_engine(f"sqlite:///{TEST_DIR}/second-precision.db")
+    upgrade_database(engine, "0001")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text("INSERT INTO users (id, email, password_hash, role) VALUES (1, 'm@example.com', 'x', 'maker')")
+        )
+        for number in range(1, 6):
+            connection.execute(
+                sa.text(
+                    "INSERT INTO meals (id, maker_id, title, description, price, image_data) "
+                    "VALUES (:id, 1, 'Pie', 'Beef', 5.0, :image)"
+                ),
+                {"id": number, "image": PNG_DATA_URL},
+            )
+            connection.execute(
+                sa.text(
+                    "INSERT INTO maker_orders (id, maker_id, order_code, eater_name, meal_name, image_data, price, "
+                    "status, eater_id) VALUES (:id, 1, :code, 'Eater', 'Pie', :image, 5.0, 'pending', 1)"
+                ),
+                {"id": number, "code": f"OLD{number}", "image": PNG_DATA_URL},
+            )
+    upgrade_database(engine)
+
+    for keys in [(Meal.created_at, Meal.id), (MakerOrder.order_time, MakerOrder.id)]:
+        seen, cursor = [], None
+        with Session(engine) as session:
+            for _ in range(5):
+                rows = session.execute(paginate(sa.select(*keys), keys, 2, cursor)).all()
+                page = page_of(rows, keys, 2)
+                seen.extend(row.id for row in page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+        assert seen == [5, 4, 3, 2, 1]
+    engine.dispose()
@@ -0,0 +1,52 @@
+import pytest
+
+from .conftest import PNG_DATA_URL
+from .test_pagination import raw_cursor, walk
+
+
+def add_meal(client, maker, title: str, description: str) -> int:
+    response = client.post(
+        "/api/meals",
+        json={"title": title, "description": description, "price": 8.0, "image_data": PNG_DATA_URL},
+        headers=maker["headers"],
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_title_matches_rank_first_and_pages_cover_every_hit(client, maker):
+    in_description = [add_meal(client, maker, f"Roll {number}", "Served with a pie crust") for number in range(3)]
+    in_title = add_meal(client, maker, "Pie", "Beef and gravy")
+    add_meal(client, maker, "Lamington", "Coconut sponge")
+
+    hits = walk(client, "/api/search", q="pie")
+    assert hits[0]["id"] == in_title
+    assert sorted(hit["id"] for hit in hits) == sorted([in_title, *in_description])
+
+
+def test_maker_search(client, maker):
+    response = client.put(
+        "/api/maker/profile",
+        json={
+            "name": "Pie Palace",
+            "email": "maker@example.com",
+            "phone": "0400 000 000",
+            "country": "Australia",
+            "location": "Fitzroy",
+        },
+        headers=maker["headers"],
+    )
+    assert response.status_code == 200, response.text
+    hits = client.get("/api/search", params={"q": "fitzroy", "kind": "makers"}).json()["items"]
+    assert [hit["maker_id"] for hit in hits] == [maker["id"]]
+
+
+@pytest.mark.parametrize("kind", ["meals", "makers"])
+@pytest.mark.parametrize(
+    "values",
+    [[1.0, {"a": 1}], ["1.0", 3], [1.0, "3"], [True, 3], [1.0], [[1.0], 3]],
+)
+def test_malformed_search_cursors_are_rejected_with_400(client, kind, values):
+    response = client.get("/api/search", params={"q": "pie", "kind": kind, "cursor": raw_cursor(values)})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
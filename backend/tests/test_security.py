@@ -0,0 +1,49 @@
+import threading
+
+import anyio
+from passlib.hash import pbkdf2_sha256
+from sqlalchemy import select
+
+from backend import security
+from backend.config import PASSWORD_HASH_ROUNDS
+from backend.database import get_session
+from backend.models import User
+
+from .conftest import sign_up
+
+
+def stored_hash(email: str) -> str:
+    with get_session() as session:
+        return session.scalar(select(User.password_hash).where(User.email == email))
+
+
+def test_hashing_runs_on_the_hash_executor(monkeypatch):
+    threads = []
+
+    def recording_hash(password: str) -> str:
+        threads.append(threading.current_thread().name)
+        return pbkdf2_sha256.using(rounds=PASSWORD_HASH_ROUNDS).hash(password)
+
+    monkeypatch.setattr(security, "hash_password", recording_hash)
+    hashed = anyio.run(security.hash_password_async, "password123")
+    assert threads[0].startswith("password-hash")
+    assert security.verify_password("password123", hashed)
+
+
+def test_login_rehashes_passwords_made_with_other_settings(client):
+    sign_up(client, "eater@example.com", "eater")
+    assert f"${PASSWORD_HASH_ROUNDS}$" in stored_hash("eater@example.com")
+
+    outdated = pbkdf2_sha256.using(rounds=PASSWORD_HASH_ROUNDS + 1).hash("password123")
+    with get_session() as session:
+        session.get(User, session.scalar(select(User.id))).password_hash = outdated
+
+    wrong = client.post("/api/auth/login", json={"email": "eater@example.com", "password": "wrong-password"})
+    assert wrong.status_code == 401
+    assert stored_hash("eater@example.com") == outdated
+
+    login = client.post("/api/auth/login", json={"email": "eater@example.com", "password": "password123"})
+    assert login.status_code == 200, login.text
+    rehashed = stored_hash("eater@example.com")
+    assert f"${PASSWORD_HASH_ROUNDS}$" in rehashed
+    assert security.verify_password("password123", rehashed)
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, field_serializer
+from sqlalchemy import select
+
+from backend.database import get_session
+from backend.models import MakerOrder, Meal
+from backend.schemas import EaterOrderResponse, MakerOrderResponse, MealResponse, Page
+from backend.serialization import dump_trusted
+
+from .conftest import PNG_DATA_URL
+
+
+def pydantic_json(model, data) -> bytes:
+    adapter = TypeAdapter(model)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def test_trusted_rows_encode_exactly_like_pydantic(client, maker, place_order):
+    client.post(
+        "/api/meals",
+        json={"title": "Damper", "description": "Bush bread", "price": 3.0, "image_data": PNG_DATA_URL},
+        headers=maker["headers"],
+    )
+    place_order("J1", order_time="2026-03-01T09:30:00+11:00")
+    with get_session() as session:
+        meals = {"items": session.scalars(select(Meal)).all(), "next_cursor": "abc"}
+        orders = {"items": session.scalars(select(MakerOrder)).all(), "next_cursor": None}
+        order_rows = session.execute(select(MakerOrder.__table__)).all()
+        assert dump_trusted(Page[MealResponse], meals) == pydantic_json(Page[MealResponse], meals)
+        assert dump_trusted(Page[MakerOrderResponse], orders) == pydantic_json(Page[MakerOrderResponse], orders)
+        assert dump_trusted(List[MakerOrderResponse], order_rows) == pydantic_json(List[MakerOrderResponse], order_rows)
+
+
+@pytest.mark.parametrize(
+    "order_time",
+    [
+        datetime(2026, 3, 1, 9, 30),
+        datetime(2026, 3, 1, 9, 30, 5, 120, tzinfo=timezone.utc),
+        datetime(2026, 3, 1, 9, 30, tzinfo=timezone(timedelta(hours=10))),
+    ],
+)
+def test_nested_dicts_and_datetimes_encode_like_pydantic(order_time):
+    order = {
+        "id": 1,
+        "maker_id": 2,
+        "eater_id": None,
+        "order_code": "J1",
+        "eater_name": "Eater",
+        "meal_name": "Pie",
+        "image_id": "a" * 64,
+        "price": 9.5,
+        "order_time": order_time,
+        "status": "pending",
+    }
+    page = {
+        "items": [
+            {**order, "review": None},
+            {**order, "id": 3, "review": {"review_id": 4, "rating": 5, "comment": "Yum", "reply": None}},
+        ]
+    }
+    assert dump_trusted(Page[EaterOrderResponse], page) == pydantic_json(Page[EaterOrderResponse], page)
+
+
+def test_models_with_custom_serializers_are_refused():
+    class Rounded(BaseModel):
+        price: float
+
+        @field_serializer("price")
+        def round_price(self, price: float) -> float:
+            return round(price)
+
+    with pytest.raises(TypeError):
+        dump_trusted(Rounded, {"price": 1.2})
@@ -0,0 +1,62 @@
+from sqlalchemy import select
+
+from backend.database import engine
+from backend.models import MakerStats
+from backend.stats import rebuild_maker_stats
+
+from .conftest import sign_up
+from .test_nearby import save_profile
+
+
+def review(client, eater, order, rating: int):
+    response = client.post(
+        "/api/reviews",
+        json={"order_id": order["id"], "rating": rating, "comment": "Tasty"},
+        headers=eater["headers"],
+    )
+    assert response.status_code == 201, response.text
+
+
+def stats(client, maker) -> dict:
+    response = client.get(f"/api/makers/{maker['id']}/stats")
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_stats_follow_each_review(client, maker, eater, place_order):
+    save_profile(client, maker, "Pie Palace", None)
+    assert client.get("/api/makers").json()["items"][0]["review_count"] == 0
+    empty = stats(client, maker)
+    assert (empty["review_count"], empty["average_rating"], empty["last_review_at"]) == (0, None, None)
+
+    for code, rating in [("S1", 5), ("S2", 4), ("S3", 4)]:
+        review(client, eater, place_order(code), rating)
+
+    result = stats(client, maker)
+    assert result["review_count"] == 3
+    assert result["average_rating"] == 4.33
+    assert result["rating_histogram"] == {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}
+    assert result["last_review_at"] is not None
+
+    [summary] = client.get("/api/makers").json()["items"]
+    assert (summary["review_count"], summary["average_rating"]) == (3, 4.33)
+
+
+def stats_rows() -> list:
+    with engine.connect() as connection:
+        return connection.execute(select(MakerStats.__table__).order_by(MakerStats.maker_id)).all()
+
+
+def test_rebuild_matches_incremental_stats(client, maker, eater, place_order):
+    sign_up(client, "other@example.com", "maker")
+    for code, rating in [("S1", 2), ("S2", 3), ("S3", 3)]:
+        review(client, eater, place_order(code), rating)
+    incremental = stats_rows()
+
+    with engine.begin() as connection:
+        assert rebuild_maker_stats(connection) == 1
+    assert stats_rows() == incremental
+
+
+def test_unknown_maker_has_no_stats(client, eater):
+    assert client.get(f"/api/makers/{eater['id']}/stats").status_code == 404
@@ -0,0 +1,49 @@
+import pytest
+
+from backend.schemas import MakerOrderSummaryResponse, MakerReviewSummaryResponse, MealSummaryResponse
+
+from .conftest import PNG_DATA_URL
+from .test_pagination import walk
+
+
+@pytest.fixture
+def catalogue(client, maker, eater, place_order):
+    for number in range(3):
+        response = client.post(
+            "/api/meals",
+            json={"title": f"Pie {number}", "description": "A long story " * 20, "price": 7.5, "image_data": PNG_DATA_URL},
+            headers=maker["headers"],
+        )
+        assert response.status_code == 201, response.text
+        order = place_order(f"V{number}")
+        response = client.post(
+            "/api/reviews",
+            json={"order_id": order["id"], "rating": 4, "comment": "Flaky pastry " * 20},
+            headers=eater["headers"],
+        )
+        assert response.status_code == 201, response.text
+
+
+@pytest.mark.parametrize(
+    ("url", "account", "schema", "heavy_column", "params"),
+    [
+        ("/api/meals", None, MealSummaryResponse, "meals.description", {}),
+        ("/api/orders", "maker", MakerOrderSummaryResponse, "maker_orders.eater_id", {}),
+        ("/api/eater/orders", "eater", MakerOrderSummaryResponse, "maker_reviews", {}),
+        ("/api/reviews", None, MakerReviewSummaryResponse, "maker_reviews.comment", {"maker_id": None}),
+    ],
+)
+def test_summary_views_carry_only_their_fields(
+    client, request, catalogue, statements, maker, url, account, schema, heavy_column, params
+):
+    headers = request.getfixturevalue(account)["headers"] if account else None
+    params = {key: maker["id"] for key in params}
+    full = walk(client, url, headers, **params)
+    statements.clear()
+    summary = walk(client, url, headers, view="summary", limit=2, **params)
+
+    fields = set(schema.model_fields) | set(schema.model_computed_fields)
+    assert len(summary) == len(full) == 3
+    assert all(set(item) == fields for item in summary)
+    assert summary == [{field: item[field] for field in fields} for item in full]
+    assert not any(heavy_column in statement for statement in statements)
@@ -10,12 +10,22 @@ import {
   Home as HomeIcon,
   MapPin,
   ShoppingCart,
+  Star,
   Store,
   UserRound,
 } from "lucide-react";
 
+import { LoadMoreButton } from "@/components/load-more-button";
 import { Button } from "@/components/ui/button";
-import { API_BASE_URL } from "@/lib/api";
+import {
+  API_BASE_URL,
+  FIRST_PAGE,
+  type PageCursor,
+  appendNew,
+  authHeaders,
+  fetchPage,
+  imageSrc,
+} from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -30,6 +40,8 @@ type MakerSummary = {
   meal_count: number;
   featured_meal_name: string | null;
   featured_meal_image: string | null;
+  review_count: number;
+  average_rating: number | null;
 };
 
 type Meal = {
@@ -38,7 +50,9 @@ type Meal = {
   title: string;
   description: string;
   price: number;
-  image_data: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
 };
 
 const navItems = [
@@ -66,9 +80,12 @@ export default function EaterListPage() {
   const [makers, setMakers] = useState<MakerSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [makersCursor, setMakersCursor] = useState(FIRST_PAGE);
+  const [loadingMoreMakers, setLoadingMoreMakers] = useState(false);
 
   const [selectedMaker, setSelectedMaker] = useState<MakerSummary | null>(null);
   const [makerMeals, setMakerMeals] = useState<Record<number, Meal[]>>({});
+  const [makerMealCursors, setMakerMealCursors] = useState<Record<number, PageCursor>>({});
   const [mealsLoading, setMealsLoading] = useState(false);
   const [mealError, setMealError] = useState<string | null>(null);
 
@@ -92,12 +109,12 @@ export default function EaterListPage() {
     const fetchMakers = async () => {
       setLoading(true);
       try {
-        const response = await fetch(`${API_BASE_URL}/api/makers`);
-        if (!response.ok) {
-          throw new Error("Unable to load makers right now.");
-        }
-        const data = (await response.json()) as MakerSummary[];
-        setMakers(data);
+        const { items, cursor } = await fetchPage<MakerSummary>(
+          `${API_BASE_URL}/api/makers`,
+          "Unable to load makers right now.",
+        );
+        setMakers(items);
+        setMakersCursor(cursor);
         setError(null);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Failed to load makers");
@@ -109,6 +126,24 @@ export default function EaterListPage() {
     fetchMakers();
   }, []);
 
+  const loadMoreMakers = async () => {
+    setLoadingMoreMakers(true);
+    try {
+      const { items, cursor } = await fetchPage<MakerSummary>(
+        `${API_BASE_URL}/api/makers`,
+        "Unable to load makers right now.",
+        undefined,
+        makersCursor,
+      );
+      setMakers((prev) => appendNew(prev, items, (maker) => maker.maker_id));
+      setMakersCursor(cursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : "Failed to load makers");
+    } finally {
+      setLoadingMoreMakers(false);
+    }
+  };
+
   const eaterName = useMemo(() => {
     if (!user?.email) return "Eater";
     return user.email.split("@")[0]?.replace(/\W+/g, " ")?.trim() || "Eater";
@@ -127,12 +162,12 @@ export default function EaterListPage() {
 
       setMealsLoading(true);
       try {
-        const response = await fetch(`${API_BASE_URL}/api/meals?maker_id=${maker.maker_id}`);
-        if (!response.ok) {
-          throw new Error("Unable to load this maker's meals right now.");
-        }
-        const data = (await response.json()) as Meal[];
-        setMakerMeals((prev) => ({ ...prev, [maker.maker_id]: data }));
+        const { items, cursor } = await fetchPage<Meal>(
+          `${API_BASE_URL}/api/meals?maker_id=${maker.maker_id}`,
+          "Unable to load this maker's meals right now.",
+        );
+        setMakerMeals((prev) => ({ ...prev, [maker.maker_id]: items }));
+        setMakerMealCursors((prev) => ({ ...prev, [maker.maker_id]: cursor }));
       } catch (err) {
         setMealError(err instanceof Error ? err.message : "Failed to load meals");
       } finally {
@@ -142,6 +177,27 @@ export default function EaterListPage() {
     [makerMeals],
   );
 
+  const loadMoreMakerMeals = async (maker: MakerSummary) => {
+    setMealsLoading(true);
+    try {
+      const { items, cursor } = await fetchPage<Meal>(
+        `${API_BASE_URL}/api/meals?maker_id=${maker.maker_id}`,
+        "Unable to load this maker's meals right now.",
+        undefined,
+        makerMealCursors[maker.maker_id],
+      );
+      setMakerMeals((prev) => ({
+        ...prev,
+        [maker.maker_id]: appendNew(prev[maker.maker_id] ?? [], items, (meal) => meal.id),
+      }));
+      setMakerMealCursors((prev) => ({ ...prev, [maker.maker_id]: cursor }));
+    } catch (err) {
+      setMealError(err instanceof Error ? err.message : "Failed to load meals");
+    } finally {
+      setMealsLoading(false);
+    }
+  };
+
   const closeMaker = () => {
     if (ordering) return;
     setSelectedMaker(null);
@@ -178,14 +234,14 @@ export default function EaterListPage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/orders`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({
           maker_id: selectedMeal.maker_id,
           order_code: orderCode,
           eater_name: eaterName,
           eater_id: user.id,
           meal_name: selectedMeal.title,
-          image_data: selectedMeal.image_data,
+          image_id: selectedMeal.image_id,
           price: selectedMeal.price,
         }),
       });
@@ -258,7 +314,7 @@ export default function EaterListPage() {
                   <div className="relative h-24 w-full overflow-hidden rounded-t-3xl">
                     {maker.featured_meal_image ? (
                       <Image
-                        src={maker.featured_meal_image}
+                        src={imageSrc(maker.featured_meal_image)}
                         alt={maker.featured_meal_name ?? maker.name}
                         fill
                         sizes="160px"
@@ -276,6 +332,14 @@ export default function EaterListPage() {
                   </div>
                   <div className="space-y-1 px-4 py-3 text-sm text-neutral-800">
                     <p className="font-semibold">{maker.name}</p>
+                    {maker.average_rating !== null ? (
+                      <p className="flex items-center gap-1 text-xs text-neutral-600">
+                        <Star className="size-3.5 fill-[#ffb547] text-[#ffb547]" aria-hidden />
+                        <span>
+                          {maker.average_rating.toFixed(1)} ({maker.review_count})
+                        </span>
+                      </p>
+                    ) : null}
                     <p className="flex items-center gap-1 text-xs text-neutral-500">
                       <MapPin className="size-3.5 text-[#f38f6b]" aria-hidden />
                       <span className="line-clamp-2">{maker.location}</span>
@@ -292,6 +356,9 @@ export default function EaterListPage() {
               ))}
             </div>
           )}
+          {error || loading ? null : (
+            <LoadMoreButton cursor={makersCursor} loading={loadingMoreMakers} onLoadMore={loadMoreMakers} />
+          )}
         </section>
 
         <nav className="mt-auto w-full pt-12">
@@ -355,7 +422,7 @@ export default function EaterListPage() {
                   >
                     <div className="relative h-20 w-20 flex-shrink-0 overflow-hidden rounded-2xl">
                       <Image
-                        src={meal.image_data}
+                        src={imageSrc(meal.thumbnail_url)}
                         alt={meal.title}
                         fill
                         sizes="80px"
@@ -376,6 +443,11 @@ export default function EaterListPage() {
                     </div>
                   </button>
                 ))}
+                <LoadMoreButton
+                  cursor={makerMealCursors[selectedMaker.maker_id] ?? FIRST_PAGE}
+                  loading={mealsLoading}
+                  onLoadMore={() => void loadMoreMakerMeals(selectedMaker)}
+                />
               </div>
             ) : (
               <p className="mt-4 text-center text-sm font-semibold text-neutral-500">
@@ -391,7 +463,7 @@ export default function EaterListPage() {
           <div className="w-full max-w-sm rounded-[2rem] bg-white p-6 shadow-[0_35px_70px_rgba(0,0,0,0.45)]">
             <div className="relative h-44 w-full overflow-hidden rounded-2xl">
               <Image
-                src={selectedMeal.image_data}
+                src={imageSrc(selectedMeal.image_url)}
                 alt={selectedMeal.title}
                 fill
                 sizes="320px"
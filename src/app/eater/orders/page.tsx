@@ -7,8 +7,18 @@ import { useCallback, useEffect, useMemo, useState } from "react";
 
 import { Home as HomeIcon, ShoppingCart, Star, Store, UserRound } from "lucide-react";
 
+import { LoadMoreButton } from "@/components/load-more-button";
 import { Button } from "@/components/ui/button";
-import { API_BASE_URL } from "@/lib/api";
+import {
+  API_BASE_URL,
+  FIRST_PAGE,
+  appendNew,
+  authHeaders,
+  fetchPage,
+  imageSrc,
+  subscribeToOrderEvents,
+  upsertById,
+} from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -30,7 +40,9 @@ type EaterOrder = {
   order_code: string;
   eater_name: string;
   meal_name: string;
-  image_data: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
   price: number;
   order_time: string;
   status: string;
@@ -79,6 +91,8 @@ export default function EaterOrdersPage() {
   const [orders, setOrders] = useState<EaterOrder[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [ordersCursor, setOrdersCursor] = useState(FIRST_PAGE);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [activeTab, setActiveTab] = useState<"active" | "completed">("active");
 
   const [reviewOrder, setReviewOrder] = useState<EaterOrder | null>(null);
@@ -113,12 +127,13 @@ export default function EaterOrdersPage() {
         setLoading(true);
       }
       try {
-        const response = await fetch(`${API_BASE_URL}/api/eater/orders?eater_id=${user.id}`);
-        if (!response.ok) {
-          throw new Error("Unable to load your orders");
-        }
-        const data = (await response.json()) as EaterOrder[];
-        setOrders(data);
+        const { items, cursor } = await fetchPage<EaterOrder>(
+          `${API_BASE_URL}/api/eater/orders`,
+          "Unable to load your orders",
+          { headers: authHeaders() },
+        );
+        setOrders(items);
+        setOrdersCursor(cursor);
         setError(null);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Failed to load orders");
@@ -133,15 +148,29 @@ export default function EaterOrdersPage() {
     void fetchOrders();
     if (!user) return;
 
-    const intervalId = window.setInterval(() => {
-      void fetchOrders({ background: true });
-    }, 8000);
-
-    return () => {
-      window.clearInterval(intervalId);
-    };
+    return subscribeToOrderEvents<EaterOrder>(({ order }) => {
+      setOrders((prev) => upsertById(prev, order));
+    });
   }, [user, fetchOrders]);
 
+  const loadMoreOrders = async () => {
+    setLoadingMore(true);
+    try {
+      const { items, cursor } = await fetchPage<EaterOrder>(
+        `${API_BASE_URL}/api/eater/orders`,
+        "Unable to load your orders",
+        { headers: authHeaders() },
+        ordersCursor,
+      );
+      setOrders((prev) => appendNew(prev, items, (order) => order.id));
+      setOrdersCursor(cursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : "Failed to load orders");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const activeOrders = useMemo(
     () => orders.filter((order) => order.status !== "completed"),
     [orders]
@@ -180,7 +209,7 @@ export default function EaterOrdersPage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/reviews`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({
           order_id: reviewOrder.id,
           rating,
@@ -286,7 +315,7 @@ export default function EaterOrdersPage() {
                   <div className="flex gap-3">
                     <div className="relative h-20 w-20 overflow-hidden rounded-2xl">
                       <Image
-                        src={order.image_data}
+                        src={imageSrc(order.thumbnail_url)}
                         alt={order.meal_name}
                         fill
                         sizes="80px"
@@ -364,6 +393,9 @@ export default function EaterOrdersPage() {
               ))}
             </div>
           )}
+          {error || loading ? null : (
+            <LoadMoreButton cursor={ordersCursor} loading={loadingMore} onLoadMore={loadMoreOrders} />
+          )}
         </section>
 
         <nav className="mt-auto w-full pt-12">
@@ -8,7 +8,7 @@ import { useEffect, useMemo, useState } from "react";
 import { Home as HomeIcon, ShoppingCart, Store, UserRound } from "lucide-react";
 
 import { Button } from "@/components/ui/button";
-import { API_BASE_URL } from "@/lib/api";
+import { API_BASE_URL, authHeaders, fetchPage, imageSrc } from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -22,7 +22,9 @@ type Meal = {
   title: string;
   description: string;
   price: number;
-  image_data: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
 };
 
 const navItems = [
@@ -70,12 +72,12 @@ export default function EaterHomePage() {
     const fetchMeals = async () => {
       setLoading(true);
       try {
-        const response = await fetch(`${API_BASE_URL}/api/meals`);
-        if (!response.ok) {
-          throw new Error("Unable to load meals right now.");
-        }
-        const data = (await response.json()) as Meal[];
-        setMeals(data);
+        // The page features only the newest few meals, so the first page is enough.
+        const { items } = await fetchPage<Meal>(
+          `${API_BASE_URL}/api/meals`,
+          "Unable to load meals right now.",
+        );
+        setMeals(items);
         setError(null);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Failed to load meals");
@@ -131,14 +133,14 @@ export default function EaterHomePage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/orders`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({
           maker_id: selectedMeal.maker_id,
           order_code: orderCode,
           eater_name: eaterName,
           eater_id: user.id,
           meal_name: selectedMeal.title,
-          image_data: selectedMeal.image_data,
+          image_id: selectedMeal.image_id,
           price: selectedMeal.price,
         }),
       });
@@ -206,7 +208,7 @@ export default function EaterHomePage() {
             >
               <div className="relative h-44 w-full overflow-hidden rounded-t-3xl">
                 <Image
-                  src={todaySpecial.image_data}
+                  src={imageSrc(todaySpecial.image_url)}
                   alt={todaySpecial.title}
                   fill
                   sizes="320px"
@@ -270,7 +272,7 @@ export default function EaterHomePage() {
                   >
                     <div className="relative h-24 w-full overflow-hidden rounded-t-3xl">
                       <Image
-                        src={meal.image_data}
+                        src={imageSrc(meal.thumbnail_url)}
                         alt={meal.title}
                         fill
                         sizes="160px"
@@ -317,7 +319,7 @@ export default function EaterHomePage() {
           <div className="w-full max-w-sm rounded-[2rem] bg-white p-6 shadow-[0_25px_50px_rgba(0,0,0,0.35)]">
             <div className="relative h-44 w-full overflow-hidden rounded-2xl">
               <Image
-                src={selectedMeal.image_data}
+                src={imageSrc(selectedMeal.image_url)}
                 alt={selectedMeal.title}
                 fill
                 sizes="320px"
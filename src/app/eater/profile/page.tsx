@@ -8,7 +8,7 @@ import { Home as HomeIcon, ShoppingCart, Store, UserRound } from "lucide-react";
 
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
-import { API_BASE_URL } from "@/lib/api";
+import { API_BASE_URL, authHeaders } from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -78,9 +78,9 @@ export default function EaterProfilePage() {
       }
       setLoading(true);
       try {
-        const response = await fetch(
-          `${API_BASE_URL}/api/eater/profile?eater_id=${user.id}`
-        );
+        const response = await fetch(`${API_BASE_URL}/api/eater/profile`, {
+          headers: authHeaders(),
+        });
         if (!response.ok) {
           throw new Error("Unable to load profile");
         }
@@ -123,9 +123,8 @@ export default function EaterProfilePage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/eater/profile`, {
         method: "PUT",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({
-          eater_id: user.id,
           display_name: draft.display_name,
           phone: draft.phone,
           favorite_cuisine: draft.favorite_cuisine,
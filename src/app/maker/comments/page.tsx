@@ -12,8 +12,9 @@ import {
   UserRound,
 } from "lucide-react";
 
+import { LoadMoreButton } from "@/components/load-more-button";
 import { Button } from "@/components/ui/button";
-import { API_BASE_URL } from "@/lib/api";
+import { API_BASE_URL, FIRST_PAGE, appendNew, authHeaders, fetchPage, imageSrc } from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -27,7 +28,9 @@ type MakerReview = {
   order_code: string;
   eater_name: string;
   meal_name: string;
-  image_data: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
   rating: number;
   comment: string;
   reply: string | null;
@@ -69,6 +72,8 @@ export default function MakerCommentsPage() {
   const [user, setUser] = useState<StoredUser | null>(null);
   const [reviews, setReviews] = useState<MakerReview[]>([]);
   const [loading, setLoading] = useState(true);
+  const [reviewsCursor, setReviewsCursor] = useState(FIRST_PAGE);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [status, setStatus] = useState<{ error: string | null; message: string | null }>({
     error: null,
     message: null,
@@ -94,14 +99,12 @@ export default function MakerCommentsPage() {
       }
       setLoading(true);
       try {
-        const response = await fetch(
-          `${API_BASE_URL}/api/reviews?maker_id=${user.id}`
+        const { items, cursor } = await fetchPage<MakerReview>(
+          `${API_BASE_URL}/api/reviews?maker_id=${user.id}`,
+          "Unable to load reviews",
         );
-        if (!response.ok) {
-          throw new Error("Unable to load reviews");
-        }
-        const data = (await response.json()) as MakerReview[];
-        setReviews(data);
+        setReviews(items);
+        setReviewsCursor(cursor);
         setStatus({ error: null, message: null });
       } catch (error) {
         setStatus({
@@ -116,6 +119,28 @@ export default function MakerCommentsPage() {
     fetchReviews();
   }, [user]);
 
+  const loadMoreReviews = async () => {
+    if (!user) return;
+    setLoadingMore(true);
+    try {
+      const { items, cursor } = await fetchPage<MakerReview>(
+        `${API_BASE_URL}/api/reviews?maker_id=${user.id}`,
+        "Unable to load reviews",
+        undefined,
+        reviewsCursor,
+      );
+      setReviews((prev) => appendNew(prev, items, (review) => review.id));
+      setReviewsCursor(cursor);
+    } catch (error) {
+      setStatus({
+        error: error instanceof Error ? error.message : "Unable to load reviews",
+        message: null,
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const headline = useMemo(() => {
     if (!user) return "Hi, Maker!";
     const name = user.email.split("@")[0];
@@ -136,7 +161,7 @@ export default function MakerCommentsPage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/reviews/${reviewId}`, {
         method: "PATCH",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({ reply: replyDraft }),
       });
       const body = await response.json();
@@ -217,7 +242,7 @@ export default function MakerCommentsPage() {
                   <div className="flex items-start gap-3">
                     <div className="relative h-16 w-16 overflow-hidden rounded-2xl">
                       <Image
-                        src={review.image_data}
+                        src={imageSrc(review.thumbnail_url)}
                         alt={review.meal_name}
                         fill
                         sizes="64px"
@@ -290,6 +315,9 @@ export default function MakerCommentsPage() {
               ))}
             </div>
           )}
+          {loading ? null : (
+            <LoadMoreButton cursor={reviewsCursor} loading={loadingMore} onLoadMore={loadMoreReviews} />
+          )}
         </section>
 
         <nav className="mt-auto w-full pt-12">
@@ -12,8 +12,18 @@ import {
   UserRound,
 } from "lucide-react";
 
+import { LoadMoreButton } from "@/components/load-more-button";
 import { Button } from "@/components/ui/button";
-import { API_BASE_URL } from "@/lib/api";
+import {
+  API_BASE_URL,
+  FIRST_PAGE,
+  appendNew,
+  authHeaders,
+  fetchPage,
+  imageSrc,
+  subscribeToOrderEvents,
+  upsertById,
+} from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -23,11 +33,12 @@ type StoredUser = {
 
 type MakerOrder = {
   id: number;
-  maker_id: number;
   order_code: string;
   eater_name: string;
   meal_name: string;
-  image_data: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
   price: number;
   order_time: string;
   status: string;
@@ -65,6 +76,8 @@ export default function MakerOrdersPage() {
   const [user, setUser] = useState<StoredUser | null>(null);
   const [orders, setOrders] = useState<MakerOrder[]>([]);
   const [loading, setLoading] = useState(true);
+  const [ordersCursor, setOrdersCursor] = useState(FIRST_PAGE);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [status, setStatus] = useState<{ error: string | null; message: string | null }>({
     error: null,
     message: null,
@@ -93,12 +106,13 @@ export default function MakerOrdersPage() {
         setLoading(true);
       }
       try {
-        const response = await fetch(`${API_BASE_URL}/api/orders?maker_id=${user.id}`);
-        if (!response.ok) {
-          throw new Error("Unable to load orders");
-        }
-        const data = (await response.json()) as MakerOrder[];
-        setOrders(data);
+        const { items, cursor } = await fetchPage<MakerOrder>(
+          `${API_BASE_URL}/api/orders?view=summary`,
+          "Unable to load orders",
+          { headers: authHeaders() },
+        );
+        setOrders(items);
+        setOrdersCursor(cursor);
         if (!background) {
           setStatus({ error: null, message: null });
         }
@@ -118,15 +132,32 @@ export default function MakerOrdersPage() {
     void fetchOrders();
     if (!user) return;
 
-    const intervalId = window.setInterval(() => {
-      void fetchOrders({ background: true });
-    }, 8000);
-
-    return () => {
-      window.clearInterval(intervalId);
-    };
+    return subscribeToOrderEvents<MakerOrder>(({ order }) => {
+      setOrders((prev) => upsertById(prev, order));
+    });
   }, [user, fetchOrders]);
 
+  const loadMoreOrders = async () => {
+    setLoadingMore(true);
+    try {
+      const { items, cursor } = await fetchPage<MakerOrder>(
+        `${API_BASE_URL}/api/orders?view=summary`,
+        "Unable to load orders",
+        { headers: authHeaders() },
+        ordersCursor,
+      );
+      setOrders((prev) => appendNew(prev, items, (order) => order.id));
+      setOrdersCursor(cursor);
+    } catch (error) {
+      setStatus({
+        error: error instanceof Error ? error.message : "Unable to load orders",
+        message: null,
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const headline = useMemo(() => {
     if (!user) return "Hi, Maker!";
     const name = user.email.split("@")[0];
@@ -137,7 +168,7 @@ export default function MakerOrdersPage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/orders/${orderId}`, {
         method: "PATCH",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({ status: "completed" }),
       });
       const body = await response.json();
@@ -213,7 +244,7 @@ export default function MakerOrdersPage() {
                 >
                   <div className="relative h-24 w-full overflow-hidden rounded-t-3xl">
                     <Image
-                      src={order.image_data}
+                      src={imageSrc(order.thumbnail_url)}
                       alt={order.meal_name}
                       fill
                       sizes="160px"
@@ -248,6 +279,9 @@ export default function MakerOrdersPage() {
               ))}
             </div>
           )}
+          {loading ? null : (
+            <LoadMoreButton cursor={ordersCursor} loading={loadingMore} onLoadMore={loadMoreOrders} />
+          )}
         </section>
 
         <nav className="mt-auto w-full pt-12">
@@ -14,9 +14,18 @@ import {
   UserRound,
 } from "lucide-react";
 
+import { LoadMoreButton } from "@/components/load-more-button";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
-import { API_BASE_URL } from "@/lib/api";
+import {
+  API_BASE_URL,
+  FIRST_PAGE,
+  appendNew,
+  authHeaders,
+  fetchPage,
+  fetchTodaySales,
+  imageSrc,
+} from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -30,18 +39,9 @@ type Meal = {
   title: string;
   description: string;
   price: number;
-  image_data: string;
-};
-
-type MakerOrder = {
-  id: number;
-  maker_id: number;
-  eater_id: number | null;
-  order_code: string;
-  meal_name: string;
-  price: number;
-  order_time: string;
-  status: string;
+  image_id: string;
+  image_url: string;
+  thumbnail_url: string;
 };
 
 type FormState = {
@@ -76,29 +76,13 @@ function loadStoredUser(): StoredUser | null {
   }
 }
 
-function parseOrderTimestamp(timestamp: string | null | undefined): Date | null {
-  if (!timestamp) return null;
-  const trimmed = timestamp.trim();
-  if (!trimmed) return null;
-
-  const direct = new Date(trimmed);
-  if (!Number.isNaN(direct.getTime())) {
-    return direct;
-  }
-
-  const canonical = trimmed.includes("T") ? trimmed : trimmed.replace(" ", "T");
-  const hasTimezone =
-    /[+-]\d{2}:?\d{2}$/.test(canonical) || canonical.endsWith("Z");
-  const isoCandidate = hasTimezone ? canonical : `${canonical}Z`;
-  const parsed = new Date(isoCandidate);
-  return Number.isNaN(parsed.getTime()) ? null : parsed;
-}
-
 export default function MakerHomePage() {
   const router = useRouter();
   const [user, setUser] = useState<StoredUser | null>(null);
   const [meals, setMeals] = useState<Meal[]>([]);
   const [loadingMeals, setLoadingMeals] = useState(true);
+  const [mealsCursor, setMealsCursor] = useState(FIRST_PAGE);
+  const [loadingMoreMeals, setLoadingMoreMeals] = useState(false);
   const [status, setStatus] = useState<{ error: string | null }>({
     error: null,
   });
@@ -132,14 +116,12 @@ export default function MakerHomePage() {
     const fetchMeals = async () => {
       setLoadingMeals(true);
       try {
-        const response = await fetch(
-          `${API_BASE_URL}/api/meals?maker_id=${user.id}`
+        const { items, cursor } = await fetchPage<Meal>(
+          `${API_BASE_URL}/api/meals?maker_id=${user.id}`,
+          "Failed to load meals",
         );
-        if (!response.ok) {
-          throw new Error("Failed to load meals");
-        }
-        const data = (await response.json()) as Meal[];
-        setMeals(data);
+        setMeals(items);
+        setMealsCursor(cursor);
         setStatus({ error: null });
       } catch (error) {
         setStatus({
@@ -168,51 +150,11 @@ export default function MakerHomePage() {
       setLoadingSummary(true);
       setSummaryError(null);
       try {
-        const response = await fetch(
-          `${API_BASE_URL}/api/orders?maker_id=${user.id}`
-        );
-        if (!response.ok) {
-          throw new Error("Failed to load orders summary");
-        }
-        const data = (await response.json()) as MakerOrder[];
+        const sales = await fetchTodaySales("Failed to load orders summary");
         if (cancelled) {
           return;
         }
-
-        const startOfToday = new Date();
-        startOfToday.setHours(0, 0, 0, 0);
-        const endOfToday = new Date(startOfToday);
-        endOfToday.setDate(endOfToday.getDate() + 1);
-
-        let revenue = 0;
-        let completedCount = 0;
-        let activeCount = 0;
-
-        for (const order of data) {
-          if (order.status !== "completed") {
-            activeCount += 1;
-          }
-
-          if (order.status === "completed") {
-            const orderDate = parseOrderTimestamp(order.order_time);
-            if (!orderDate) continue;
-            if (orderDate >= startOfToday && orderDate < endOfToday) {
-              const priceValue =
-                typeof order.price === "number"
-                  ? order.price
-                  : Number(order.price);
-              if (!Number.isFinite(priceValue)) continue;
-              revenue += priceValue;
-              completedCount += 1;
-            }
-          }
-        }
-
-        setSummary({
-          revenueToday: revenue,
-          completedToday: completedCount,
-          activeOrders: activeCount,
-        });
+        setSummary(sales);
         setSummaryError(null);
       } catch (error) {
         if (cancelled) {
@@ -238,6 +180,27 @@ export default function MakerHomePage() {
     };
   }, [user]);
 
+  const loadMoreMeals = async () => {
+    if (!user) return;
+    setLoadingMoreMeals(true);
+    try {
+      const { items, cursor } = await fetchPage<Meal>(
+        `${API_BASE_URL}/api/meals?maker_id=${user.id}`,
+        "Failed to load meals",
+        undefined,
+        mealsCursor,
+      );
+      setMeals((prev) => appendNew(prev, items, (meal) => meal.id));
+      setMealsCursor(cursor);
+    } catch (error) {
+      setStatus({
+        error: error instanceof Error ? error.message : "Unable to load meals",
+      });
+    } finally {
+      setLoadingMoreMeals(false);
+    }
+  };
+
   const headline = useMemo(() => {
     if (!user) return "Hi, Maker!";
     const name = user.email.split("@")[0];
@@ -276,9 +239,8 @@ export default function MakerHomePage() {
     try {
       const response = await fetch(`${API_BASE_URL}/api/meals`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...authHeaders() },
         body: JSON.stringify({
-          maker_id: user.id,
           title: form.title.trim(),
           description: form.description.trim(),
           price: Number(form.price),
@@ -398,7 +360,7 @@ export default function MakerHomePage() {
                 >
                   <div className="relative h-24 w-full overflow-hidden rounded-t-3xl">
                     <Image
-                      src={meal.image_data}
+                      src={imageSrc(meal.thumbnail_url)}
                       alt={meal.title}
                       fill
                       sizes="160px"
@@ -431,6 +393,9 @@ export default function MakerHomePage() {
               </button>
             </div>
           )}
+          {loadingMeals ? null : (
+            <LoadMoreButton cursor={mealsCursor} loading={loadingMoreMeals} onLoadMore={loadMoreMeals} />
+          )}
         </section>
 
         <nav className="mt-10 w-full">
@@ -14,7 +14,7 @@ import {
 
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
-import { API_BASE_URL } from "@/lib/api";
+import { API_BASE_URL, authHeaders, fetchTodaySales } from "@/lib/api";
 
 type StoredUser = {
   id: number;
@@ -31,14 +31,6 @@ type MakerProfile = {
   location: string;
 };
 
-type MakerOrder = {
-  id: number;
-  maker_id: number;
-  status: string;
-  price: number;
-  order_time: string;
-};
-
 const defaultProfile: MakerProfile = {
   name: "Chef's Corner",
   email: "maker@mail.com",
@@ -65,24 +57,6 @@ function loadStoredUser(): StoredUser | null {
   }
 }
 
-function parseOrderTimestamp(timestamp: string | null | undefined): Date | null {
-  if (!timestamp) return null;
-  const trimmed = timestamp.trim();
-  if (!trimmed) return null;
-
-  const direct = new Date(trimmed);
-  if (!Number.isNaN(direct.getTime())) {
-    return direct;
-  }
-
-  const canonical = trimmed.includes("T") ? trimmed : trimmed.replace(" ", "T");
-  const hasTimezone =
-    /[+-]\d{2}:?\d{2}$/.test(canonical) || canonical.endsWith("Z");
-  const isoCandidate = hasTimezone ? canonical : `${canonical}Z`;
-  const parsed = new Date(isoCandidate);
-  return Number.isNaN(parsed.getTime()) ? null : parsed;
-}
-
 export default function MakerProfilePage() {
   const router = useRouter();
   const [user, setUser] = useState<StoredUser | null>(null);
@@ -158,42 +132,11 @@ export default function MakerProfilePage() {
       setLoadingSummary(true);
       setSummaryError(null);
       try {
-        const response = await fetch(`${API_BASE_URL}/api/orders?maker_id=${user.id}`);
-        if (!response.ok) {
-          throw new Error("Unable to load today's income");
-        }
-        const data = (await response.json()) as MakerOrder[];
+        const { revenueToday, completedToday } = await fetchTodaySales("Unable to load today's income");
         if (cancelled) {
           return;
         }
-
-        const startOfToday = new Date();
-        startOfToday.setHours(0, 0, 0, 0);
-        const endOfToday = new Date(startOfToday);
-        endOfToday.setDate(endOfToday.getDate() + 1);
-
-        let revenue = 0;
-        let completedCount = 0;
-        for (const order of data) {
-          if (order.status !== "completed") {
-            continue;
-          }
-          const orderDate = parseOrderTimestamp(order.order_time);
-          if (!orderDate) {
-            continue;
-          }
-          if (orderDate >= startOfToday && orderDate < endOfToday) {
-            const priceValue =
-              typeof order.price === "number" ? order.price : Number(order.price);
-            if (!Number.isFinite(priceValue)) {
-              continue;
-            }
-            revenue += priceValue;
-            completedCount += 1;
-          }
-        }
-
-        setSummary({ revenueToday: revenue, completedToday: completedCount });
+        setSummary({ revenueToday, completedToday });
       } catch (error) {
         if (!cancelled) {
           setSummary({ revenueToday: 0, completedToday: 0 });
@@ -228,9 +171,8 @@ export default function MakerProfilePage() {
       try {
         const response = await fetch(`${API_BASE_URL}/api/maker/profile`, {
           method: "PUT",
-          headers: { "Content-Type": "application/json" },
+          headers: { "Content-Type": "application/json", ...authHeaders() },
           body: JSON.stringify({
-            maker_id: user.id,
             ...draft,
           }),
         });
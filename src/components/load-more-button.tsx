@@ -0,0 +1,24 @@
+import { Button } from "@/components/ui/button";
+import { hasMorePages, type PageCursor } from "@/lib/api";
+
+type LoadMoreButtonProps = {
+  cursor: PageCursor;
+  loading: boolean;
+  onLoadMore: () => void;
+};
+
+/** Loads a list's next page; hidden once the list is complete or has reached MAX_PAGES. */
+export function LoadMoreButton({ cursor, loading, onLoadMore }: LoadMoreButtonProps) {
+  if (!hasMorePages(cursor)) return null;
+  return (
+    <Button
+      type="button"
+      variant="ghost"
+      onClick={onLoadMore}
+      disabled={loading}
+      className="mx-auto mt-4 flex rounded-full text-sm font-semibold text-[#f37460] hover:text-[#f05c45]"
+    >
+      {loading ? "Loading…" : "Load more"}
+    </Button>
+  );
+}
@@ -1,2 +1,166 @@
 export const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
+
+export function imageSrc(path: string): string {
+  return path.startsWith("/") ? `${API_BASE_URL}${path}` : path;
+}
+
+export type Page<T> = {
+  items: T[];
+  next_cursor: string | null;
+};
+
+// Items per request; lists load one page up front and more only when asked.
+const PAGE_LIMIT = 50;
+// Pages a list will load in total, so a long history never turns into an unbounded download.
+export const MAX_PAGES = 20;
+
+/** Where a list stopped: the cursor of its next page and how many pages it has loaded. */
+export type PageCursor = {
+  next: string | null;
+  pages: number;
+};
+
+export const FIRST_PAGE: PageCursor = { next: null, pages: 0 };
+
+/** One page of a paginated list: the first page, or the page after `after`. */
+export async function fetchPage<T>(
+  url: string,
+  errorMessage: string,
+  init?: RequestInit,
+  after: PageCursor = FIRST_PAGE,
+): Promise<{ items: T[]; cursor: PageCursor }> {
+  const pageUrl = new URL(url);
+  pageUrl.searchParams.set("limit", String(PAGE_LIMIT));
+  if (after.next) pageUrl.searchParams.set("cursor", after.next);
+  const response = await fetch(pageUrl, init);
+  if (!response.ok) {
+    throw new Error(errorMessage);
+  }
+  const page = (await response.json()) as Page<T>;
+  return { items: page.items, cursor: { next: page.next_cursor, pages: after.pages + 1 } };
+}
+
+export function hasMorePages(cursor: PageCursor): boolean {
+  return cursor.next !== null && cursor.pages < MAX_PAGES;
+}
+
+/** items followed by the entries of more not already present (by key), e.g. ones pushed by events. */
+export function appendNew<T>(items: T[], more: T[], key: (item: T) => number): T[] {
+  const seen = new Set(items.map(key));
+  return [...items, ...more.filter((item) => !seen.has(key(item)))];
+}
+
+export type TodaySales = {
+  revenueToday: number;
+  completedToday: number;
+  activeOrders: number;
+};
+
+type SalesFigures = { orders: number; revenue: number };
+type MakerAnalytics = {
+  totals: SalesFigures & { by_status: Record<string, SalesFigures> };
+  series: { by_status: Record<string, SalesFigures> }[];
+};
+
+/**
+ * The signed-in maker's completed sales since local midnight, and orders not yet completed,
+ * from the sales rollups rather than the order list.
+ */
+export async function fetchTodaySales(errorMessage: string): Promise<TodaySales> {
+  // Buckets are UTC hours, from the one holding local midnight through the current one; in
+  // zones with a non-whole-hour offset that includes part of the hour before midnight.
+  const startOfToday = new Date();
+  startOfToday.setHours(0, 0, 0, 0);
+  const hour = (time: number) => Math.floor(time / 3_600_000);
+  const buckets = hour(Date.now()) - hour(startOfToday.getTime()) + 1;
+  const url = new URL(`${API_BASE_URL}/api/maker/analytics`);
+  url.searchParams.set("period", "hour");
+  url.searchParams.set("buckets", String(buckets));
+  const response = await fetch(url, { headers: authHeaders() });
+  if (!response.ok) {
+    throw new Error(errorMessage);
+  }
+  const { totals, series } = (await response.json()) as MakerAnalytics;
+  const completed = series.map((bucket) => bucket.by_status.completed ?? { orders: 0, revenue: 0 });
+  return {
+    revenueToday: completed.reduce((sum, figures) => sum + figures.revenue, 0),
+    completedToday: completed.reduce((sum, figures) => sum + figures.orders, 0),
+    activeOrders: totals.orders - (totals.by_status.completed?.orders ?? 0),
+  };
+}
+
+export function authHeaders(): Record<string, string> {
+  if (typeof window === "undefined") return {};
+  const raw = window.localStorage.getItem("aussieeat.user");
+  if (!raw) return {};
+  try {
+    const { access_token: token } = JSON.parse(raw) as { access_token?: string | null };
+    return token ? { Authorization: `Bearer ${token}` } : {};
+  } catch {
+    return {};
+  }
+}
+
+export type OrderEvent<T> = {
+  type: "order.created" | "order.status_changed";
+  order: T;
+};
+
+const ORDER_EVENT_TYPES = ["order.created", "order.status_changed"] as const;
+
+// Delay before reopening a dropped stream, matching the server's `retry:` hint.
+const EVENT_RETRY_MS = 3000;
+
+export function subscribeToOrderEvents<T>(onEvent: (event: OrderEvent<T>) => void): () => void {
+  if (!authHeaders().Authorization) return () => {};
+  let source: EventSource | null = null;
+  let retry: ReturnType<typeof setTimeout> | undefined;
+  let closed = false;
+  const listener = (message: MessageEvent<string>) => {
+    onEvent(JSON.parse(message.data) as OrderEvent<T>);
+  };
+  const reopen = () => {
+    if (!closed) retry = setTimeout(() => void open(), EVENT_RETRY_MS);
+  };
+  const open = async () => {
+    // EventSource cannot send headers, so the stream is opened with a short-lived ticket
+    // rather than the access token, which would otherwise end up in URLs and logs.
+    let ticket: string;
+    try {
+      const response = await fetch(`${API_BASE_URL}/api/orders/events/ticket`, {
+        method: "POST",
+        headers: authHeaders(),
+      });
+      if (response.status === 401) return;
+      if (!response.ok) throw new Error("Unable to open order events");
+      ({ ticket } = (await response.json()) as { ticket: string });
+    } catch {
+      reopen();
+      return;
+    }
+    if (closed) return;
+    source = new EventSource(`${API_BASE_URL}/api/orders/events?ticket=${encodeURIComponent(ticket)}`);
+    ORDER_EVENT_TYPES.forEach((type) => source?.addEventListener(type, listener));
+    // The browser would reconnect with the same ticket after it expires; fetch a new one instead.
+    source.onerror = () => {
+      source?.close();
+      source = null;
+      reopen();
+    };
+  };
+  void open();
+  return () => {
+    closed = true;
+    clearTimeout(retry);
+    source?.close();
+  };
+}
+
+export function upsertById<T extends { id: number }>(items: T[], item: T): T[] {
+  const index = items.findIndex((existing) => existing.id === item.id);
+  if (index === -1) return [item, ...items];
+  const next = items.slice();
+  next[index] = { ...items[index], ...item };
+  return next;
+}